@@ -1,9 +1,125 @@
-from sqlalchemy.orm import sessionmaker, declarative_base, relationship
+from sqlalchemy.orm import sessionmaker, declarative_base, relationship, scoped_session, joinedload, contains_eager
+import os
 import random
-from sqlalchemy import create_engine, inspect, Column, Integer, String, ForeignKey, text,  Table, select
-from collections import defaultdict
-import openpyxl
-from openpyxl.utils import get_column_letter
+import re
+import time
+from sqlalchemy import create_engine, inspect, Column, Integer, String, ForeignKey, text,  Table, select, insert, delete, \
+    update, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import StaticPool
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import csv
+import functools
+import hashlib
+import heapq
+import json
+import shutil
+import sys
+from datetime import date, datetime, timedelta, timezone
+
+# openpyxl yalnızca Excel'e yazılırken (ilgili fonksiyonların içinde) yüklenir
+SABLON_DOSYASI = "ProgramŞablon.xlsx"  # Ders programının yazıldığı Excel şablonu
+DISA_AKTARIM_ALANLARI = ["donem", "bolum", "gun", "saat", "ders_kodu", "ders_adi", "ogretim_uyesi", "derslik"]
+CIKTI_BICIMLERI = ["sablon", "xlsx", "csv", "jsonl", "ics"]  # "sablon": ProgramŞablon.xlsx üzerine yazılır
+DONEM_HAFTA_SAYISI = 14  # iCalendar çıktısında derslerin tekrarlandığı hafta sayısı
+
+
+# ---ÖLÇÜM---
+
+class Olcum:
+    """
+    Aşama süreleri ve sayaçlar (yerleştirme denemeleri, denenen günler, yerleşmeyen dersler, taranan derslikler,
+    çalışma kitabı kayıtları...). Varsayılan olarak kapalıdır; kapalıyken ölçülen fonksiyonlar ve sayaç noktaları
+    yalnızca etkin bayrağına bakar. Süreler iç içe aşamaları da kapsar. İşçi süreçlerdeki (paralel denemeler,
+    bölüm başına yazıcılar) sayaçlar ana sürece taşınmaz.
+    """
+
+    def __init__(self):
+        self.etkin = False
+        self.sifirla()
+
+    def sifirla(self):
+        self.sureler = defaultdict(lambda: [0, 0.0])  # {aşama: [çağrı sayısı, toplam saniye]}
+        self.sayaclar = defaultdict(int)
+        self.baslangic = time.time()
+
+    def say(self, ad, artis=1):
+        if self.etkin:
+            self.sayaclar[ad] += artis
+
+    def sure_ekle(self, ad, saniye):
+        kayit = self.sureler[ad]
+        kayit[0] += 1
+        kayit[1] += saniye
+
+    def ozet(self):
+        """ JSON'a yazılabilen özet: aşama başına çağrı sayısı ve toplam süre, sayaçlar. """
+        return {
+            "baslangic": datetime.fromtimestamp(self.baslangic, timezone.utc).isoformat(timespec="seconds"),
+            "sure_ms": round((time.time() - self.baslangic) * 1000, 3),
+            "asamalar": {ad: {"cagri": cagri, "toplam_ms": round(saniye * 1000, 3)}
+                         for ad, (cagri, saniye) in sorted(self.sureler.items())},
+            "sayaclar": dict(sorted(self.sayaclar.items())),
+        }
+
+    def prometheus_metni(self):
+        """ node_exporter textfile toplayıcısının okuyabileceği metin biçimi. """
+        satirlar = ["# HELP ders_programi_asama_saniye_toplam Aşamada geçen toplam süre (saniye).",
+                    "# TYPE ders_programi_asama_saniye_toplam counter"]
+        satirlar += [f'ders_programi_asama_saniye_toplam{{asama="{ad}"}} {saniye:.6f}'
+                     for ad, (_, saniye) in sorted(self.sureler.items())]
+        satirlar += ["# HELP ders_programi_asama_cagri_toplam Aşamanın çağrılma sayısı.",
+                     "# TYPE ders_programi_asama_cagri_toplam counter"]
+        satirlar += [f'ders_programi_asama_cagri_toplam{{asama="{ad}"}} {cagri}'
+                     for ad, (cagri, _) in sorted(self.sureler.items())]
+        satirlar += ["# HELP ders_programi_sayac_toplam Çalışma boyunca sayılan olaylar.",
+                     "# TYPE ders_programi_sayac_toplam counter"]
+        satirlar += [f'ders_programi_sayac_toplam{{sayac="{ad}"}} {deger}'
+                     for ad, deger in sorted(self.sayaclar.items())]
+        satirlar += ["# HELP ders_programi_son_calisma_zamani_saniye Ölçümün yazıldığı an (Unix zamanı).",
+                     "# TYPE ders_programi_son_calisma_zamani_saniye gauge",
+                     f"ders_programi_son_calisma_zamani_saniye {time.time():.3f}"]
+        return "\n".join(satirlar) + "\n"
+
+    def yaz(self, onek):
+        """
+        Özeti onek.json, metrikleri onek.prom dosyasına yazar. Dosyalar önce geçici adla yazılıp yerine taşınır,
+        böylece textfile toplayıcısı yarım dosya okumaz.
+        """
+        for uzanti, icerik in [("json", json.dumps(self.ozet(), ensure_ascii=False, indent=2) + "\n"),
+                               ("prom", self.prometheus_metni())]:
+            dosya_adi = f"{onek}.{uzanti}"
+            with open(dosya_adi + ".tmp", "w", encoding="utf-8") as f:
+                f.write(icerik)
+            os.replace(dosya_adi + ".tmp", dosya_adi)
+        print(f"📊 Ölçüm sonuçları '{onek}.json' ve '{onek}.prom' dosyalarına yazıldı.")
+
+
+# DERS_PROGRAMI_OLCUM ortam değişkeni verilirse ölçüm açılır, sonuçlar <önek>.json ve <önek>.prom dosyalarına
+# (menüde her işlemden sonra) yazılır. Komut satırında --metrics ile de verilebilir.
+OLCUM_ONEKI = os.environ.get("DERS_PROGRAMI_OLCUM")
+
+olcum = Olcum()
+olcum.etkin = bool(OLCUM_ONEKI)
+
+
+def olculen(ad):
+    """ Fonksiyonun süresini olcum etkinse ad aşamasına ekleyen dekoratör. """
+    def sarmala(fonksiyon):
+        @functools.wraps(fonksiyon)
+        def sarmalayici(*args, **kwargs):
+            if not olcum.etkin:
+                return fonksiyon(*args, **kwargs)
+            baslangic = time.perf_counter()
+            try:
+                return fonksiyon(*args, **kwargs)
+            finally:
+                olcum.sure_ekle(ad, time.perf_counter() - baslangic)
+        return sarmalayici
+    return sarmala
 
 # **Veritabanı Bağlantı Bilgileri**
 DB_NAME = "DersProgramiDB"
@@ -11,20 +127,26 @@ SERVER_NAME = "DESKTOP-0P4T7M7"  # MSSQL sunucu adı
 DRIVER = "ODBC+Driver+17+for+SQL+Server"
 
 # **Bağlantı URL'leri**
-DB_URL = f"mssql+pyodbc://{SERVER_NAME}/{DB_NAME}?trusted_connection=yes&driver={DRIVER}"
-MASTER_DB_URL = f"mssql+pyodbc://{SERVER_NAME}/master?trusted_connection=yes&driver={DRIVER}"
+# DERS_PROGRAMI_DB_URL ortam değişkeni ile başka bir veritabanı (ör. "sqlite:///ders.db" ya da
+# bellek içi "sqlite://") kullanılabilir.
+DB_URL = os.environ.get(
+    "DERS_PROGRAMI_DB_URL",
+    f"mssql+pyodbc://{SERVER_NAME}/{DB_NAME}?trusted_connection=yes&driver={DRIVER}"
+)
 
-# **SQLAlchemy Motoru ve Base Tanımlama**
-engine = create_engine(DB_URL)
+# **SQLAlchemy Base Tanımlama**
+# Motor (engine) modül yüklenirken değil, veritabanına ilk ihtiyaç duyulduğunda oluşturulur.
 Base = declarative_base()
+_engine = None
 
 
-# **Veritabanı Var mı Kontrol Et**
+# **Veritabanı Var mı Kontrol Et** (yalnızca MSSQL)
 def database_exists():
+    url = make_url(DB_URL)
     try:
-        engine_temp = create_engine(MASTER_DB_URL)
+        engine_temp = create_engine(url.set(database="master"))
         with engine_temp.connect() as conn:
-            result = conn.execute(text(f"SELECT name FROM sys.databases WHERE name = '{DB_NAME}'"))
+            result = conn.execute(text("SELECT name FROM sys.databases WHERE name = :ad"), {"ad": url.database})
             return result.fetchone() is not None
     except Exception as e:
         print(f"⚠️ Veritabanı kontrol edilirken hata oluştu: {e}")
@@ -33,19 +155,16 @@ def database_exists():
 
 # **Veritabanı Oluşturma (AUTOCOMMIT ile)**
 def create_database():
+    url = make_url(DB_URL)
     try:
-        engine_temp = create_engine(MASTER_DB_URL, isolation_level="AUTOCOMMIT")  # AUTOCOMMIT etkin
+        engine_temp = create_engine(url.set(database="master"), isolation_level="AUTOCOMMIT")  # AUTOCOMMIT etkin
         with engine_temp.connect() as conn:
-            conn.execute(text(f"CREATE DATABASE {DB_NAME}"))
-        print(f"✅ Veritabanı '{DB_NAME}' başarıyla oluşturuldu.")
+            conn.execute(text(f"CREATE DATABASE {url.database}"))
+        print(f"✅ Veritabanı '{url.database}' başarıyla oluşturuldu.")
     except Exception as e:
         print(f"❌ Veritabanı oluşturulurken hata oluştu: {e}")
 
 
-# **Eğer Veritabanı Yoksa Oluştur**
-if not database_exists():
-    create_database()
-
 # **MODELLER**
 # Öğretim Üyesi - Bölüm ilişki tablosu
 ogretim_uyesi_bolum = Table(
@@ -110,15 +229,54 @@ class Derslik(Base):
     statu = Column(String(20), nullable=False)  # NORMAL / LAB
 
 
-# **Veritabanındaki Tabloları Oluştur**
-Base.metadata.create_all(engine)
+# ⛔ **Müsait Olmayan Saat Tablosu** (öğretim üyelerinin ders verilemeyecek saatleri)
+class MusaitOlmayanSaat(Base):
+    __tablename__ = "musait_olmayan_saat"
+    id = Column(Integer, primary_key=True)
+    ogretim_uyesi_id = Column(Integer, ForeignKey("kullanicilar.id"), nullable=False)
+    gun = Column(String(20), nullable=False)
+    baslangic = Column(Integer, nullable=False)  # Başlangıç saati (dahil), ör. 9
+    bitis = Column(Integer, nullable=False)  # Bitiş saati (hariç), ör. 12 -> 9:00 - 12:00
+
+
+# 🗓 **Program Saati Tablosu** (oluşturulan programların dolu saatleri)
+class ProgramSaati(Base):
+    __tablename__ = "program_saati"
+    id = Column(Integer, primary_key=True)
+    donem_tipi = Column(String(1), nullable=False)  # "G" / "B"
+    donem = Column(Integer, nullable=False, index=True)
+    bolum_kod = Column(String(10), nullable=False)
+    gun = Column(String(20), nullable=False)
+    saat = Column(Integer, nullable=False)
+    ders_kod = Column(String(20), nullable=False)
+    ders_ad = Column(String(100), nullable=False)
+    derslik_kod = Column(String(20))  # Derslik atanamadıysa boş
+
+
+# **Dönem Parmak İzi Tablosu** (kayıtlı programın üretildiği girdilerin özeti)
+class DonemParmakIzi(Base):
+    __tablename__ = "donem_parmak_izi"
+    id = Column(Integer, primary_key=True)
+    donem_tipi = Column(String(1), nullable=False)
+    donem = Column(Integer, unique=True, nullable=False)
+    parmak_izi = Column(String(64), nullable=False)  # SHA-256 (hex)
+
+
+# **Dönem Dersliği Tablosu** (kayıtlı programın kullandığı dersliklerin kayıt anındaki bilgileri)
+class DonemDersligi(Base):
+    __tablename__ = "donem_dersligi"
+    id = Column(Integer, primary_key=True)
+    donem = Column(Integer, nullable=False, index=True)
+    kod = Column(String(20), nullable=False)
+    kapasite = Column(Integer, nullable=False)
+    statu = Column(String(20), nullable=False)
 
 
 # **Tablolar Var mı Kontrol Et**
-def tables_exist():
+def tables_exist(engine):
     try:
         inspector = inspect(engine)
-        required_tables = {"bolum", "ders", "derslik", "ogretim_uyesi"}
+        required_tables = set(Base.metadata.tables)
         existing_tables = set(inspector.get_table_names())
         return required_tables.issubset(existing_tables)
     except Exception as e:
@@ -126,223 +284,622 @@ def tables_exist():
         return False
 
 
-# **Eğer Tablolar Yoksa Oluştur**
-if not tables_exist():
-    try:
-        Base.metadata.create_all(engine)
-        print("✅ Tablolar başarıyla oluşturuldu.")
-    except Exception as e:
-        print(f"❌ Tablolar oluşturulurken hata oluştu: {e}")
+def motoru_al():
+    """ Veritabanı motorunu ilk çağrıda oluşturur (gerekirse veritabanı ve tablolarla birlikte) ve saklar. """
+    global _engine
+    if _engine is not None:
+        return _engine
 
-# **Session Oluştur (Veritabanı İşlemleri İçin)**
-try:
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    url = make_url(DB_URL)
+
+    # **Eğer Veritabanı Yoksa Oluştur**
+    if url.get_backend_name() == "mssql" and not database_exists():
+        create_database()
+
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # Bellek içi SQLite: tüm bağlantılar aynı veritabanını görsün
+        engine = create_engine(url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+    else:
+        engine = create_engine(url)
+
+    # **Eğer Tablolar Yoksa Oluştur**
+    if not tables_exist(engine):
+        try:
+            Base.metadata.create_all(engine)
+            print("✅ Tablolar başarıyla oluşturuldu.")
+        except Exception as e:
+            print(f"❌ Tablolar oluşturulurken hata oluştu: {e}")
+
+    _engine = engine
     print("✅ Veritabanı bağlantısı başarıyla kuruldu.")
-except Exception as e:
-    print(f"❌ Veritabanı bağlantısı kurulurken hata oluştu: {e}")
+    return _engine
 
 
-def load_kullanicilar_from_file(filename):
-    """kullanicilar.txt dosyasından kullanıcıları oku ve veritabanına ekle"""
+def veritabani_ayarla(url):
+    """ Kullanılacak veritabanını değiştirir; yeni motor ilk ihtiyaçta oluşturulur. """
+    global DB_URL, _engine
+    session.remove()
+    if _engine is not None:
+        _engine.dispose()
+    DB_URL = url
+    _engine = None
+
+
+# **Session Oluştur (Veritabanı İşlemleri İçin)**
+# session, ilk kullanımda motoru oluşturup ona bağlanan bir vekildir.
+Session = sessionmaker()
+session = scoped_session(lambda: Session(bind=motoru_al()))
+
+
+# ---SQL PROFİLİ---
+
+SQL_TEKRAR_SINIRI = 10  # Bir çağrı yerinden aynı biçimde bu kadar sorgu gelirse olası N+1 olarak işaretlenir
+YER_TUTUCU_LISTESI = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))*\s*\)")
+TEKRARLI_DEGER_GRUPLARI = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+
+
+class SorguProfili:
+    """
+    Motorların before/after_cursor_execute olaylarıyla her SQL gidiş-dönüşünü çağrı yerine (bu modüldeki
+    fonksiyon ve satır) göre sayar ve süresini toplar. Sorgular biçimlerine indirgenir (IN listeleri ve çok satırlı
+    VALUES tek yer tutucuya); aynı çağrı yerinden SQL_TEKRAR_SINIRI kez gelen aynı biçim olası N+1 olarak
+    işaretlenir. Açıkken olaylar tüm motorlara (sonradan oluşturulanlar dahil) bağlanır; kapalıyken maliyeti yoktur.
+    """
+
+    def __init__(self):
+        self.etkin = False
+        self.sifirla()
+
+    def sifirla(self):
+        self.cagri_yerleri = defaultdict(lambda: [0, 0.0])  # {çağrı yeri: [sorgu sayısı, toplam saniye]}
+        self.bicimler = defaultdict(int)  # {(çağrı yeri, sorgu biçimi): sorgu sayısı}
+
+    def ac(self):
+        if not self.etkin:
+            event.listen(Engine, "before_cursor_execute", self.sorgu_basladi)
+            event.listen(Engine, "after_cursor_execute", self.sorgu_bitti)
+            self.etkin = True
+
+    def kapat(self):
+        if self.etkin:
+            event.remove(Engine, "before_cursor_execute", self.sorgu_basladi)
+            event.remove(Engine, "after_cursor_execute", self.sorgu_bitti)
+            self.etkin = False
+
+    @staticmethod
+    def sorgu_bicimi(statement):
+        bicim = YER_TUTUCU_LISTESI.sub("(?)", " ".join(statement.split()))
+        return TEKRARLI_DEGER_GRUPLARI.sub("(?)", bicim)
+
+    @staticmethod
+    def cagri_yeri():
+        """ Sorguyu tetikleyen, bu modüldeki ilk çerçeve ("Sınıf.fonksiyon:satır"). """
+        cerceve = sys._getframe(2)
+        while cerceve is not None:
+            kod = cerceve.f_code
+            if kod.co_filename == __file__:
+                return f"{getattr(kod, 'co_qualname', kod.co_name)}:{cerceve.f_lineno}"
+            cerceve = cerceve.f_back
+        return "<modül dışı>"
+
+    def sorgu_basladi(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("sorgu_baslangiclari", []).append(time.perf_counter())
+
+    def sorgu_bitti(self, conn, cursor, statement, parameters, context, executemany):
+        # Profil sorgu sürerken açıldıysa başlangıç zamanı yoktur; o sorgu sayılmaz
+        baslangiclar = conn.info.get("sorgu_baslangiclari")
+        if not baslangiclar:
+            return
+        sure = time.perf_counter() - baslangiclar.pop()
+        yer = self.cagri_yeri()
+        kayit = self.cagri_yerleri[yer]
+        kayit[0] += 1
+        kayit[1] += sure
+        self.bicimler[(yer, self.sorgu_bicimi(statement))] += 1
+
+    def toplam(self):
+        return sum(sayi for sayi, _ in self.cagri_yerleri.values())
+
+    def rapor(self, baslik=""):
+        """ Çağrı yeri başına sorgu sayısı ve süresiyle olası N+1 kalıplarını yazdırır, sonra sayaçları sıfırlar. """
+        toplam_sure = sum(sure for _, sure in self.cagri_yerleri.values())
+        print(f"\n🗄️ SQL profili{f' ({baslik})' if baslik else ''}: {self.toplam()} sorgu, "
+              f"{toplam_sure * 1000:.1f} ms")
+        for yer, (sayi, sure) in sorted(self.cagri_yerleri.items(), key=lambda kayit: -kayit[1][0]):
+            print(f"   {yer:<55} {sayi:>6} sorgu {sure * 1000:>9.1f} ms")
+        for (yer, bicim), sayi in sorted(self.bicimler.items(), key=lambda kayit: -kayit[1]):
+            if sayi >= SQL_TEKRAR_SINIRI:
+                print(f"⚠️ Olası N+1: {yer} aynı sorguyu {sayi} kez gönderdi: {bicim[:100]}")
+        self.sifirla()
+
+
+# DERS_PROGRAMI_SQL_PROFILI ortam değişkeni verilirse (menüde her işlemden sonra) SQL profili raporlanır.
+# Komut satırında --sql-profile ile de açılabilir.
+sorgu_profili = SorguProfili()
+if os.environ.get("DERS_PROGRAMI_SQL_PROFILI"):
+    sorgu_profili.ac()
+
+
+# Toplu eklemede tek INSERT (executemany) ile gönderilecek en fazla satır sayısı
+TOPLU_EKLEME_BOYUTU = 1000
+
+# Akışlı içe aktarmada her parçada işlenip commit edilecek satır sayısı
+PARCA_BOYUTU = 1000
+
+
+def toplu_ekle(tablo, satirlar):
+    """ Satırları TOPLU_EKLEME_BOYUTU'luk parçalar halinde tek INSERT ile ekler. """
+    for i in range(0, len(satirlar), TOPLU_EKLEME_BOYUTU):
+        session.execute(insert(tablo), satirlar[i:i + TOPLU_EKLEME_BOYUTU])
+    olcum.say("eklenen_satir", len(satirlar))
+
+
+def mevcut_degerleri_bul(kolon, degerler=None):
+    """ Kolonun veritabanındaki değerlerini döndürür; değerler verilirse yalnızca onları IN sorgusuyla arar. """
+    if degerler is None:
+        return set(session.scalars(select(kolon)))
+
+    degerler = list(degerler)
+    mevcut = set()
+    # MSSQL'in parametre sınırına takılmamak için IN listesi parçalanır
+    for i in range(0, len(degerler), TOPLU_EKLEME_BOYUTU):
+        mevcut.update(session.scalars(select(kolon).where(kolon.in_(degerler[i:i + TOPLU_EKLEME_BOYUTU]))))
+    return mevcut
+
+
+def mevcut_iliskileri_bul(anahtarlar=None):
+    """ Veritabanındaki (ogretim_uyesi_id, bolum_kod) ilişkilerini döndürür. """
+    sorgu = select(ogretim_uyesi_bolum.c.ogretim_uyesi_id, ogretim_uyesi_bolum.c.bolum_kod)
+    if anahtarlar is None:
+        return {tuple(satir) for satir in session.execute(sorgu)}
+
+    ogretim_uyesi_idleri = list({ogretim_uyesi_id for ogretim_uyesi_id, _ in anahtarlar})
+    mevcut = set()
+    for i in range(0, len(ogretim_uyesi_idleri), TOPLU_EKLEME_BOYUTU):
+        parca = ogretim_uyesi_idleri[i:i + TOPLU_EKLEME_BOYUTU]
+        mevcut.update(tuple(satir) for satir in session.execute(
+            sorgu.where(ogretim_uyesi_bolum.c.ogretim_uyesi_id.in_(parca))))
+    return mevcut
+
+
+def mevcut_musait_olmayanlari_bul(anahtarlar=None):
+    """
+    Veritabanındaki (ogretim_uyesi_id, gun, baslangic, bitis) kayıtlarını döndürür; anahtarlar verilirse yalnızca
+    onların öğretim üyeleri IN sorgusuyla aranır ve sonuç anahtarlarla sınırlanır.
+    """
+    sorgu = select(MusaitOlmayanSaat.ogretim_uyesi_id, MusaitOlmayanSaat.gun,
+                   MusaitOlmayanSaat.baslangic, MusaitOlmayanSaat.bitis)
+    if anahtarlar is None:
+        return {tuple(satir) for satir in session.execute(sorgu)}
+
+    anahtarlar = set(anahtarlar)
+    ogretim_uyesi_idleri = list({anahtar[0] for anahtar in anahtarlar})
+    mevcut = set()
+    for i in range(0, len(ogretim_uyesi_idleri), TOPLU_EKLEME_BOYUTU):
+        parca = ogretim_uyesi_idleri[i:i + TOPLU_EKLEME_BOYUTU]
+        mevcut.update(anahtar for anahtar in map(tuple, session.execute(
+            sorgu.where(MusaitOlmayanSaat.ogretim_uyesi_id.in_(parca)))) if anahtar in anahtarlar)
+    return mevcut
+
+
+# ---SATIR AYRIŞTIRICILAR---
+# Her ayrıştırıcı bir satırı (anahtar, tablo satırı) çiftine çevirir; hatalı satırda ValueError fırlatır.
+
+def kullanici_ayristir(satir):
+    kullanici_id, mevki, ad = satir.split(maxsplit=2)  # İlk iki değeri al, ad kısmı boşluk içerebilir
+    kullanici_id = int(kullanici_id)
+    return kullanici_id, {"id": kullanici_id, "mevki": mevki, "ad": ad}
+
+
+def ogretim_uyesi_bolum_ayristir(satir):
+    ogretim_uyesi_id, bolum_kod = satir.split()
+    ogretim_uyesi_id = int(ogretim_uyesi_id)
+    return (ogretim_uyesi_id, bolum_kod), {"ogretim_uyesi_id": ogretim_uyesi_id, "bolum_kod": bolum_kod}
+
+
+def derslik_ayristir(satir):
+    kod, kapasite, statu = satir.split()
+    return kod, {"kod": kod, "kapasite": int(kapasite), "statu": statu}
+
+
+def musait_olmayan_ayristir(satir):
+    ogretim_uyesi_id, gun, baslangic, bitis = satir.split()
+    ogretim_uyesi_id, baslangic, bitis = int(ogretim_uyesi_id), int(baslangic), int(bitis)
+    if gun not in GUNLER or not SAATLER[0] <= baslangic < bitis <= SAATLER[-1] + 1:
+        raise ValueError(satir)
+    anahtar = (ogretim_uyesi_id, gun, baslangic, bitis)
+    return anahtar, {"ogretim_uyesi_id": ogretim_uyesi_id, "gun": gun, "baslangic": baslangic, "bitis": bitis}
+
+
+def ders_ayristirici(bolum_kodlari):
+    """ Yalnızca tanımlı bölümlere ait dersleri kabul eden ders ayrıştırıcısını döndürür. """
+    def ders_ayristir(satir):
+        bolum_kod, donem, kod, ad, ders_tipi, teorik_saat, uyg_saat = satir.split()
+
+        if bolum_kod not in bolum_kodlari:
+            print(f"⚠ Bölüm bulunamadı: {bolum_kod}")
+            return None  # Eğer bölüm bulunmazsa, bu satırda işlem yapma
+
+        benzersiz_ders_kodu = f"{bolum_kod}_{kod}"  # BM_MAT110, YM_MAT110 gibi
+        return benzersiz_ders_kodu, {
+            "bolum_kod": bolum_kod,
+            "donem": int(donem),
+            "kod": benzersiz_ders_kodu,
+            "ad": ad,
+            "ders_tipi": ders_tipi,
+            "teorik_saat": int(teorik_saat),
+            "uyg_saat": int(uyg_saat)
+        }
+
+    return ders_ayristir
+
+
+def satiri_ayristir(ayristirici, line):
+    """ Satırı ayrıştırır; hatalı formatta uyarı verip None döndürür, böylece tek satır tüm içe aktarmayı bozmaz. """
     try:
-        with open(filename, "r", encoding="utf-8-sig") as file:
-            yeni_kullanici_eklendi = False
+        return ayristirici(line.strip())
+    except ValueError:
+        print(f"⚠️ Hatalı format: {line.strip()}")
+        return None
 
-            for line in file:
-                data = line.strip().split(maxsplit=2)  # İlk iki değeri al, ad kısmı boşluk içerebilir
 
-                if len(data) != 3:
-                    print(f"⚠️ Hatalı format: {line.strip()}")
-                    continue
+def dosya_satirlari(filename, baslangic=0):
+    """ Dosyayı baslangic baytından itibaren satır satır okur; (satır sonu bayt konumu, satır) üretir. """
+    with open(filename, "rb") as file:
+        file.seek(baslangic)
+        for ham_satir in file:
+            yield file.tell(), ham_satir.decode("utf-8").lstrip("\ufeff")
 
-                kullanici_id, mevki, ad = data
-                kullanici_id = int(kullanici_id)
 
-                # Eğer kullanıcı daha önce eklenmemişse, ekle
-                if not session.query(Kullanicilar).filter_by(id=kullanici_id).first():
-                    session.add(Kullanicilar(id=kullanici_id, ad=ad, mevki=mevki))
-                    yeni_kullanici_eklendi = True
+def dosya_imzasi(filename):
+    """ Dosyanın boyutu ve değiştirilme zamanı; kontrol noktasının aynı dosyaya ait olup olmadığını gösterir. """
+    bilgi = os.stat(filename)
+    return {"boyut": bilgi.st_size, "degistirilme": bilgi.st_mtime_ns}
 
-        if yeni_kullanici_eklendi:
+
+def kontrol_noktasi_oku(kontrol_dosyasi, filename):
+    """
+    Kontrol noktasındaki bayt konumunu döndürür. Kontrol noktası yoksa 0 döndürür. Okunamıyorsa ya da dosya
+    yazıldığından beri değiştiyse kontrol noktası silinir ve yine 0 döndürülür.
+    """
+    try:
+        with open(kontrol_dosyasi, "r", encoding="utf-8") as file:
+            kayit = json.loads(file.read())
+        if kayit["imza"] == dosya_imzasi(filename):
+            return int(kayit["konum"])
+        print(f"⚠️ {filename} kontrol noktasından sonra değişmiş; içe aktarma baştan yapılacak.")
+    except FileNotFoundError:
+        return 0
+    except (ValueError, TypeError, KeyError):
+        print(f"⚠️ {kontrol_dosyasi} okunamadı; içe aktarma baştan yapılacak.")
+    os.remove(kontrol_dosyasi)
+    return 0
+
+
+def kontrol_noktasi_yaz(kontrol_dosyasi, filename, konum):
+    with open(kontrol_dosyasi, "w", encoding="utf-8") as file:
+        json.dump({"konum": konum, "imza": dosya_imzasi(filename)}, file)
+
+
+def akisli_yukle(filename, ayristirici, tablo, mevcut_anahtarlar, parca_boyutu=PARCA_BOYUTU):
+    """
+    Dosyayı belleğe almadan parça parça içe aktarır. Her parça ayrı commit edilir ve commit edilen son
+    satırın bayt konumu, dosyanın boyutu ve değiştirilme zamanıyla birlikte '<dosya>.konum' dosyasına yazılır;
+    yarıda kalan içe aktarma, dosya o zamandan beri değişmediyse oradan devam eder.
+    """
+    kontrol_dosyasi = f"{filename}.konum"
+    baslangic = kontrol_noktasi_oku(kontrol_dosyasi, filename)
+    if baslangic:
+        print(f"↪️ {filename} için {baslangic}. bayttan devam ediliyor.")
+
+    eklenen = 0
+    parca = {}
+    son_konum = baslangic
+
+    def parcayi_yaz():
+        anahtarlar_mevcut = mevcut_anahtarlar(parca.keys())
+        yeni_satirlar = [satir for anahtar, satir in parca.items() if anahtar not in anahtarlar_mevcut]
+        try:
+            toplu_ekle(tablo, yeni_satirlar)
             session.commit()
+        except Exception:
+            print(f"⚠️ İçe aktarma {baslangic}. baytta kesildi; tekrar çalıştırıldığında buradan devam edilecek.")
+            raise
+        kontrol_noktasi_yaz(kontrol_dosyasi, filename, son_konum)
+        return len(yeni_satirlar)
+
+    for konum, line in dosya_satirlari(filename, baslangic):
+        sonuc = satiri_ayristir(ayristirici, line)
+        if sonuc:
+            parca.setdefault(*sonuc)
+        son_konum = konum
+
+        if len(parca) >= parca_boyutu:
+            eklenen += parcayi_yaz()
+            baslangic = son_konum
+            parca = {}
+
+    if parca:
+        eklenen += parcayi_yaz()
+
+    # Dosya sonuna kadar içe aktarıldı, kontrol noktasına artık gerek yok
+    if os.path.exists(kontrol_dosyasi):
+        os.remove(kontrol_dosyasi)
+
+    return eklenen
+
+
+def dosyadan_yukle(filename, ayristirici, tablo, mevcut_anahtarlar, akis=False, parca_boyutu=PARCA_BOYUTU):
+    """
+    Dosyadaki satırları tabloya ekler ve eklenen satır sayısını döndürür. Mevcut anahtarlar tek sorguda
+    çekilip fark bellekte bulunur; akis=True ise dosya akışlı ve parça parça işlenir.
+    """
+    if akis:
+        return akisli_yukle(filename, ayristirici, tablo, mevcut_anahtarlar, parca_boyutu)
+
+    dosyadaki_satirlar = {}  # {anahtar: satır} - dosyada tekrar eden anahtarlar bir kez eklenir
+
+    with open(filename, "r", encoding="utf-8-sig") as file:
+        for line in file:
+            sonuc = satiri_ayristir(ayristirici, line)
+            if sonuc:
+                dosyadaki_satirlar.setdefault(*sonuc)
+
+    anahtarlar_mevcut = mevcut_anahtarlar()
+    yeni_satirlar = [satir for anahtar, satir in dosyadaki_satirlar.items() if anahtar not in anahtarlar_mevcut]
+
+    if yeni_satirlar:
+        toplu_ekle(tablo, yeni_satirlar)
+        session.commit()
+
+    return len(yeni_satirlar)
+
+
+@olculen("yukle_kullanicilar")
+def load_kullanicilar_from_file(filename, akis=False, parca_boyutu=PARCA_BOYUTU):
+    """kullanicilar.txt dosyasından kullanıcıları oku ve veritabanına ekle"""
+    try:
+        eklenen = dosyadan_yukle(filename, kullanici_ayristir, Kullanicilar,
+                                 lambda idler=None: mevcut_degerleri_bul(Kullanicilar.id, idler),
+                                 akis, parca_boyutu)
+
+        if eklenen:
             print("✅ Kullanıcılar başarıyla eklendi!")
         else:
             print("✅ Kullanıcılar zaten mevcut.")
 
+        return eklenen
+
     except FileNotFoundError:
         print("❌ Hata: kullanicilar.txt dosyası bulunamadı!")
     except Exception as e:
+        session.rollback()
         print(f"❌ Beklenmeyen hata: {e}")
 
-def load_ogretim_uyesi_bolum_from_file(filename):
+@olculen("yukle_ogretim_uyesi_bolum")
+def load_ogretim_uyesi_bolum_from_file(filename, akis=False, parca_boyutu=PARCA_BOYUTU):
     """ogretim_uyesi_bolum.txt dosyasından ilişkiyi oku ve veritabanına ekle"""
     try:
-        with open(filename, "r", encoding="utf-8-sig") as file:
-            yeni_iliski_eklendi = False
-
-            for line in file:
-                data = line.strip().split()
-
-                if len(data) != 2:
-                    print(f"⚠️ Hatalı format: {line.strip()}")
-                    continue
+        eklenen = dosyadan_yukle(filename, ogretim_uyesi_bolum_ayristir, ogretim_uyesi_bolum,
+                                 mevcut_iliskileri_bul, akis, parca_boyutu)
 
-                ogretim_uyesi_id, bolum_kod = data
-                ogretim_uyesi_id = int(ogretim_uyesi_id)
-
-                # öğretim üyesi ile bölüm arasındaki ilişkinin zaten veritabanında olup olmadığını kontrol eder.
-                stmt = select(ogretim_uyesi_bolum).where(
-                    (ogretim_uyesi_bolum.c.ogretim_uyesi_id == ogretim_uyesi_id) &
-                    (ogretim_uyesi_bolum.c.bolum_kod == bolum_kod)
-                )
-                existing_relation = session.execute(stmt).first()
-
-                if not existing_relation:
-                    session.execute(ogretim_uyesi_bolum.insert().values(
-                        ogretim_uyesi_id=ogretim_uyesi_id, bolum_kod=bolum_kod
-                    ))
-                    yeni_iliski_eklendi = True
-
-        if yeni_iliski_eklendi:
-            session.commit()
+        if eklenen:
             print("✅ Öğretim Üyesi - Bölüm ilişkileri başarıyla eklendi!")
         else:
             print("✅ Tüm ilişkiler zaten mevcut.")
 
+        return eklenen
+
     except FileNotFoundError:
         print("❌ Hata: ogretim_uyesi_bolum.txt dosyası bulunamadı!")
     except Exception as e:
+        session.rollback()
         print(f"❌ Beklenmeyen hata: {e}")
 
 
-def load_derslikler_from_file(filename):
+@olculen("yukle_derslikler")
+def load_derslikler_from_file(filename, akis=False, parca_boyutu=PARCA_BOYUTU):
     """derslik.txt dosyasından derslikleri oku ve veritabanına ekle"""
     try:
-        with open(filename, "r", encoding="utf-8-sig") as file:
-            derslik_eklendi = False  # Yeni derslik eklenip eklenmediğini takip etmek için
-
-            for line in file:
-                data = line.strip().split()  # Satırı boşluklara göre ayır
-
-                # Verinin doğru formatta olup olmadığını kontrol et
-                if len(data) != 3:
-                    print(f"⚠️ Hatalı format: {line.strip()}")
-                    continue
+        eklenen = dosyadan_yukle(filename, derslik_ayristir, Derslik,
+                                 lambda kodlar=None: mevcut_degerleri_bul(Derslik.kod, kodlar),
+                                 akis, parca_boyutu)
 
-                kod, kapasite, statu = data
-                kapasite = int(kapasite)  # Kapasiteyi integer'a çevir
-
-                # Eğer bu derslik daha önce eklenmemişse, ekle
-                if not session.query(Derslik).filter_by(kod=kod).first():
-                    session.add(Derslik(kod=kod, kapasite=kapasite, statu=statu))
-                    derslik_eklendi = True  # Yeni derslik eklendiğini işaretle
-
-        if derslik_eklendi:
-            session.commit()
+        if eklenen:
             print("✅ Derslikler başarıyla eklendi!")
         else:
             print("✅ Derslikler zaten mevcut.")  # Hiçbir yeni derslik eklenmediyse mesaj ver
 
+        return eklenen
+
     except FileNotFoundError:
         print("❌ Hata: derslik.txt dosyası bulunamadı!")
     except Exception as e:
+        session.rollback()
         print(f"❌ Beklenmeyen hata: {e}")
 
 
-def load_dersler_from_file(filename):
+@olculen("yukle_dersler")
+def load_dersler_from_file(filename, akis=False, parca_boyutu=PARCA_BOYUTU):
     try:
-        # Bölüm tablosunun boş olup olmadığını kontrol et
-        bolum_count = session.query(Bolum).count()
-        if bolum_count == 0:
+        # Bölüm kodlarını tek sorguda çek (boşsa Bölüm tanımlanmamıştır)
+        bolum_kodlari = mevcut_degerleri_bul(Bolum.kod)
+        if not bolum_kodlari:
             print("❌ Lütfen önce Bölüm tanımlayınız.")
             return  # Bölüm tablosu boşsa fonksiyon sonlanır
 
-        with open(filename, "r", encoding="utf-8-sig") as file:
-            ders_eklendi = False  # Yeni ders eklenip eklenmediğini takip etmek için
-
-            for line in file:
-                data = line.strip().split()  # Satırı boşluklara göre ayır
-
-                # Verinin doğru formatta olup olmadığını kontrol et
-                if len(data) != 7:
-                    print(f"⚠️ Hatalı format: {line.strip()}")
-                    continue
-
-                bolum_kod, donem, kod, ad, ders_tipi, teorik_saat, uyg_saat = data
-                donem = int(donem)
-                teorik_saat = int(teorik_saat)
-                uyg_saat = int(uyg_saat)
-
-                # Bolum koduna göre ilgili bolum nesnesini al
-                bolum_instance = session.query(Bolum).filter_by(kod=bolum_kod).first()
-
-                if not bolum_instance:
-                    print(f"⚠ Bölüm bulunamadı: {bolum_kod}")
-                    continue  # Eğer bölüm bulunmazsa, bu satırda işlem yapma
-
-                benzersiz_ders_kodu = f"{bolum_kod}_{kod}"  # BM_MAT110, YM_MAT110 gibi
-
-                # Eğer bu ders daha önce eklenmemişse, ekle
-                if not session.query(Ders).filter_by(kod=benzersiz_ders_kodu).first():
-                    new_ders = Ders(
-                        bolum=bolum_instance,  # Burada bolum nesnesini ilişkilendiriyoruz
-                        donem=donem,
-                        kod=benzersiz_ders_kodu,
-                        ad=ad,
-                        ders_tipi=ders_tipi,
-                        teorik_saat=teorik_saat,
-                        uyg_saat=uyg_saat
-                    )
-                    session.add(new_ders)
-                    ders_eklendi = True  # Yeni ders eklendiğini işaretle
+        eklenen = dosyadan_yukle(filename, ders_ayristirici(bolum_kodlari), Ders,
+                                 lambda kodlar=None: mevcut_degerleri_bul(Ders.kod, kodlar),
+                                 akis, parca_boyutu)
 
-        if ders_eklendi:
-            session.commit()
+        if eklenen:
             print("✅ Dersler başarıyla eklendi!")
         else:
             print("✅ Dersler zaten mevcut.")
 
+        return eklenen
+
     except FileNotFoundError:
         print("❌ Hata: dersler.txt dosyası bulunamadı!")
     except Exception as e:
+        session.rollback()
         print(f"❌ Beklenmeyen hata: {e}")
 
 
-# **Öğretim üyelerine rastgele 3 farklı ders atama ve ortak derslere aynı öğretim üyesini atama fonksiyonu**
-def assign_random_courses():
+@olculen("yukle_musait_olmayan_saatler")
+def load_musait_olmayan_saatler_from_file(filename, akis=False, parca_boyutu=PARCA_BOYUTU):
+    """musait_olmayan.txt dosyasından (öğretim_üyesi_id gün başlangıç bitiş) müsait olmayan saatleri oku"""
     try:
-        ogretim_uyeleri = session.query(Kullanicilar).filter_by(mevki="ogretim_uyesi").all()
-        dersler = session.query(Ders).filter(Ders.ogretim_uyesi_id == None).all()
-        ortak_dersler = defaultdict(list)
-        
-        for ders in dersler:
-            ortak_dersler[ders.ad].append(ders)  # Aynı ada sahip dersleri grupla
-        
-        random.shuffle(ogretim_uyeleri)  # Rastgele sırayla öğretmenleri işle
-        ogretim_ders_sayisi = {hoca.id: 0 for hoca in ogretim_uyeleri}  # Her hocaya 3 farklı ders sınırı koy
-        
-        for ders_ad, ders_listesi in ortak_dersler.items():
-            uygun_hocalar = [hoca for hoca in ogretim_uyeleri if ogretim_ders_sayisi[hoca.id] <= 3]
-            
-            if not uygun_hocalar:
-                print(f"⚠ {ders_ad} için uygun öğretim üyesi bulunamadı!")
-                continue
+        eklenen = dosyadan_yukle(filename, musait_olmayan_ayristir, MusaitOlmayanSaat,
+                                 mevcut_musait_olmayanlari_bul, akis, parca_boyutu)
+
+        if eklenen:
+            print("✅ Müsait olmayan saatler başarıyla eklendi!")
+        else:
+            print("✅ Müsait olmayan saatler zaten mevcut.")
+
+        return eklenen
+
+    except FileNotFoundError:
+        print("❌ Hata: musait_olmayan.txt dosyası bulunamadı!")
+    except Exception as e:
+        session.rollback()
+        print(f"❌ Beklenmeyen hata: {e}")
+
 
-            secilen_hoca = random.choice(uygun_hocalar)  # Rastgele bir öğretim üyesi seç
+# **Öğretim üyelerine ders atama**
+OGRETIM_UYESI_MEVKILERI = ("öğretim_üyesi", "ogretim_uyesi")  # Menüden ve eski dosyalardan gelen yazımlar
+OGRETIM_UYESI_DERS_SINIRI = 3  # Bir öğretim üyesine verilebilecek en fazla farklı ders (ortak dersler bir sayılır)
 
-            for ders in ders_listesi:
-                ders.ogretim_uyesi_id = secilen_hoca.id  # Tüm ortak derslere aynı hocayı ata
-                print(f"✅ {secilen_hoca.ad} → {ders.ad} ({ders.bolum_kod}) dersine atandı.")
-                
-            ogretim_ders_sayisi[secilen_hoca.id] += 1  # Ortak dersleri tek ders olarak say
-            
-            if ogretim_ders_sayisi[secilen_hoca.id] >= 3 and secilen_hoca in ogretim_uyeleri:
-                ogretim_uyeleri.remove(secilen_hoca)  # 3 farklı ders dolunca listeden çıkar (Hata önlendi)
 
+def atama_artiran_yol(grup, adaylar, atama, hoca_gruplari, ders_sayisi):
+    """
+    Atanamamış gruptan, kapasitesi dolmamış bir öğretim üyesine giden artıran yolu genişlik öncelikli arar;
+    bulursa yol üzerindeki grupları bir sonraki öğretim üyesine kaydırıp grubu atar ve öğretim üyesini döndürür.
+    """
+    hocaya_gelen = {}  # {öğretim üyesi: ona ulaşılan grup}
+    gorulen_gruplar = {grup}
+    kuyruk = deque([grup])
+    while kuyruk:
+        simdiki = kuyruk.popleft()
+        for hoca in adaylar[simdiki]:
+            if hoca in hocaya_gelen:
+                continue
+            hocaya_gelen[hoca] = simdiki
+            if ders_sayisi[hoca] < OGRETIM_UYESI_DERS_SINIRI:
+                ders_sayisi[hoca] += 1
+                bos_hoca = hoca
+                while True:  # Yolu geri yürüyerek her grubu kendisine ulaşılan öğretim üyesine kaydır
+                    yoldaki = hocaya_gelen[hoca]
+                    eski_hoca = atama.get(yoldaki)
+                    atama[yoldaki] = hoca
+                    hoca_gruplari[hoca].add(yoldaki)
+                    if eski_hoca is None:
+                        return bos_hoca
+                    hoca_gruplari[eski_hoca].discard(yoldaki)
+                    hoca = eski_hoca
+            for diger in hoca_gruplari[hoca]:
+                if diger not in gorulen_gruplar:
+                    gorulen_gruplar.add(diger)
+                    kuyruk.append(diger)
+    return None
+
+
+@olculen("assign_random_courses")
+def assign_random_courses(eslestirme=False):
+    """
+    Öğretim üyesi olmayan dersleri, dersin bölümündeki (ogretim_uyesi_bolum) öğretim üyelerine yük dengeli atar.
+    Aynı dönemde aynı adla okutulan dersler tek grup olarak aynı öğretim üyesine verilir. Uzun gruplar önce
+    atanır; her grup, bölümlerinin en az saat (teorik + uygulama) yüklü öğretim üyesine gider (bölüm başına
+    min-heap, eşitlikte rastgele). eslestirme ise atanamayan gruplar için iki parçalı eşleştirmedeki gibi
+    artıran yollar aranır. Atamalar tek toplu UPDATE ile yazılır; atanan grup sayısını döndürür.
+    """
+    try:
+        ogretim_uyeleri = dict(session.execute(
+            select(Kullanicilar.id, Kullanicilar.ad).where(Kullanicilar.mevki.in_(OGRETIM_UYESI_MEVKILERI))).all())
+        bolum_hocalari = defaultdict(set)
+        hoca_bolumleri = defaultdict(set)
+        for hoca_id, bolum_kod in session.execute(
+                select(ogretim_uyesi_bolum.c.ogretim_uyesi_id, ogretim_uyesi_bolum.c.bolum_kod)):
+            if hoca_id in ogretim_uyeleri:
+                bolum_hocalari[bolum_kod].add(hoca_id)
+                hoca_bolumleri[hoca_id].add(bolum_kod)
+
+        # Mevcut yükler: atanmış derslerin saatleri ve (dönem, ad) gruplarının sayısı
+        saat_yuku = dict.fromkeys(ogretim_uyeleri, 0)
+        mevcut_gruplar = defaultdict(set)
+        atanacak_gruplar = defaultdict(list)  # {(dönem, normal ad): [(ders id, bölüm, saat)]}
+        for ders_id, hoca_id, bolum_kod, donem, ad, teorik, uyg in session.execute(
+                select(Ders.id, Ders.ogretim_uyesi_id, Ders.bolum_kod, Ders.donem, Ders.ad,
+                       Ders.teorik_saat, Ders.uyg_saat)):
+            anahtar = (donem, Program.ad_normallestir(ad))
+            if hoca_id is None:
+                atanacak_gruplar[anahtar].append((ders_id, bolum_kod, teorik + uyg))
+            elif hoca_id in saat_yuku and anahtar not in mevcut_gruplar[hoca_id]:
+                saat_yuku[hoca_id] += teorik + uyg
+                mevcut_gruplar[hoca_id].add(anahtar)
+        ders_sayisi = {hoca_id: len(mevcut_gruplar[hoca_id]) for hoca_id in ogretim_uyeleri}
+
+        # Bölüm başına (saat yükü, rastgele, id) min-heap; yükü değişen öğretim üyesinin eski kaydı atlanır
+        yiginlar = {}
+        for bolum_kod, hocalar in bolum_hocalari.items():
+            yiginlar[bolum_kod] = [(saat_yuku[h], random.random(), h) for h in hocalar
+                                   if ders_sayisi[h] < OGRETIM_UYESI_DERS_SINIRI]
+            heapq.heapify(yiginlar[bolum_kod])
+
+        def en_az_yuklu(bolumler):
+            secilen = None
+            for bolum_kod in bolumler:
+                yigin = yiginlar.get(bolum_kod)
+                while yigin and (yigin[0][0] != saat_yuku[yigin[0][2]]
+                                 or ders_sayisi[yigin[0][2]] >= OGRETIM_UYESI_DERS_SINIRI):
+                    heapq.heappop(yigin)
+                if yigin and (secilen is None or yigin[0] < secilen):
+                    secilen = yigin[0]
+            return secilen[2] if secilen else None
+
+        gruplar = sorted(atanacak_gruplar, key=lambda anahtar: -max(saat for _, _, saat in atanacak_gruplar[anahtar]))
+        atama = {}  # {grup: öğretim üyesi}
+        hoca_gruplari = defaultdict(set)  # Bu çalışmada atanan gruplar (eşleştirmede yerleri değişebilir)
+        for grup in gruplar:
+            dersler = atanacak_gruplar[grup]
+            bolumler = {bolum_kod for _, bolum_kod, _ in dersler}
+            hoca_id = en_az_yuklu(bolumler)
+            if hoca_id is None:
+                continue
+            atama[grup] = hoca_id
+            hoca_gruplari[hoca_id].add(grup)
+            ders_sayisi[hoca_id] += 1
+            saat_yuku[hoca_id] += max(saat for _, _, saat in dersler)
+            if ders_sayisi[hoca_id] < OGRETIM_UYESI_DERS_SINIRI:
+                for bolum_kod in hoca_bolumleri[hoca_id]:
+                    heapq.heappush(yiginlar[bolum_kod], (saat_yuku[hoca_id], random.random(), hoca_id))
+
+        if eslestirme:
+            adaylar = {grup: sorted({h for _, bolum_kod, _ in atanacak_gruplar[grup] for h in bolum_hocalari[bolum_kod]},
+                                    key=lambda h: saat_yuku[h])
+                       for grup in gruplar}
+            for grup in gruplar:
+                if grup not in atama:
+                    atama_artiran_yol(grup, adaylar, atama, hoca_gruplari, ders_sayisi)
+
+        for grup in gruplar:
+            if grup not in atama:
+                print(f"⚠ {atanacak_gruplar[grup][0][1]} {grup[0]}. dönem '{grup[1]}' için uygun öğretim üyesi bulunamadı!")
+
+        guncellemeler = [{"id": ders_id, "ogretim_uyesi_id": hoca_id}
+                         for grup, hoca_id in atama.items() for ders_id, _, _ in atanacak_gruplar[grup]]
+        for i in range(0, len(guncellemeler), TOPLU_EKLEME_BOYUTU):
+            session.execute(update(Ders), guncellemeler[i:i + TOPLU_EKLEME_BOYUTU])
         session.commit()
-        print("🎉 Ders atamaları başarıyla tamamlandı!")
+
+        for grup, hoca_id in atama.items():
+            bolumler = ", ".join(sorted({bolum_kod for _, bolum_kod, _ in atanacak_gruplar[grup]}))
+            print(f"✅ {ogretim_uyeleri[hoca_id]} → {grup[1]} ({bolumler}) dersine atandı.")
+        print(f"🎉 Ders atamaları başarıyla tamamlandı! ({len(atama)}/{len(gruplar)} ders grubu atandı)")
+        return len(atama)
     except Exception as e:
+        session.rollback()
         print(f"❌ Beklenmeyen hata: {e}")
 
 
@@ -356,9 +913,10 @@ class Sistem:
                   "  3. Ders İşlemleri\n",
                   "  4. Derslik İşlemleri\n",
                   "  5. Ders Programı Oluştur\n",
-                  "  6. Çıkış")
+                  "  6. Kayıtlı Programları Değerlendir\n",
+                  "  7. Çıkış")
 
-            secim = input("Seçiminizi yapın (1-6): ")
+            secim = input("Seçiminizi yapın (1-7): ")
 
             if secim == "1":
                 Sistem.bolum_islemleri()
@@ -371,10 +929,17 @@ class Sistem:
             elif secim == "5":
                 Sistem.ders_programi_olustur()
             elif secim == "6":
+                Sistem.programlari_degerlendir()
+            elif secim == "7":
                 print("Çıkış yapılıyor...")
                 break
             else:
-                print("Hatalı giriş! Lütfen 1-6 arasında bir değer girin.")
+                print("Hatalı giriş! Lütfen 1-7 arasında bir değer girin.")
+
+            if olcum.etkin and OLCUM_ONEKI:
+                olcum.yaz(OLCUM_ONEKI)
+            if sorgu_profili.etkin:
+                sorgu_profili.rapor(f"menü {secim}")
 
     def kullanici_islemleri():
         while True:
@@ -622,7 +1187,8 @@ class Sistem:
         print(f"📌 Bu bölüme ait öğretim üyeleri: {ogretim_listesi}")
         ogretim_uyesi_id = input("Dersin Öğretim Görevlisi ID: ").strip()
 
-        ogretim_uyesi = session.query(Kullanicilar).filter_by(id=ogretim_uyesi_id, mevki="öğretim_üyesi").first()
+        ogretim_uyesi = session.query(Kullanicilar).filter(
+            Kullanicilar.id == ogretim_uyesi_id, Kullanicilar.mevki.in_(OGRETIM_UYESI_MEVKILERI)).first()
 
         if not ogretim_uyesi:
             print("❌ Hata: Girilen ID'ye sahip bir öğretim üyesi bulunamadı.")
@@ -634,6 +1200,9 @@ class Sistem:
         session.commit()
         print(f"\n✅ Ders tanımlandı: {yeni_ders.kod}")
 
+        # Kayıtlı program varsa yeni ders yalnızca boş bloklara eklenir
+        Program.programlari_onar(DONEM_TIPLERI[Program.donem_tipi_bul(yeni_ders.donem)])
+
     def ders_sil():
         print("\n||--- Ders Sil ---||")
         ders_kod = input("Silmek istediğiniz Dersin Kodunu girin: ").strip()
@@ -644,9 +1213,13 @@ class Sistem:
             return
 
         if ders:
+            donem = ders.donem
             session.delete(ders)
             session.commit()
             print(f"\n✅ {ders.kod} Dersi silindi.")
+
+            # Kayıtlı program varsa yalnızca dersin saatleri boşaltılır
+            Program.programlari_onar(DONEM_TIPLERI[Program.donem_tipi_bul(donem)])
         else:
             print("❌ Ders bulunamadı!")
 
@@ -692,29 +1265,407 @@ class Sistem:
             session.delete(derslik)
             session.commit()
             print(f"\n✅ {derslik.kod} Dersliği silindi.")
+
+            # Kayıtlı programlarda yalnızca bu dersliği kullanan derslere yeni derslik verilir
+            for donemler in DONEM_TIPLERI.values():
+                Program.programlari_onar(donemler)
         else:
             print("❌ Derslik bulunamadı!")
 
-    def ders_programi_olustur():
+    def programlari_degerlendir(donem_tipi=None):
+        """ Güz (G) ya da Bahar (B) döneminin kayıtlı programlarını yeniden oluşturmadan değerlendirir. """
+        if donem_tipi is None:
+            donem_tipi = input("Güz mü Bahar mı? (G/B): ").strip().upper()
+
+        donemler = DONEM_TIPLERI.get(donem_tipi)
+        if donemler is None:
+            print("Hatalı giriş! Lütfen G ya da B girin.")
+            return False
+        return Program.kayitli_programlari_degerlendir(donemler) is not None
+
+    @olculen("donem_programlari_olustur")
+    def ders_programi_olustur(donem_tipi=None, excel_dosyasi=SABLON_DOSYASI, motor="rastgele", deneme_sayisi=1,
+                              isci_sayisi=None, cikti_bicimi="sablon", donem_baslangici=None, bolum_basina=False,
+                              birlestir=False, artimli=False):
+        """
+        Güz (G) ya da Bahar (B) dönemlerinin programlarını oluşturur; tüm dönemler başarılıysa True döndürür.
+        cikti_bicimi "sablon" değilse programlar excel_dosyasi yoluna o biçimde (csv, jsonl, ics, xlsx) yazılır.
+        bolum_basina ise her bölüm excel_dosyasi'nın klasörüne kendi dosyasına paralel yazılır; birlestir ise
+        bölüm dosyaları sonunda excel_dosyasi'nda birleştirilir. Oluşturulan programlar girdilerinin parmak iziyle
+        veritabanına kaydedilir; artimli ise yalnızca parmak izi değişen yarıyıllar yeniden oluşturulur.
+        """
+        if donem_tipi is None:
+            donem_tipi = input("Güz mü Bahar mı? (G/B): ").strip().upper()
+
+        donemler = DONEM_TIPLERI.get(donem_tipi)
+        if donemler is None:
+            print("Hatalı giriş! Lütfen G ya da B girin.")
+            return False
 
-        donem_tipi = input("Güz mü Bahar mı? (G/B): ").strip().upper()
         derslikler = Program.derslikleri_oku()
+        basarili = derslikler is not None
 
-        if donem_tipi == "G":
-            donemler = [1, 3, 5, 7]
-            for donem in donemler:
-                # Dersleri veritabanından al ve programı oluştur
-                Program.dersleri_oku(donem, derslikler)
+        # Derslikler dönemin tüm yarıyıllarında saat bazında paylaşılır, indeks bir kez oluşturulur. Yarıyıllar
+        # kaydedildikçe commit ORM nesnelerini geçersiz kılar; düz kayıtlar her erişimde yeniden sorgulanmaz.
+        doluluk = DerslikDolulugu()
+        if derslikler is not None:
+            derslikler = DerslikIndeksi(DerslikBilgisi(d.kod, d.kapasite, d.statu) for d in derslikler)
 
-                print(f"\n✅ {donem}. Dönem için ders programı oluşturuldu.")
+        # Dönemin tüm dersleri tek sorguda çekilir, programlar bellekteki bu veriden oluşturulur
+        try:
+            donem_dersleri = Program.donem_derslerini_oku(donemler)
+            kapali = Program.musait_olmayan_saatleri_oku()
+        except Exception as e:
+            print(f"Hata oluştu: {e}")
+            return False
+
+        # Öğretim üyeleri de dönemin tüm yarıyıllarında saat bazında paylaşılır
+        ogretim_uyeleri = OgretimUyesiDolulugu(kapali)
+
+        # Parmak izleri, ders_indeksi_olustur dersleri değiştirmeden önce hesaplanır
+        parmak_izleri = {donem: Program.donem_parmak_izi(donem_dersleri[donem], kapali) for donem in donemler}
+
+        donem_programlari = {}  # {donem: {bolum: program}} - Excel'e dönem sonunda tek seferde yazılır
+        if artimli:
+            try:
+                kayitli_izler = Program.kayitli_parmak_izleri(donemler)
+                degismeyenler = [donem for donem in donemler if kayitli_izler.get(donem) == parmak_izleri[donem]]
+                kayitli_programlar = Program.kayitli_programlari_oku(degismeyenler)
+                kayitli_derslikler = Program.kayitli_derslikleri_oku(degismeyenler)
+            except Exception as e:
+                print(f"Hata oluştu: {e}")
+                return False
+
+            # Silinmiş ya da kapasitesi/statüsü değişmiş bir dersliği kullanan kayıtlı program yeniden oluşturulur
+            guncel_derslikler = {derslik.kod: derslik for derslik in derslikler or []}
+            degismeyenler = [donem for donem in degismeyenler
+                             if not Program.degisen_derslikler(kayitli_programlar.get(donem, {}),
+                                                               kayitli_derslikler.get(donem, {}), guncel_derslikler)]
+
+            # Değişmeyen yarıyılların derslikleri ve öğretim üyeleri, yeniden oluşturulanlarla çakışmasın diye
+            # önce işlenir
+            for donem in degismeyenler:
+                programlar = kayitli_programlar.get(donem, {})
+                donem_programlari[donem] = {bolum: programlar.get(bolum) or Program.bos_program()
+                                            for bolum in donem_dersleri[donem]}
+                doluluk.programlari_isle(donem_programlari[donem])
+                ogretim_uyeleri.programlari_isle(donem_programlari[donem],
+                                                 Program.ders_ogretim_uyesi_haritasi(donem_dersleri[donem]))
+                print(f"\n♻️ {donem}. Dönemin girdileri değişmedi, kayıtlı program kullanıldı.")
+
+        # Paralel denemelerin işçi havuzu dönemin tüm yarıyıllarında paylaşılır (bir kez başlatılır)
+        havuz = None
+        if deneme_sayisi > 1 and any(donem not in donem_programlari for donem in donemler):
+            havuz = ProcessPoolExecutor(max_workers=min(isci_sayisi or os.cpu_count() or 1, deneme_sayisi))
 
-        elif donem_tipi == "B":
-            donemler = [2, 4, 6, 8]
+        try:
             for donem in donemler:
-                # Dersleri veritabanından al ve programı oluştur
-                Program.dersleri_oku(donem, derslikler)
+                if donem in donem_programlari:
+                    continue
 
+                # Dönemin dersleriyle programı oluştur
+                programlar = Program.dersleri_oku(donem, derslikler, None, motor, deneme_sayisi, isci_sayisi,
+                                                  donem_dersleri[donem], doluluk, ogretim_uyeleri, havuz)
+                if programlar is None:
+                    basarili = False
+                    continue
+
+                donem_programlari[donem] = programlar
                 print(f"\n✅ {donem}. Dönem için ders programı oluşturuldu.")
+                basarili = Program.programlari_kaydet(donem_tipi, donem, programlar, parmak_izleri[donem],
+                                                      derslikler or ()) and basarili
+        finally:
+            if havuz is not None:
+                havuz.shutdown()
+
+        donem_programlari = {donem: donem_programlari[donem] for donem in donemler if donem in donem_programlari}
+        if excel_dosyasi and donem_programlari:
+            ogretim_uyesi_adlari = Program.ogretim_uyesi_haritasi(donem_dersleri)
+            if cikti_bicimi == "sablon" and bolum_basina:
+                klasor, dosya = os.path.split(excel_dosyasi)
+                basarili = Program.bolumleri_paralel_yazdir(
+                    donem_programlari, klasor, os.path.splitext(dosya)[0], ogretim_uyesi_adlari, isci_sayisi,
+                    excel_dosyasi if birlestir else None) and basarili
+            elif cikti_bicimi == "sablon":
+                basarili = Program.donemi_excele_yazdir(donem_programlari, excel_dosyasi,
+                                                        ogretim_uyesi_adlari) and basarili
+            else:
+                basarili = Program.disa_aktar(donem_programlari, excel_dosyasi, cikti_bicimi,
+                                              ogretim_uyesi_adlari, donem_baslangici) and basarili
+
+        return basarili
+
+
+# ---HAFTALIK ÇİZELGE (BİT MASKESİ)---
+
+GUNLER = ["Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma"]
+SAATLER = list(range(9, 17))  # 9:00 - 17:00 saatleri
+GUN_INDEKSI = {gun: i for i, gun in enumerate(GUNLER)}
+SAAT_INDEKSI = {saat: i for i, saat in enumerate(SAATLER)}
+GUNLUK_DERS_SINIRI = 2  # Bir bölümün bir gündeki en fazla ders sayısı
+DONEM_TIPLERI = {"G": [1, 3, 5, 7], "B": [2, 4, 6, 8]}  # Güz ve bahar dönemlerinin yarıyılları
+# Program puanındaki ceza ağırlıkları (puan = -Σ ağırlık × ölçü)
+PUAN_AGIRLIKLARI = {"yerlesmeyen": 100, "bosluk": 5, "dengesizlik": 1}
+GERI_IZLEME_SURE_SINIRI = 5.0  # Geri izlemeli motorun bir dönem için harcayabileceği en fazla süre (saniye)
+GERI_IZLEME_ILK_DUGUM_SINIRI = 200  # İlk aramanın düğüm sınırı; her yeniden başlamada iki katına çıkar
+
+
+def baslangic_tablosu_olustur():
+    """
+    tablo[saat_sayisi][dolu_maske] -> dersin başlayabileceği saat indekslerinin bit maskesi.
+    Dersin saatleri ve bitişinden sonraki 1 saatlik boşluk aynı gün içinde boş olmalıdır.
+    """
+    tablo = []
+    for saat_sayisi in range(len(SAATLER) + 1):
+        gerekli = (1 << (saat_sayisi + 1)) - 1  # Ders saatleri + 1 saat boşluk
+        satir = []
+        for maske in range(1 << len(SAATLER)):
+            baslangiclar = 0
+            for i in range(len(SAATLER) - saat_sayisi):
+                if not (maske >> i) & gerekli:
+                    baslangiclar |= 1 << i
+            satir.append(baslangiclar)
+        tablo.append(satir)
+    return tablo
+
+
+BASLANGIC_TABLOSU = baslangic_tablosu_olustur()
+
+
+class Cizelge:
+    """
+    Bölümlerin haftalık programı. Her bölüm ve gün için dolu saatler tek bir tamsayının bitlerinde
+    (bit i -> SAATLER[i]), saatlerdeki dersler ise paralel bir slot listesinde tutulur.
+    Slot değerleri sözlük programındakiyle aynıdır: None (boş), "" (ders sonrası boşluk), (kod, ad).
+    ogretim_uyeleri (OgretimUyesiDolulugu) verilirse derslerin öğretim üyeleri (ders_ogretim_uyesi
+    {ders_kodu: id}) yerleştirmede kontrol edilir ve indekste ayrılıp bırakılır.
+    """
+
+    def __init__(self, bolumler, ogretim_uyeleri=None, ders_ogretim_uyesi=None):
+        self.maske = {bolum: [0] * len(GUNLER) for bolum in bolumler}
+        self.ders_sayisi = {bolum: [0] * len(GUNLER) for bolum in bolumler}
+        self.slotlar = {bolum: [None] * (len(GUNLER) * len(SAATLER)) for bolum in bolumler}
+        self.ogretim_uyeleri = ogretim_uyeleri
+        self.ders_ogretim_uyesi = ders_ogretim_uyesi or {}
+
+    def ogretim_uyesi_engeli(self, ders_kodlari, gun):
+        """ Derslerin öğretim üyelerinin gun (indeks) içinde ders veremeyeceği saatlerin maskesi. """
+        mesgul = 0
+        if self.ogretim_uyeleri is not None:
+            for ders_kodu in ders_kodlari:
+                ogretim_uyesi_id = self.ders_ogretim_uyesi.get(ders_kodu)
+                if ogretim_uyesi_id is not None:
+                    mesgul |= self.ogretim_uyeleri.mesgul_saatler(ogretim_uyesi_id, gun)
+        return mesgul
+
+    def uygun_baslangiclar(self, bolumler, gun, saat_sayisi, ders_kodlari=()):
+        """
+        Verilen bölümlerin hepsinde gun (indeks) içinde dersin başlayabileceği saat indekslerinin maskesi.
+        ders_kodlari verilirse öğretim üyelerinin dolu ya da müsait olmadığı saatlere denk gelen başlangıçlar elenir.
+        """
+        if not 0 < saat_sayisi < len(SAATLER):
+            return 0
+        dolu = 0
+        for bolum in bolumler:
+            dolu |= self.maske[bolum][gun]
+        baslangiclar = BASLANGIC_TABLOSU[saat_sayisi][dolu]
+
+        mesgul = self.ogretim_uyesi_engeli(ders_kodlari, gun) if baslangiclar else 0
+        if mesgul:
+            # i. saatte başlayan ders i .. i + saat_sayisi - 1 saatlerini kullanır
+            engelli = 0
+            for i in range(saat_sayisi):
+                engelli |= mesgul >> i
+            baslangiclar &= ~engelli
+        return baslangiclar
+
+    def bos_blok_bul(self, bolumler, gun, saat_sayisi, ders_kodlari=()):
+        """ Verilen bölümlerin hepsinde gun (indeks) içinde boş olan ilk bloğun başlangıç indeksini döndürür. """
+        baslangiclar = self.uygun_baslangiclar(bolumler, gun, saat_sayisi, ders_kodlari)
+        if not baslangiclar:
+            return None
+        return (baslangiclar & -baslangiclar).bit_length() - 1  # En düşük bit
+
+    def gun_dolu_mu(self, bolum, gun):
+        return self.ders_sayisi[bolum][gun] >= GUNLUK_DERS_SINIRI
+
+    def yerlestir(self, dersler, gun, baslangic, saat_sayisi):
+        """ dersler: {bolum: (ders_kodu, ders_adi)} - ders tüm bölümlerde aynı bloğa yerleştirilir. """
+        blok = ((1 << saat_sayisi) - 1) << baslangic
+        bosluk = baslangic + saat_sayisi
+        if bosluk < len(SAATLER):
+            blok |= 1 << bosluk
+
+        ilk_slot = gun * len(SAATLER)
+        if self.ogretim_uyeleri is not None:
+            ders_blogu = ((1 << saat_sayisi) - 1) << baslangic
+            for ogretim_uyesi_id in {self.ders_ogretim_uyesi.get(ders[0]) for ders in dersler.values()} - {None}:
+                self.ogretim_uyeleri.ayir(ogretim_uyesi_id, gun, ders_blogu)
+
+        for bolum, ders in dersler.items():
+            self.maske[bolum][gun] |= blok
+            self.ders_sayisi[bolum][gun] += 1
+            slotlar = self.slotlar[bolum]
+            for i in range(baslangic, baslangic + saat_sayisi):
+                slotlar[ilk_slot + i] = ders
+            # **Boşluk**: Dersin bitişinden 1 saat sonrası boş bırakılır
+            if bosluk < len(SAATLER):
+                slotlar[ilk_slot + bosluk] = ""
+
+    def kaldir(self, bolumler, gun, baslangic, saat_sayisi):
+        """ yerlestir() ile konmuş dersi (ve sonrasındaki boşluğu) bölümlerin programından çıkarır. """
+        blok = ((1 << saat_sayisi) - 1) << baslangic
+        bitis = min(baslangic + saat_sayisi + 1, len(SAATLER))
+        if baslangic + saat_sayisi < len(SAATLER):
+            blok |= 1 << (baslangic + saat_sayisi)
+
+        ilk_slot = gun * len(SAATLER)
+        if self.ogretim_uyeleri is not None:
+            ders_blogu = ((1 << saat_sayisi) - 1) << baslangic
+            kodlar = {self.slotlar[bolum][ilk_slot + baslangic][0] for bolum in bolumler}
+            for ogretim_uyesi_id in {self.ders_ogretim_uyesi.get(kod) for kod in kodlar} - {None}:
+                self.ogretim_uyeleri.birak(ogretim_uyesi_id, gun, ders_blogu)
+
+        for bolum in bolumler:
+            self.maske[bolum][gun] &= ~blok
+            self.ders_sayisi[bolum][gun] -= 1
+            slotlar = self.slotlar[bolum]
+            for i in range(baslangic, bitis):
+                slotlar[ilk_slot + i] = None
+
+    def sozluge_cevir(self, bolum):
+        """ Bölümün programını {gun: {saat: değer}} biçimine çevirir. """
+        slotlar = self.slotlar[bolum]
+        return {
+            gun: {saat: slotlar[g * len(SAATLER) + s] for s, saat in enumerate(SAATLER)}
+            for g, gun in enumerate(GUNLER)
+        }
+
+
+class DerslikDolulugu:
+    """
+    Derslik × gün × saat doluluk indeksi. Her derslik ve gün için dolu saatler Cizelge'deki gibi bir bit
+    maskesinde tutulur; bir dönemin (güz/bahar) tüm yarıyılları aynı indeksi paylaşır, böylece bir derslik
+    yalnızca o saatte boşsa verilir.
+    """
+
+    def __init__(self):
+        self.maske = {}  # {derslik_kodu: [gün başına dolu saat maskesi]}
+
+    def bos_mu(self, derslik_kodu, gun_maskeleri):
+        """ gun_maskeleri {gun indeksi: saat maskesi} saatlerinin hepsi derslikte boş mu? """
+        dolu = self.maske.get(derslik_kodu)
+        return dolu is None or not any(dolu[gun] & maske for gun, maske in gun_maskeleri.items())
+
+    def bos_derslik_bul(self, derslikler, gun_maskeleri):
+        """ Sıradaki ilk boş dersliğin kodunu döndürür (yoksa None). """
+        for taranan, derslik in enumerate(derslikler, 1):
+            if self.bos_mu(derslik.kod, gun_maskeleri):
+                olcum.say("taranan_derslik", taranan)
+                return derslik.kod
+        olcum.say("taranan_derslik", len(derslikler))
+        return None
+
+    def ayir(self, derslik_kodu, gun_maskeleri):
+        dolu = self.maske.setdefault(derslik_kodu, [0] * len(GUNLER))
+        for gun, maske in gun_maskeleri.items():
+            dolu[gun] |= maske
+
+    def birak(self, derslik_kodu, gun_maskeleri):
+        dolu = self.maske.get(derslik_kodu)
+        if dolu is not None:
+            for gun, maske in gun_maskeleri.items():
+                dolu[gun] &= ~maske
+
+    def programlari_isle(self, programlar):
+        """ {bolum: program} içindeki derslik atamalarını indekse işler (ortak dersler bir kez sayılır). """
+        for program in programlar.values():
+            for gun, saatler in program.items():
+                for saat, ders in saatler.items():
+                    if ders and len(ders) > 2 and ders[2]:
+                        self.ayir(ders[2], {GUN_INDEKSI[gun]: 1 << SAAT_INDEKSI[saat]})
+
+    def kopya(self):
+        yeni = DerslikDolulugu()
+        yeni.maske = {kod: list(maskeler) for kod, maskeler in self.maske.items()}
+        return yeni
+
+
+class OgretimUyesiDolulugu:
+    """
+    Öğretim üyesi × gün × saat doluluk indeksi. Her öğretim üyesi ve gün için ders verdiği saatler bir bit
+    maskesinde tutulur; dönemin tüm yarıyılları aynı indeksi paylaşır, böylece bir öğretim üyesi aynı saatte
+    iki derse konmaz. kapali {ogretim_uyesi_id: [gün başına maske]} öğretim üyesinin müsait olmadığı saatlerdir.
+    """
+
+    def __init__(self, kapali=None):
+        self.maske = {}  # {ogretim_uyesi_id: [gün başına dolu saat maskesi]}
+        self.kapali = kapali or {}
+
+    def mesgul_saatler(self, ogretim_uyesi_id, gun):
+        """ Öğretim üyesinin gun (indeks) içinde ders veremeyeceği saatlerin maskesi. """
+        mesgul = 0
+        if ogretim_uyesi_id in self.maske:
+            mesgul = self.maske[ogretim_uyesi_id][gun]
+        if ogretim_uyesi_id in self.kapali:
+            mesgul |= self.kapali[ogretim_uyesi_id][gun]
+        return mesgul
+
+    def ayir(self, ogretim_uyesi_id, gun, maske):
+        self.maske.setdefault(ogretim_uyesi_id, [0] * len(GUNLER))[gun] |= maske
+
+    def birak(self, ogretim_uyesi_id, gun, maske):
+        if ogretim_uyesi_id in self.maske:
+            self.maske[ogretim_uyesi_id][gun] &= ~maske
+
+    def programlari_isle(self, programlar, ders_ogretim_uyesi):
+        """ {bolum: program} içindeki dersleri ders_ogretim_uyesi ({ders_kodu: id}) ile indekse işler. """
+        for program in programlar.values():
+            for gun, saatler in program.items():
+                for saat, ders in saatler.items():
+                    if ders and ders_ogretim_uyesi.get(ders[0]) is not None:
+                        self.ayir(ders_ogretim_uyesi[ders[0]], GUN_INDEKSI[gun], 1 << SAAT_INDEKSI[saat])
+
+    def kopya(self):
+        yeni = OgretimUyesiDolulugu(self.kapali)
+        yeni.maske = {ogretim_uyesi_id: list(maskeler) for ogretim_uyesi_id, maskeler in self.maske.items()}
+        return yeni
+
+
+class DerslikIndeksi:
+    """
+    Derslikler bir kez gruplanır: laboratuvarlar (statu LAB ya da kodunda "lab" geçen) ve normal derslikler,
+    her grup kapasiteye göre sıralı. "Kapasitesi X'ten büyük en küçük derslik" gibi aramalar bisect ile yapılır.
+    Liste gibi gezilebilir, bu yüzden derslik listesi beklenen yerlerde kullanılabilir.
+    """
+
+    def __init__(self, derslikler):
+        self.derslikler = list(derslikler)
+        self.gruplar = {"lab": [], "normal": []}
+        for derslik in self.derslikler:
+            lab = derslik.statu.upper() == "LAB" or "lab" in derslik.kod.lower()
+            self.gruplar["lab" if lab else "normal"].append(derslik)
+        self.kapasiteler = {}
+        for grup, derslikler_ in self.gruplar.items():
+            derslikler_.sort(key=lambda d: (d.kapasite, d.kod))
+            self.kapasiteler[grup] = [d.kapasite for d in derslikler_]
+
+    def __iter__(self):
+        return iter(self.derslikler)
+
+    def __len__(self):
+        return len(self.derslikler)
+
+    def araliktakiler(self, grup, en_az=None, en_fazla=None):
+        """ Gruptaki en_az < kapasite < en_fazla derslikleri küçükten büyüğe döndürür (sınırlar isteğe bağlı). """
+        kapasiteler = self.kapasiteler[grup]
+        bas = bisect_right(kapasiteler, en_az) if en_az is not None else 0
+        son = bisect_left(kapasiteler, en_fazla) if en_fazla is not None else len(kapasiteler)
+        return self.gruplar[grup][bas:son]
+
+
+# İşçi süreçlere gönderilebilen (ORM oturumuna bağlı olmayan) derslik bilgisi
+DerslikBilgisi = namedtuple("DerslikBilgisi", ["kod", "kapasite", "statu"])
 
 
 class Program:
@@ -731,244 +1682,903 @@ class Program:
             print(f"Derslikleri okuma hatası: {e}")
 
     @staticmethod
-    def uygun_derslik_bul(ders, ortak_dersler, derslikler, kullanilan_derslik, lab_dersi):
-        """ Dersin türüne göre uygun derslik seçimi yapar. """
-        ortak_d = {ders_bilgi["Ders Adı"] for ders_bilgi in ortak_dersler.values()}
-        uygun_derslikler = []
-
+    def uygun_derslik_bul(ders, derslik_indeksi, lab_dersi):
+        """ Dersin türüne göre uygun derslikleri tercih sırasıyla (küçük kapasite önce) döndürür. """
         # Eğer ders bir laboratuvar dersi ise sadece laboratuvar derslikleri seçilecek
-        if lab_dersi or "lab" in ders["Ders Adı"].lower():
-            uygun_derslikler = [d for d in derslikler if "lab" in d.kod.lower() and d.kod not in kullanilan_derslik]
+        if lab_dersi or ders["Lab"]:
+            uygun_derslikler = derslik_indeksi.araliktakiler("lab")
 
-        # Ortak dersler ve seçmeli dersler için kapasitesi 70'ten büyük olanlar seçilecek
-        elif ders["Ders Adı"] in ortak_d or ders["Ders Tipi"].lower() == "secmeli":
-            uygun_derslikler = [d for d in derslikler if d.kapasite > 90 and d.kod not in kullanilan_derslik]
+        # Ortak dersler ve seçmeli dersler için kapasitesi 90'dan büyük olanlar seçilecek
+        elif ders["Ortak"] or ders["Ders Tipi"].lower() == "secmeli":
+            uygun_derslikler = derslik_indeksi.araliktakiler("normal", en_az=90)
 
-        # Diğer dersler için alfabetik olarak sıralanmış uygun derslikler seçilecek
+        # Diğer dersler için kapasitesi 80'den küçük derslikler seçilecek
         else:
-            uygun_derslikler = sorted(
-                [d for d in derslikler if d.kod not in kullanilan_derslik and d.kapasite <80],
-                key=lambda d: d.kod
-            )
+            uygun_derslikler = derslik_indeksi.araliktakiler("normal", en_fazla=80)
 
-        return uygun_derslikler if uygun_derslikler else derslikler
+        return uygun_derslikler if uygun_derslikler else derslik_indeksi.derslikler
 
 
     @staticmethod
-    def derslikleri_atama(bm_program, ym_program, bm_dersler, ym_dersler, bm_ortak_dersler, derslikler):
-        """ Programdaki tüm derslere uygun derslik ataması yapar. """
-        derslik_doluluk = defaultdict(lambda: defaultdict(set))  # {gun: {saat: {derslik1, derslik2, ...}}}
-        ortak_derslik_atama = {}  # Ortak dersler için atanmış derslikleri saklar
-        derslik_atama = {}  # Aynı bölümdeki dersler için tek derslik kullanımı
-        kullanilan_derslik = set()  # Kullanılan derslikleri takip etmek için
-
-        ortak_d = {ders_bilgi["Ders Adı"] for ders_kodu, ders_bilgi in bm_ortak_dersler.items()}
-
-        for bolum, program in [("BM", bm_program), ("YM", ym_program)]:
+    @olculen("derslikleri_atama")
+    def derslikleri_atama(programlar, bolum_dersleri, derslikler, doluluk=None):
+        """
+        Tüm bölümlerin programlarındaki ({bolum: program}) derslere uygun derslik ataması yapar.
+        doluluk (DerslikDolulugu) dönemin diğer yarıyıllarıyla paylaşılırsa derslikler çakışmaz.
+        """
+        if doluluk is None:
+            doluluk = DerslikDolulugu()
+        if not isinstance(derslikler, DerslikIndeksi):
+            derslikler = DerslikIndeksi(derslikler)
+        ortak_derslik_atama = {}  # Ortak dersler için atanmış derslikleri saklar {ortak anahtar: derslik}
+
+        # Her dersin programdaki saatleri: {(bolum, ders_kodu): {gun indeksi: saat maskesi}}
+        ders_saatleri = {}
+        for bolum, program in programlar.items():
             for gun, saatler in program.items():
                 for saat, ders in saatler.items():
-                    if ders and ders != "":  # Boş olmayan saatler için derslik atayalım
-                        ders_kodu, ders_adi = ders
+                    if ders:  # Boş olmayan saatler için derslik atayalım
+                        gun_maskeleri = ders_saatleri.setdefault((bolum, ders[0]), {})
+                        gun_i = GUN_INDEKSI[gun]
+                        gun_maskeleri[gun_i] = gun_maskeleri.get(gun_i, 0) | 1 << SAAT_INDEKSI[saat]
+
+        for (bolum, ders_kodu), gun_maskeleri in ders_saatleri.items():
+            # Ders bilgisi al
+            ders_bilgisi = bolum_dersleri[bolum].get(ders_kodu)
+            if not ders_bilgisi:
+                continue
 
-                        # Ders bilgisi al
-                        ders_bilgisi = bm_dersler.get(ders_kodu, ym_dersler.get(ders_kodu, None))
-                        if not ders_bilgisi:
-                            continue
+            # Eğer ortak bir dersse ve daha önce atanmışsa, aynı dersliği kullan (aynı saatlerdedir)
+            ortak_anahtar = ders_bilgisi["Ortak"]
+            if ortak_anahtar and ortak_anahtar in ortak_derslik_atama:
+                derslik_kodu = ortak_derslik_atama[ortak_anahtar]
+            else:
+                # Ders bir LAB dersi mi?
+                lab_dersi = "LAB" in ders_kodu.upper()
+
+                # Uygun derslikler arasından dersin tüm saatlerinde boş olanı seç, yoksa herhangi bir boş derslik
+                uygun_derslikler = Program.uygun_derslik_bul(ders_bilgisi, derslikler, lab_dersi)
+                derslik_kodu = doluluk.bos_derslik_bul(uygun_derslikler, gun_maskeleri)
+                if derslik_kodu is None:
+                    derslik_kodu = doluluk.bos_derslik_bul(derslikler, gun_maskeleri)
+                if derslik_kodu is None:
+                    olcum.say("dersliksiz_ders")
+                    print(f"⚠️ {bolum}: {ders_bilgisi['Ders Adı']} ({ders_kodu}) için boş derslik bulunamadı.")
+                    continue
 
-                        # Eğer ortak bir dersse ve daha önce atanmışsa, aynı dersliği kullan
-                        if ders_adi in ortak_d and ders_adi in ortak_derslik_atama:
-                            program[gun][saat] = (ders_kodu, ders_adi, ortak_derslik_atama[ders_adi])
-                            continue  
+                doluluk.ayir(derslik_kodu, gun_maskeleri)
 
-                        # Aynı bölümdeki aynı ders için daha önce derslik atanmışsa, onu kullan
-                        if (bolum, ders_adi) in derslik_atama:
-                            program[gun][saat] = (ders_kodu, ders_adi, derslik_atama[(bolum, ders_adi)])
-                            continue
+                # Ortak bir dersse, diğer bölümlere de aynı dersliği ata
+                if ortak_anahtar:
+                    ortak_derslik_atama[ortak_anahtar] = derslik_kodu
+
+            # Aynı dersin her saatine aynı dersliği yaz
+            program = programlar[bolum]
+            for gun_i, maske in gun_maskeleri.items():
+                saatler = program[GUNLER[gun_i]]
+                for saat_i, saat in enumerate(SAATLER):
+                    if maske >> saat_i & 1:
+                        saatler[saat] = (ders_kodu, ders_bilgisi["Ders Adı"], derslik_kodu)
+
+
+# ---DERS PROGRAMI OLUŞTURMA İŞLEMLERİ---
 
-                        # Ders bir LAB dersi mi?
-                        lab_dersi = "LAB" in ders_kodu.upper()
+    @staticmethod
+    @olculen("donem_derslerini_oku")
+    def donem_derslerini_oku(donemler):
+        """
+        Verilen dönemlerin (ör. güz için 1, 3, 5, 7) tüm bölümlerdeki derslerini, bölüm ve öğretim üyeleriyle
+        birlikte tek sorguda çeker: {donem: {bolum_kod: {ders_kodu: ders bilgisi}}}.
+        """
+        donem_dersleri = {donem: {} for donem in donemler}
+
+        dersler = session.scalars(
+            select(Ders)
+            .join(Ders.bolum)
+            .options(contains_eager(Ders.bolum), joinedload(Ders.ogretim_uyesi))
+            .where(Ders.donem.in_(list(donemler)))
+            .order_by(Bolum.id, Ders.id)
+        ).unique()
 
-                        # Uygun derslikleri belirle
-                        uygun_derslikler = Program.uygun_derslik_bul(ders_bilgisi, bm_ortak_dersler, derslikler, kullanilan_derslik, lab_dersi)
+        for ders in dersler:
+            ders_bilgisi = {
+                "Dönem": ders.donem,
+                "Ders Adı": ders.ad,
+                "Ders Tipi": ders.ders_tipi,
+                "Teorik": ders.teorik_saat,
+                "Pratik": ders.uyg_saat,
+                "Öğretim Üyesi ID": ders.ogretim_uyesi_id,
+                "Öğretim Üyesi": ders.ogretim_uyesi.ad if ders.ogretim_uyesi else None
+            }
+            donem_dersleri[ders.donem].setdefault(ders.bolum.kod, {})[ders.kod] = ders_bilgisi
 
-                        # Ders için uygun bir derslik bul ve ata
-                        for derslik in uygun_derslikler:
-                            if derslik.kod not in kullanilan_derslik:  # Daha önce atanmadıysa
-                                program[gun][saat] = (ders_kodu, ders_adi, derslik.kod)
-                                derslik_doluluk[gun][saat].add(derslik.kod)
-                                kullanilan_derslik.add(derslik.kod)
+        return donem_dersleri
 
-                                # Aynı bölümdeki aynı dersin her saatine aynı dersliği ata
-                                derslik_atama[(bolum, ders_adi)] = derslik.kod
+    # ---KAYITLI PROGRAMLAR---
 
-                                # Ortak bir dersse, diğer bölümlere de aynı dersliği ata
-                                if ders_adi in ortak_d:
-                                    ortak_derslik_atama[ders_adi] = derslik.kod
-                                break  # Derslik atandıktan sonra döngüden çık
+    @staticmethod
+    def donem_parmak_izi(bolum_dersleri, kapali=None):
+        """
+        Bir yarıyılın yerleşimi belirleyen girdilerinin (dersler, öğretim üyeleri) SHA-256 özeti. Girdiler
+        değişmedikçe aynı kalır; programın yeniden oluşturulması gerekip gerekmediğine bununla karar verilir.
+        Derslikler yerleşimi etkilemez, özete katılmaz: derslik eklemek kayıtlı programları bozmaz, silinen ya da
+        kapasitesi/statüsü değişen derslikler ise degisen_derslikler ile bulunur.
+        kapali ({ogretim_uyesi_id: gün maskeleri}) verilirse yarıyılın öğretim üyelerinin müsait olmadığı
+        saatler de özete katılır. ders_indeksi_olustur'un eklediği alanlardan önce (veritabanından okunduğu
+        haliyle) hesaplanmalıdır.
+        """
+        ogretim_uyeleri = set(Program.ders_ogretim_uyesi_haritasi(bolum_dersleri).values())
+        girdiler = {
+            "dersler": {bolum: {kod: sorted(ders.items()) for kod, ders in sorted(dersler.items())}
+                        for bolum, dersler in sorted(bolum_dersleri.items())},
+        }
+        if kapali:
+            girdiler["kapali"] = sorted((ogretim_uyesi_id, maskeler) for ogretim_uyesi_id, maskeler in kapali.items()
+                                        if ogretim_uyesi_id in ogretim_uyeleri)
+        return hashlib.sha256(json.dumps(girdiler, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
 
-   
-                                
-# ---DERS PROGRAMI OLUŞTURMA İŞLEMLERİ---
+    @staticmethod
+    def kullanilan_derslikler(programlar):
+        """ Programlarda ({bolum: program}) kullanılan derslik kodları. """
+        return {ders[2] for program in programlar.values() for saatler in program.values()
+                for ders in saatler.values() if ders and len(ders) > 2}
+
+    @staticmethod
+    def degisen_derslikler(programlar, kayitli_derslikler, derslikler):
+        """
+        Programlarda kullanılıp program kaydedildiğinden beri silinen ya da kapasitesi/statüsü değişen derslik
+        kodları. kayitli_derslikler kayıt anındaki, derslikler güncel {kod: DerslikBilgisi} haritasıdır.
+        """
+        return {kod for kod in Program.kullanilan_derslikler(programlar)
+                if kayitli_derslikler.get(kod) != derslikler.get(kod)}
+
+    @staticmethod
+    def kayitli_parmak_izleri(donemler):
+        """ Kayıtlı programı olan yarıyılların {donem: parmak izi} haritası. """
+        return dict(session.execute(
+            select(DonemParmakIzi.donem, DonemParmakIzi.parmak_izi).where(DonemParmakIzi.donem.in_(list(donemler)))
+        ).all())
+
+    @staticmethod
+    def musait_olmayan_saatleri_oku():
+        """ Öğretim üyelerinin müsait olmadığı saatleri tek sorguda {ogretim_uyesi_id: [gün başına maske]} okur. """
+        kapali = {}
+        for ogretim_uyesi_id, gun, baslangic, bitis in session.execute(
+                select(MusaitOlmayanSaat.ogretim_uyesi_id, MusaitOlmayanSaat.gun,
+                       MusaitOlmayanSaat.baslangic, MusaitOlmayanSaat.bitis)):
+            if gun not in GUN_INDEKSI:
+                continue
+            maskeler = kapali.setdefault(ogretim_uyesi_id, [0] * len(GUNLER))
+            for saat in range(max(baslangic, SAATLER[0]), min(bitis, SAATLER[-1] + 1)):
+                maskeler[GUN_INDEKSI[gun]] |= 1 << SAAT_INDEKSI[saat]
+        return kapali
+
+    @staticmethod
+    def bos_program():
+        return {gun: {saat: None for saat in SAATLER} for gun in GUNLER}
+
+    @staticmethod
+    def kayitli_programlari_oku(donemler):
+        """
+        Kayıtlı programları tek sorguda {donem: {bolum: program}} olarak okur. Dersten sonraki boşluk ("")
+        kaydedilmez; yerleştirmedeki gibi her ders bloğunun ardındaki boş saate yeniden konur.
+        """
+        donem_programlari = {}
+        for kayit in session.scalars(select(ProgramSaati).where(ProgramSaati.donem.in_(list(donemler)))):
+            program = donem_programlari.setdefault(kayit.donem, {}).setdefault(kayit.bolum_kod, Program.bos_program())
+            ders = (kayit.ders_kod, kayit.ders_ad, kayit.derslik_kod) if kayit.derslik_kod else \
+                (kayit.ders_kod, kayit.ders_ad)
+            program[kayit.gun][kayit.saat] = ders
+
+        for programlar in donem_programlari.values():
+            for program in programlar.values():
+                for saatler in program.values():
+                    for onceki, saat in zip(SAATLER, SAATLER[1:]):
+                        if saatler[onceki] and saatler[saat] is None:
+                            saatler[saat] = ""
+        return donem_programlari
 
     @staticmethod
-    def dersleri_oku(donem, derslikler):
-        bm_dersler = {}  # BM derslerini saklamak için sözlük
-        ym_dersler = {}  # YM derslerini saklamak için sözlük
+    def kayitli_derslikleri_oku(donemler):
+        """ Kayıtlı programların kullandığı dersliklerin kayıt anındaki bilgileri: {donem: {kod: DerslikBilgisi}}. """
+        donem_derslikleri = {}
+        for donem, kod, kapasite, statu in session.execute(
+                select(DonemDersligi.donem, DonemDersligi.kod, DonemDersligi.kapasite, DonemDersligi.statu)
+                .where(DonemDersligi.donem.in_(list(donemler)))):
+            donem_derslikleri.setdefault(donem, {})[kod] = DerslikBilgisi(kod, kapasite, statu)
+        return donem_derslikleri
 
+    @staticmethod
+    def programlari_kaydet(donem_tipi, donem, programlar, parmak_izi, derslikler=()):
+        """
+        Yarıyılın kayıtlı programını, parmak izini ve programda kullanılan dersliklerin derslikler (DerslikBilgisi)
+        içindeki bilgilerini yenileriyle değiştirir; başarılıysa True döndürür.
+        """
+        kullanilan = Program.kullanilan_derslikler(programlar)
         try:
-            # Veritabanından belirtilen dönemin BM ve YM derslerini çekiyoruz
-            bm_dersler_l = session.query(Ders).join(Bolum).filter(Bolum.kod == "BM", Ders.donem == donem).all()
-            ym_dersler_l = session.query(Ders).join(Bolum).filter(Bolum.kod == "YM", Ders.donem == donem).all()
-
-            # BM derslerini sözlüğe yerleştiriyoruz
-            for ders in bm_dersler_l:
-                ders_bilgisi = {
-                    "Dönem": ders.donem,
-                    "Ders Adı": ders.ad,
-                    "Ders Tipi": ders.ders_tipi,
-                    "Teorik": ders.teorik_saat,
-                    "Pratik": ders.uyg_saat
-                }
-                bm_dersler[ders.kod] = ders_bilgisi
-
-            # YM derslerini sözlüğe yerleştiriyoruz
-            for ders in ym_dersler_l:
-                ders_bilgisi = {
-                    "Dönem": ders.donem,
-                    "Ders Adı": ders.ad,
-                    "Ders Tipi": ders.ders_tipi,
-                    "Teorik": ders.teorik_saat,
-                    "Pratik": ders.uyg_saat
-                }
-                ym_dersler[ders.kod] = ders_bilgisi
-
-            bm_program, ym_program = Program.ders_programi_olustur(bm_dersler, ym_dersler, derslikler)
-            Program.programi_goster(bm_program, "BM")
-            Program.programi_goster(ym_program, "YM")
-            Program.excele_yazdir(bm_program, "BM", donem)
-            Program.excele_yazdir(ym_program, "YM", donem)
+            session.execute(delete(ProgramSaati).where(ProgramSaati.donem == donem))
+            session.execute(delete(DonemParmakIzi).where(DonemParmakIzi.donem == donem))
+            session.execute(delete(DonemDersligi).where(DonemDersligi.donem == donem))
+            toplu_ekle(ProgramSaati, [
+                {"donem_tipi": donem_tipi, "donem": donem, "bolum_kod": bolum, "gun": gun, "saat": saat,
+                 "ders_kod": ders[0], "ders_ad": ders[1], "derslik_kod": ders[2] if len(ders) > 2 else None}
+                for bolum, program in programlar.items()
+                for gun, saatler in program.items()
+                for saat, ders in saatler.items() if ders
+            ])
+            toplu_ekle(DonemDersligi, [{"donem": donem, "kod": derslik.kod, "kapasite": derslik.kapasite,
+                                        "statu": derslik.statu} for derslik in derslikler if derslik.kod in kullanilan])
+            session.add(DonemParmakIzi(donem_tipi=donem_tipi, donem=donem, parmak_izi=parmak_izi))
+            session.commit()
+            return True
+        except Exception as e:
+            session.rollback()
+            print(f"❌ {donem}. Dönem programı kaydedilemedi: {e}")
+            return False
 
+    # ---KAYITLI PROGRAMI ONARMA---
 
+    @staticmethod
+    def kayitli_bloklar(program):
+        """ Programdaki ders bloklarını (gun indeksi, başlangıç indeksi, saat sayısı, ders) olarak üretir. """
+        for gun_i, gun in enumerate(GUNLER):
+            saatler = program[gun]
+            saat_i = 0
+            while saat_i < len(SAATLER):
+                ders = saatler[SAATLER[saat_i]]
+                if not ders:
+                    saat_i += 1
+                    continue
+                bitis = saat_i + 1
+                while bitis < len(SAATLER) and saatler[SAATLER[bitis]] and saatler[SAATLER[bitis]][0] == ders[0]:
+                    bitis += 1
+                yield gun_i, saat_i, bitis - saat_i, ders
+                saat_i = bitis
+
+    @staticmethod
+    @olculen("programlari_onar")
+    def programlari_onar(donemler):
+        """
+        Bir dönemin (güz ya da bahar yarıyılları) kayıtlı programlarını ders ve derslik değişikliklerine göre
+        yerinde onarır; program baştan oluşturulmaz. Silinen (ya da saati değişen) derslerin saatleri boşaltılır,
+        kaldırılan ya da kapasitesi/statüsü değişen dersliği kullanan derslere aynı saatlerde yeniden derslik
+        atanır, programda olmayan dersler boş bloklara yerleştirilir. Diğer dersler yerinde kalır. Girdileri ve
+        derslikleri değişmeyen yarıyıllara dokunulmaz. Kayıtlı program yoksa bir şey yapılmaz. Başarılıysa True
+        döndürür.
+        """
+        baslangic = time.perf_counter()
+        try:
+            kayitli_izler = Program.kayitli_parmak_izleri(donemler)
+            if not kayitli_izler:
+                return True
+            donem_dersleri = Program.donem_derslerini_oku(donemler)
+            derslikler = DerslikIndeksi(DerslikBilgisi(d.kod, d.kapasite, d.statu)
+                                        for d in Program.derslikleri_oku() or [])
+            kayitli_programlar = Program.kayitli_programlari_oku(list(kayitli_izler))
+            kayitli_derslikler = Program.kayitli_derslikleri_oku(list(kayitli_izler))
+            kapali = Program.musait_olmayan_saatleri_oku()
         except Exception as e:
             print(f"Hata oluştu: {e}")
+            return False
+
+        guncel_derslikler = {derslik.kod: derslik for derslik in derslikler}
+        doluluk = DerslikDolulugu()
+        ogretim_uyeleri = OgretimUyesiDolulugu(kapali)
+
+        # 1) Önce değişmeyen yarıyılların tümü işlenir; onarılacak yarıyılların yerinde kalan dersleri tüm dönemin
+        # değişmeyen derslikleri ve öğretim üyesi saatleriyle karşılaştırılır
+        degisenler = []
+        for donem in donemler:
+            if donem not in kayitli_izler:
+                continue
+            bolum_dersleri = donem_dersleri[donem]
+            parmak_izi = Program.donem_parmak_izi(bolum_dersleri, kapali)
+            programlar = kayitli_programlar.get(donem, {})
+            ders_ogretim_uyesi = Program.ders_ogretim_uyesi_haritasi(bolum_dersleri)
+            degisen_derslikler = Program.degisen_derslikler(programlar, kayitli_derslikler.get(donem, {}),
+                                                            guncel_derslikler)
+            if kayitli_izler[donem] == parmak_izi and not degisen_derslikler:
+                doluluk.programlari_isle(programlar)
+                ogretim_uyeleri.programlari_isle(programlar, ders_ogretim_uyesi)
+            else:
+                degisenler.append((donem, parmak_izi, bolum_dersleri, programlar, ders_ogretim_uyesi,
+                                   degisen_derslikler))
+
+        onarilacaklar = []
+        for donem, parmak_izi, bolum_dersleri, programlar, ders_ogretim_uyesi, degisen_derslikler in degisenler:
+            Program.ders_indeksi_olustur(bolum_dersleri)
+            cizelge = Cizelge(list(bolum_dersleri), ogretim_uyeleri, ders_ogretim_uyesi)
+            yerlesik = {}  # {(bolum, ders_kodu): (gun indeksi, başlangıç, saat sayısı, derslik ya da None)}
+            bloklar = defaultdict(dict)  # {(gun indeksi, başlangıç, saat sayısı, ortak anahtar): {bolum: ders}}
+            for bolum, program in programlar.items():
+                dersler = bolum_dersleri.get(bolum, {})
+                for gun_i, saat_i, saat_sayisi, ders in Program.kayitli_bloklar(program):
+                    bilgi = dersler.get(ders[0])
+                    # Silinen ya da süresi değişen dersin saatleri boşaltılır (süresi değiştiyse yeniden yerleşir).
+                    # Ortak dersin bloğu grubun ilk dersinin süresindedir, bu yüzden süresi karşılaştırılmaz.
+                    if bilgi is None or (not bilgi["Ortak"] and bilgi["Teorik"] + bilgi["Pratik"] != saat_sayisi):
+                        continue
+                    derslik = ders[2] if len(ders) > 2 and ders[2] not in degisen_derslikler else None
+                    anahtar = (gun_i, saat_i, saat_sayisi, bilgi["Ortak"] or (bolum, ders[0]))
+                    bloklar[anahtar][bolum] = (ders[0], bilgi["Ders Adı"], derslik)
+
+            # Ortak dersin bölümlerdeki blokları tek yerleşim olarak konur; öğretim üyesi o saatlerde başka
+            # derste ya da müsait değilse ders yeniden yerleştirilmek üzere çıkarılır
+            for (gun_i, saat_i, saat_sayisi, _), dersler in bloklar.items():
+                ders_blogu = ((1 << saat_sayisi) - 1) << saat_i
+                if cizelge.ogretim_uyesi_engeli([ders[0] for ders in dersler.values()], gun_i) & ders_blogu:
+                    continue
+                cizelge.yerlestir({bolum: ders[:2] for bolum, ders in dersler.items()}, gun_i, saat_i, saat_sayisi)
+                for bolum, (ders_kodu, _, derslik) in dersler.items():
+                    yerlesik[(bolum, ders_kodu)] = (gun_i, saat_i, saat_sayisi, derslik)
+                    if derslik:
+                        doluluk.ayir(derslik, {gun_i: ders_blogu})
+            onarilacaklar.append((donem, parmak_izi, bolum_dersleri, cizelge, yerlesik))
+
+        # 2) Eksik dersler yerleştirilir, dersliksiz kalanlara derslik atanır
+        basarili = True
+        for donem, parmak_izi, bolum_dersleri, cizelge, yerlesik in onarilacaklar:
+            eksikler = {bolum: {kod: ders for kod, ders in dersler.items() if (bolum, kod) not in yerlesik}
+                        for bolum, dersler in bolum_dersleri.items()}
+            ortak_eksikler, ozel_eksikler = Program.dersleri_ayir(eksikler)
+
+            # Eşi programda olan ortak ders, boşsa eşinin bloğuna ve dersliğine konur. Eşiyle aynı öğretim üyesine
+            # sahipse aynı derstir; değilse öğretim üyesinin de o saatlerde boş olması gerekir.
+            ortak_yerler = defaultdict(set)  # {ortak anahtar: {(yer, öğretim üyesi id)}}
+            for (bolum, kod), yer in yerlesik.items():
+                if bolum_dersleri[bolum][kod]["Ortak"]:
+                    ortak_yerler[bolum_dersleri[bolum][kod]["Ortak"]].add((yer, cizelge.ders_ogretim_uyesi.get(kod)))
+            for bolum, dersler in ortak_eksikler.items():
+                for kod, ders in list(dersler.items()):
+                    if not ortak_yerler.get(ders["Ortak"]):
+                        continue
+                    yer = next(iter(ortak_yerler[ders["Ortak"]]))[0]
+                    ayni_ogretim_uyesi = (yer, cizelge.ders_ogretim_uyesi.get(kod)) in ortak_yerler[ders["Ortak"]]
+                    kodlar = () if ayni_ogretim_uyesi else (kod,)
+                    if cizelge.uygun_baslangiclar((bolum,), yer[0], yer[2], kodlar) >> yer[1] & 1:
+                        cizelge.yerlestir({bolum: (kod, ders["Ders Adı"])}, yer[0], yer[1], yer[2])
+                        yerlesik[(bolum, kod)] = yer
+                        del dersler[kod]
+
+            Program.ortak_dersleri_yerlestir(ortak_eksikler, cizelge)
+            # Ortak grubu kurulamayan dersler bölüme özel ders gibi yerleştirilir; eşlerinden farklı saatlerde
+            # olabileceklerinden derslik atamasında da ortak sayılmazlar
+            for bolum, dersler in ortak_eksikler.items():
+                yerlesenler = {slot[0] for slot in cizelge.slotlar[bolum] if slot}
+                for kod, ders in dersler.items():
+                    if kod not in yerlesenler:
+                        ders["Ortak"] = None
+                        ozel_eksikler[bolum][kod] = ders
+            for bolum, dersler in ozel_eksikler.items():
+                Program.dersi_yerlestir(dersler, cizelge, bolum)
+
+            for bolum, dersler in eksikler.items():
+                yerlesenler = {slot[0] for slot in cizelge.slotlar[bolum] if slot}
+                for kod, ders in dersler.items():
+                    if kod not in yerlesenler:
+                        print(f"⚠️ {bolum}: {ders['Ders Adı']} ({kod}) programa yerleştirilemedi.")
+
+            programlar = {bolum: cizelge.sozluge_cevir(bolum) for bolum in bolum_dersleri}
+            atanacaklar = {bolum: {gun: {} for gun in GUNLER} for bolum in programlar}
+            yeniden_yerlesen = set()
+            for bolum, program in programlar.items():
+                for gun, saatler in program.items():
+                    for saat, ders in saatler.items():
+                        if not ders:
+                            continue
+                        yer = yerlesik.get((bolum, ders[0]))
+                        if yer and yer[3]:
+                            saatler[saat] = ders + (yer[3],)
+                        else:
+                            atanacaklar[bolum][gun][saat] = ders
+                            yeniden_yerlesen.add((bolum, ders[0]))
+
+            Program.derslikleri_atama(atanacaklar, bolum_dersleri, derslikler, doluluk)
+            for bolum, gunler in atanacaklar.items():
+                for gun, saatler in gunler.items():
+                    programlar[bolum][gun].update(saatler)
+
+            basarili = Program.programlari_kaydet(Program.donem_tipi_bul(donem), donem, programlar, parmak_izi,
+                                                  derslikler) and basarili
+            print(f"🔧 {donem}. Dönem programı onarıldı: {len(yeniden_yerlesen)} ders yerleştirildi ya da "
+                  f"dersliği değişti.")
+
+        if onarilacaklar:
+            print(f"✅ Onarım {(time.perf_counter() - baslangic) * 1000:.1f} ms sürdü.")
+        return basarili
+
+    @staticmethod
+    def donem_tipi_bul(donem):
+        """ Yarıyılın dönem tipi: tek yarıyıllar güz ("G"), çiftler bahar ("B"). """
+        return "G" if int(donem) % 2 else "B"
 
     @staticmethod
-    def ders_programi_olustur(bm_dersler, ym_dersler, derslikler):
-        """ Ders programını oluşturur ve derslikleri atar. """
+    @olculen("dersleri_oku")
+    def dersleri_oku(donem, derslikler, excel_dosyasi=SABLON_DOSYASI, motor="rastgele", deneme_sayisi=1,
+                     isci_sayisi=None, bolum_dersleri=None, doluluk=None, ogretim_uyeleri=None, havuz=None):
+        """
+        Dönemin derslerini okuyup programı oluşturur; excel_dosyasi None ise Excel'e yazılmaz.
+        deneme_sayisi > 1 ise program paralel denemelerle (verilirse havuz'daki işçilerde) oluşturulur ve en
+        iyisi seçilir.
+        bolum_dersleri ({bolum: {ders_kodu: bilgi}}, ör. donem_derslerini_oku sonucu) verilirse
+        veritabanına tekrar gidilmez. doluluk (DerslikDolulugu) ve ogretim_uyeleri (OgretimUyesiDolulugu)
+        dönemin yarıyılları arasında paylaşılır.
+        """
+        try:
+            if bolum_dersleri is None:
+                bolum_dersleri = Program.donem_derslerini_oku([donem])[donem]
 
-        gunler = ["Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma"]
-        saatler = list(range(9, 17))  # 9:00 - 17:00 saatleri
+            if deneme_sayisi > 1:
+                programlar = Program.coklu_baslangic(bolum_dersleri, derslikler, deneme_sayisi, isci_sayisi, motor,
+                                                     doluluk=doluluk, ogretim_uyeleri=ogretim_uyeleri, havuz=havuz)
+            else:
+                programlar = Program.ders_programi_olustur(bolum_dersleri, derslikler, motor, doluluk,
+                                                           ogretim_uyeleri)
 
-        bm_program = {gun: {saat: None for saat in saatler} for gun in gunler}
-        ym_program = {gun: {saat: None for saat in saatler} for gun in gunler}
-        
-        bm_ortak_dersler, ym_ortak_dersler, bm_ozel_dersler, ym_ozel_dersler = Program.dersleri_ayir(bm_dersler,
-                                                                                                     ym_dersler)
-        bm_lab_dersleri = Program.lab_dersleri_bul(bm_ozel_dersler, bm_ortak_dersler)
-        ym_lab_dersleri = Program.lab_dersleri_bul(ym_ozel_dersler, ym_ortak_dersler)
+            for bolum, program in programlar.items():
+                Program.programi_goster(program, bolum)
+            rapor = Program.programi_degerlendir(programlar, bolum_dersleri, derslikler or [])
+            Program.degerlendirme_raporu_yazdir(rapor, f"{donem}. Dönem")
+            if excel_dosyasi:
+                ogretim_uyesi_adlari = Program.ogretim_uyesi_haritasi({donem: bolum_dersleri})
+                for bolum, program in programlar.items():
+                    Program.excele_yazdir(program, bolum, donem, excel_dosyasi, ogretim_uyesi_adlari)
 
+            return programlar
 
-        Program.ortak_dersleri_yerlestir(bm_ortak_dersler, ym_ortak_dersler, bm_program, ym_program)
-        Program.dersi_yerlestir(bm_ozel_dersler, bm_program)
-        Program.dersi_yerlestir(ym_ozel_dersler, ym_program)
+        except Exception as e:
+            print(f"Hata oluştu: {e}")
+
+    @staticmethod
+    @olculen("ders_programi_olustur")
+    def ders_programi_olustur(bolum_dersleri, derslikler, motor="rastgele", doluluk=None, ogretim_uyeleri=None):
+        """
+        bolum_dersleri {bolum: {ders_kodu: bilgi}} için tüm bölümlerin programını tek seferde oluşturur,
+        derslikleri atar ve {bolum: program} döndürür. k bölümde ortak olan bir ders k programda aynı
+        saatlere tek yerleşim olarak konur.
+        motor: "rastgele" (karıştırıp ilk uyan güne yerleştirir) ya da "geri_izleme" (kısıt yayılımlı arama).
+        ogretim_uyeleri (OgretimUyesiDolulugu) dönemin yarıyılları arasında paylaşılırsa bir öğretim üyesi
+        yarıyıllar arasında da aynı saatte iki derse konmaz.
+        """
+        if ogretim_uyeleri is None:
+            ogretim_uyeleri = OgretimUyesiDolulugu()
+
+        cizelge = Cizelge(list(bolum_dersleri), ogretim_uyeleri, Program.ders_ogretim_uyesi_haritasi(bolum_dersleri))
+
+        Program.ders_indeksi_olustur(bolum_dersleri)
+        ortak_dersler, ozel_dersler = Program.dersleri_ayir(bolum_dersleri)
+
+        if motor == "geri_izleme":
+            birimler = Program.yerlesim_birimleri(ortak_dersler, ozel_dersler)
+            yerlesmeyenler = Program.geri_izleme_ile_yerlestir(birimler, cizelge)
+            olcum.say("yerlestirme_denemesi", len(birimler))
+            olcum.say("yerlesmeyen_ders", sum(len(dersler) for dersler, _, _ in yerlesmeyenler))
+            for dersler, saat_sayisi, _ in yerlesmeyenler:
+                for bolum, (ders_kodu, ders_adi) in dersler.items():
+                    print(f"⚠️ {bolum}: {ders_adi} ({ders_kodu}, {saat_sayisi} saat) programa yerleştirilemedi.")
+        else:
+            Program.ortak_dersleri_yerlestir(ortak_dersler, cizelge)
+            for bolum, dersler in ozel_dersler.items():
+                Program.dersi_yerlestir(dersler, cizelge, bolum)
+
+        programlar = {bolum: cizelge.sozluge_cevir(bolum) for bolum in bolum_dersleri}
 
         # Derslik ataması yap
-        Program.derslikleri_atama(bm_program, ym_program, bm_dersler, ym_dersler, bm_ortak_dersler, derslikler)
+        Program.derslikleri_atama(programlar, bolum_dersleri, derslikler, doluluk)
 
-        return bm_program, ym_program
+        return programlar
 
     @staticmethod
-    def dersleri_ayir(bm_dersler, ym_dersler):
-        bm_ortak_dersler = {
-            bm_kod: bm_ders
-            for bm_kod, bm_ders in bm_dersler.items()
-            for ym_kod, ym_ders in ym_dersler.items()
-            if bm_ders["Ders Adı"] == ym_ders["Ders Adı"] and "lab" not in bm_ders["Ders Adı"].lower()
-        }
+    def ders_ogretim_uyesi_haritasi(bolum_dersleri):
+        """ {bolum: {ders_kodu: bilgi}} -> öğretim üyesi atanmış dersler için {ders_kodu: öğretim üyesi id}. """
+        return {ders_kodu: ders["Öğretim Üyesi ID"] for dersler in bolum_dersleri.values()
+                for ders_kodu, ders in dersler.items() if ders["Öğretim Üyesi ID"] is not None}
 
-        ym_ortak_dersler = {
-            ym_kod: ym_ders
-            for bm_kod, bm_ders in bm_dersler.items()
-            for ym_kod, ym_ders in ym_dersler.items()
-            if bm_ders["Ders Adı"] == ym_ders["Ders Adı"] and "lab" not in ym_ders["Ders Adı"].lower()
-        }
-
-        bm_ozel_dersler = {k: v for k, v in bm_dersler.items() if k not in bm_ortak_dersler}
-        ym_ozel_dersler = {k: v for k, v in ym_dersler.items() if k not in ym_ortak_dersler}
+    @staticmethod
+    def ad_normallestir(ad):
+        """ Ortak ders eşleştirmesinde kullanılan ad: fazla boşluklar ve büyük/küçük harf farkı yok sayılır. """
+        return " ".join(ad.split()).casefold()
 
-        return bm_ortak_dersler, ym_ortak_dersler, bm_ozel_dersler, ym_ozel_dersler
+    @staticmethod
+    def ders_indeksi_olustur(bolum_dersleri):
+        """
+        bolum_dersleri {bolum: {ders_kodu: bilgi}} için {normal ad: {bolum: ders_kodu}} indeksini oluşturur ve
+        her dersin bilgisine bir kez hesaplanan bayrakları ekler:
+            "Lab": ders adında "lab" geçiyor mu,
+            "Ortak": başka bölümlerde de aynı adla okutulan lab olmayan bir dersse normal adı, değilse None.
+        Bir bölümde aynı adlı birden fazla ders varsa yalnızca ilki ortak sayılır.
+        """
+        indeks = defaultdict(dict)
+        for bolum, dersler in bolum_dersleri.items():
+            for ders_kodu, ders in dersler.items():
+                indeks[Program.ad_normallestir(ders["Ders Adı"])].setdefault(bolum, ders_kodu)
+
+        for bolum, dersler in bolum_dersleri.items():
+            for ders_kodu, ders in dersler.items():
+                normal_ad = Program.ad_normallestir(ders["Ders Adı"])
+                ders["Lab"] = "lab" in normal_ad
+                ortak = not ders["Lab"] and len(indeks[normal_ad]) > 1 and indeks[normal_ad][bolum] == ders_kodu
+                ders["Ortak"] = normal_ad if ortak else None
+
+        return indeks
 
     @staticmethod
-    def lab_dersleri_bul(ozel_dersler, ortak_dersler):
-        return {k: v for k, v in {**ozel_dersler, **ortak_dersler}.items() if "lab" in v["Ders Adı"].lower()}
+    @olculen("dersleri_ayir")
+    def dersleri_ayir(bolum_dersleri):
+        """ Her bölümün derslerini ortak ve bölüme özel olarak ayırır: ({bolum: ortak}, {bolum: özel}). """
+        ortak_dersler = {}
+        ozel_dersler = {}
+        for bolum, dersler in bolum_dersleri.items():
+            ortak_dersler[bolum] = {kod: ders for kod, ders in dersler.items() if ders["Ortak"]}
+            ozel_dersler[bolum] = {kod: ders for kod, ders in dersler.items() if not ders["Ortak"]}
+
+        return ortak_dersler, ozel_dersler
 
     @staticmethod
-    def uygun_saat_bul(hedef_program, gun, saat_sayisi):
-        saatler = list(range(9, 17))  # Saat aralığı 9:00-17:00
-        uygun_saatler = [saat for saat in saatler if hedef_program[gun][saat] is None]
-
-        # Uygun saatler arasında 1 saatlik boşluk bırakılacak şekilde kontrol
-        for i in range(len(uygun_saatler) - saat_sayisi):  # Boşluk eklemek için 1 saat daha ekleniyor
-            if all(hedef_program[gun][saat] is None for saat in uygun_saatler[i:i + saat_sayisi]):
-                return uygun_saatler[i]  # İlk uygun saat
-        return None
+    def ortak_ders_gruplari(bolum_ortak_dersler):
+        """ {bolum: ortak_dersler} -> her ortak ders için {bolum: (ders_kodu, ders)} grupları listesi. """
+        gruplar = defaultdict(dict)
+        for bolum, ortak_dersler in bolum_ortak_dersler.items():
+            for ders_kodu, ders in ortak_dersler.items():
+                gruplar[ders["Ortak"]][bolum] = (ders_kodu, ders)
+        return [grup for grup in gruplar.values() if len(grup) > 1]
 
     @staticmethod
-    def dersi_yerlestir(dersler, hedef_program):
+    @olculen("yerlestirme")
+    def dersi_yerlestir(dersler, cizelge, bolum):
         ders_listesi = list(dersler.items())  # Derslerin listesini oluştur
         random.shuffle(ders_listesi)  # Dersleri karıştır
+        denenen_gun = yerlesmeyen = 0  # Ölçüm sayaçları
 
         for ders_kodu, ders in ders_listesi:
             saat_sayisi = ders["Teorik"] + ders["Pratik"]  # Dersin süre hesaplaması
 
-            for gun in hedef_program:
-                if len(set(hedef_program[gun].values()) - {None}) >= 2:  # İki ders eklenmişse
+            for gun in range(len(GUNLER)):
+                if cizelge.gun_dolu_mu(bolum, gun):  # İki ders eklenmişse
                     continue
 
-                bosluklu_saat = Program.uygun_saat_bul(hedef_program, gun, saat_sayisi)
+                bosluklu_saat = cizelge.bos_blok_bul((bolum,), gun, saat_sayisi, (ders_kodu,))
                 if bosluklu_saat is None:
                     continue
 
-                    # Dersin yerleştirilmesi
-                for i in range(saat_sayisi):
-                    hedef_program[gun][bosluklu_saat + i] = (ders_kodu, ders["Ders Adı"])
-
-                bos_saat_sonraki = bosluklu_saat + saat_sayisi
-                if bos_saat_sonraki < 17:
-                    hedef_program[gun][bos_saat_sonraki] = ""
-
+                # Dersin yerleştirilmesi (bitişinden sonraki 1 saat boş bırakılır)
+                cizelge.yerlestir({bolum: (ders_kodu, ders["Ders Adı"])}, gun, bosluklu_saat, saat_sayisi)
                 break  # Ders yerleştirildikten sonra döngüden çıkıyoruz
+            else:
+                yerlesmeyen += 1
+            denenen_gun += gun + 1
+
+        olcum.say("yerlestirme_denemesi", len(ders_listesi))
+        olcum.say("denenen_gun", denenen_gun)
+        olcum.say("yerlesmeyen_ders", yerlesmeyen)
 
     @staticmethod
-    def ortak_dersleri_yerlestir(bm_ortak_dersler, ym_ortak_dersler, bm_program, ym_program):
-        ortak_dersler = [
-            (bm_kod, bm_ders, ym_kod, ym_ders)
-            for bm_kod, bm_ders in bm_ortak_dersler.items()
-            for ym_kod, ym_ders in ym_ortak_dersler.items()
-            if bm_ders["Ders Adı"] == ym_ders["Ders Adı"]
-        ]
+    @olculen("yerlestirme")
+    def ortak_dersleri_yerlestir(bolum_ortak_dersler, cizelge):
+        ortak_dersler = Program.ortak_ders_gruplari(bolum_ortak_dersler)
 
         random.shuffle(ortak_dersler)
+        denenen_gun = yerlesmeyen = 0  # Ölçüm sayaçları
+
+        for grup in ortak_dersler:
+            _, ilk_ders = next(iter(grup.values()))
+            saat_sayisi = ilk_ders["Teorik"] + ilk_ders["Pratik"]
+
+            for gun in range(len(GUNLER)):
+                # Ortak ders, okutulduğu tüm bölümlerde boş olan aynı saatlere yerleştirilir
+                bos_saat = cizelge.bos_blok_bul(grup, gun, saat_sayisi, [ders_kodu for ders_kodu, _ in grup.values()])
+
+                if bos_saat is not None:
+                    cizelge.yerlestir({bolum: (ders_kodu, ders["Ders Adı"]) for bolum, (ders_kodu, ders) in grup.items()},
+                                      gun, bos_saat, saat_sayisi)
+                    break
+            else:
+                yerlesmeyen += len(grup)
+            denenen_gun += gun + 1
+
+        olcum.say("yerlestirme_denemesi", len(ortak_dersler))
+        olcum.say("denenen_gun", denenen_gun)
+        olcum.say("yerlesmeyen_ders", yerlesmeyen)
+
+    # ---PARALEL ÇOKLU DENEME---
+
+    @staticmethod
+    def program_puani(programlar, dersler):
+        """ Programın ağırlıklı puanı (büyük olan daha iyi, 0 en iyisi). """
+        return Program.programi_degerlendir(programlar, dersler)["puan"]
 
-        for bm_kod, bm_ders, ym_kod, ym_ders in ortak_dersler:
-            saat_sayisi = bm_ders["Teorik"] + bm_ders["Pratik"]
+    @staticmethod
+    def coklu_baslangic(bolum_dersleri, derslikler, deneme_sayisi, isci_sayisi=None, motor="rastgele",
+                        tohum=None, doluluk=None, ogretim_uyeleri=None, havuz=None):
+        """
+        Programı farklı tohumlarla deneme_sayisi kez, işçi süreçlerde bağımsız olarak oluşturur ve
+        puanı en yüksek olanı döndürür. İşçilere yalnızca sözlükler ve DerslikBilgisi gönderilir.
+        doluluk ve ogretim_uyeleri verilirse her işçi onların kopyasıyla çalışır, seçilen program sonra
+        onlara işlenir. havuz (ProcessPoolExecutor) verilirse denemeler onda çalışır; verilmezse bu çağrı için
+        bir havuz açılıp kapatılır.
+        """
+        if tohum is None:
+            tohum = random.randrange(2 ** 32)  # random.seed verildiyse sonuç tekrarlanabilir olur
+
+        derslik_bilgileri = [DerslikBilgisi(d.kod, d.kapasite, d.statu) for d in derslikler or []]
+        doluluk_kopyasi = doluluk.kopya() if doluluk is not None else None
+        ogretim_uyeleri_kopyasi = ogretim_uyeleri.kopya() if ogretim_uyeleri is not None else None
+        denemeler = [(tohum + i, bolum_dersleri, derslik_bilgileri, motor, doluluk_kopyasi, ogretim_uyeleri_kopyasi)
+                     for i in range(deneme_sayisi)]
+
+        isci_sayisi = min(isci_sayisi or os.cpu_count() or 1, deneme_sayisi)
+        parca_boyutu = max(1, deneme_sayisi // (isci_sayisi * 4))
+        if havuz is None:
+            with ProcessPoolExecutor(max_workers=isci_sayisi) as havuz:
+                sonuclar = list(havuz.map(coklu_baslangic_denemesi, denemeler, chunksize=parca_boyutu))
+        else:
+            sonuclar = list(havuz.map(coklu_baslangic_denemesi, denemeler, chunksize=parca_boyutu))
 
-            for gun in bm_program:
-                bos_saat = Program.uygun_saat_bul(bm_program, gun, saat_sayisi)
+        # Eşit puanda küçük tohumlu deneme seçilir (sonuç işçi sayısından bağımsız)
+        puan, deneme_tohumu, programlar = max(sonuclar, key=lambda sonuc: (sonuc[0], -sonuc[1]))
+        if doluluk is not None:
+            doluluk.programlari_isle(programlar)
+        if ogretim_uyeleri is not None:
+            ogretim_uyeleri.programlari_isle(programlar, Program.ders_ogretim_uyesi_haritasi(bolum_dersleri))
+        print(f"✅ {deneme_sayisi} deneme arasından en iyi program seçildi (tohum: {deneme_tohumu}, puan: {puan}).")
+        return programlar
 
-                if bos_saat:
-                    # Dersin yerleştirilmesi
-                    for i in range(saat_sayisi):
-                        bm_program[gun][bos_saat + i] = (bm_kod, bm_ders["Ders Adı"])
-                        ym_program[gun][bos_saat + i] = (ym_kod, ym_ders["Ders Adı"])
+    # ---GERİ İZLEMELİ YERLEŞTİRME---
 
-                    # **Boşluk ekleniyor**: Dersin bitişinden 1 saat sonrasına boşluk
-                    bos_saat_sonraki = bos_saat + saat_sayisi
-                    if bos_saat_sonraki < 17:  # Program sınırlarını aşmamak için kontrol
-                        bm_program[gun][bos_saat_sonraki] = ""
-                        ym_program[gun][bos_saat_sonraki] = ""
+    @staticmethod
+    def yerlesim_birimleri(ortak_dersler, ozel_dersler):
+        """
+        Yerleştirilecek birimleri (dersler, saat_sayisi, gunluk_sinir) listesi olarak döndürür.
+        dersler {bolum: (ders_kodu, ders_adi)} - ortak bir ders tüm bölümlerinde tek birimdir.
+        Rastgele motordaki gibi günlük ders sınırı yalnızca bölüme özel derslere uygulanır.
+        """
+        birimler = []
+        for grup in Program.ortak_ders_gruplari(ortak_dersler):
+            _, ilk_ders = next(iter(grup.values()))
+            birimler.append(({bolum: (ders_kodu, ders["Ders Adı"]) for bolum, (ders_kodu, ders) in grup.items()},
+                             ilk_ders["Teorik"] + ilk_ders["Pratik"], False))
+
+        for bolum, dersler in ozel_dersler.items():
+            for ders_kodu, ders in dersler.items():
+                birimler.append(({bolum: (ders_kodu, ders["Ders Adı"])}, ders["Teorik"] + ders["Pratik"], True))
+
+        return birimler
 
+    @staticmethod
+    def birim_secenekleri(cizelge, birim):
+        """ Birimin yerleşebileceği (gun, baslangic) seçenekleri; az yüklü günler önce gelir. """
+        dersler, saat_sayisi, gunluk_sinir = birim
+        secenekler = []
+        for gun in range(len(GUNLER)):
+            if gunluk_sinir and any(cizelge.gun_dolu_mu(bolum, gun) for bolum in dersler):
+                continue
+            baslangiclar = cizelge.uygun_baslangiclar(dersler, gun, saat_sayisi, [kod for kod, _ in dersler.values()])
+            while baslangiclar:
+                en_dusuk = baslangiclar & -baslangiclar
+                secenekler.append((gun, en_dusuk.bit_length() - 1))
+                baslangiclar ^= en_dusuk
+        return secenekler
+
+    @staticmethod
+    def yerlesim_imkansiz_mi(birimler, cizelge):
+        """
+        Birimlerin hepsinin aynı anda yerleşemeyeceği kesinse True döndürür (gerekli koşullar, ucuz kontrol):
+        bir bölümün derslerinin saatleri ve sonlarındaki boşluklar (günün son dersi hariç) bölümün boş saatlerine
+        sığmalı, bölüme özel ders sayısı da günlük ders sınırının kalan kapasitesini aşmamalıdır.
+        """
+        gerekli_saat = defaultdict(int)
+        ozel_ders_sayisi = defaultdict(int)
+        for dersler, saat_sayisi, gunluk_sinir in birimler:
+            for bolum in dersler:
+                gerekli_saat[bolum] += saat_sayisi + 1
+                ozel_ders_sayisi[bolum] += gunluk_sinir
+
+        for bolum, saat in gerekli_saat.items():
+            bos_saat = sum(len(SAATLER) - bin(maske).count("1") for maske in cizelge.maske[bolum])
+            if saat - len(GUNLER) > bos_saat:
+                return True
+            kalan_kapasite = sum(max(0, GUNLUK_DERS_SINIRI - sayi) for sayi in cizelge.ders_sayisi[bolum])
+            if ozel_ders_sayisi[bolum] > kalan_kapasite:
+                return True
+        return False
+
+    @staticmethod
+    @olculen("yerlestirme")
+    def geri_izleme_ile_yerlestir(birimler, cizelge, sure_siniri=GERI_IZLEME_SURE_SINIRI):
+        """
+        Birimleri geri izleme + ileri kontrol ile yerleştirir: her adımda seçeneği en az olan birim seçilir,
+        bir yerleşim başka bir birimin tüm seçeneklerini kapatırsa geri dönülür. Arama bir düğüm sınırıyla
+        başlar, sınır aşılırsa karıştırılmış sırayla ve iki katı sınırla yeniden başlar. Birimlerin hepsinin
+        sığmayacağı baştan belliyse ya da iki katı sınırla en iyi sonuç iyileşmediyse yeniden başlanmaz. Süre
+        sınırı dolarsa ya da tüm birimler aynı anda yerleşemiyorsa en çok birimin yerleştiği durum kullanılır,
+        kalanlar ilk uyan yere konmaya çalışılır. Yerleştirilemeyen birimler liste olarak döndürülür.
+        """
+        bitis_zamani = time.perf_counter() + sure_siniri
+        yerlesimler = []  # [(birim, gun, baslangic)]
+        en_iyi = []
+        sure_doldu = False
+        durdur = False  # Düğüm ya da süre sınırı aşıldı, arama geri sarılıyor
+        dugum_sayisi = 0
+        dugum_siniri = GERI_IZLEME_ILK_DUGUM_SINIRI
+
+        # Hiç seçeneği olmayan birimler aramaya hiç katılmaz
+        yerlesmeyenler, kalanlar = [], []
+        for birim in birimler:
+            (kalanlar if Program.birim_secenekleri(cizelge, birim) else yerlesmeyenler).append(birim)
+        imkansiz = Program.yerlesim_imkansiz_mi(kalanlar, cizelge)
+        onceki_en_iyi = -1
+
+        def ara(kalanlar):
+            nonlocal en_iyi, sure_doldu, durdur, dugum_sayisi
+            if len(yerlesimler) > len(en_iyi):
+                en_iyi = list(yerlesimler)
+            if not kalanlar:
+                return True
+            dugum_sayisi += 1
+            olcum.say("geri_izleme_dugumu")
+            if dugum_sayisi > dugum_siniri:
+                durdur = True
+                return False
+            if time.perf_counter() > bitis_zamani:
+                sure_doldu = durdur = True
+                return False
+
+            # En kısıtlı birim önce, eşitlikte uzun ders (ileri kontrol: seçeneği kalmayan birim varsa dal çıkmaz)
+            secilen, secenekler = None, None
+            for birim in kalanlar:
+                birim_secenekleri = Program.birim_secenekleri(cizelge, birim)
+                if not birim_secenekleri:
+                    return False
+                if secenekler is None or (len(birim_secenekleri), -birim[1]) < (len(secenekler), -secilen[1]):
+                    secilen, secenekler = birim, birim_secenekleri
+
+            diger_birimler = [birim for birim in kalanlar if birim is not secilen]
+            random.shuffle(secenekler)
+            secenekler.sort(key=lambda secenek: max(cizelge.ders_sayisi[b][secenek[0]] for b in secilen[0]))
+
+            dersler, saat_sayisi, _ = secilen
+            for gun, baslangic in secenekler:
+                cizelge.yerlestir(dersler, gun, baslangic, saat_sayisi)
+                yerlesimler.append((secilen, gun, baslangic))
+                if ara(diger_birimler):
+                    return True
+                yerlesimler.pop()
+                cizelge.kaldir(dersler, gun, baslangic, saat_sayisi)
+                if durdur:
                     break
+            return False
+
+        while True:
+            dugum_sayisi = 0
+            durdur = False
+            if ara(kalanlar):
+                return yerlesmeyenler
+            # Sınıra takılmadan biten arama tüm olasılıkları denemiştir: hepsi aynı anda yerleşemez
+            if sure_doldu or not durdur:
+                break
+            # Hepsinin sığmayacağı kesinse ya da iki katı düğümle en iyi sonuç iyileşmediyse yeniden başlanmaz
+            if imkansiz or len(en_iyi) <= onceki_en_iyi:
+                break
+            onceki_en_iyi = len(en_iyi)
+            olcum.say("geri_izleme_yeniden_baslama")
+            random.shuffle(kalanlar)
+            dugum_siniri *= 2
+
+        if sure_doldu:
+            print(f"⚠️ Geri izleme {sure_siniri} saniyelik süre sınırına ulaştı, en iyi kısmi program kullanılıyor.")
+
+        # En çok birimin yerleştiği durumu uygula, kalanları ilk uyan yere koymayı dene
+        for birim, gun, baslangic in en_iyi:
+            cizelge.yerlestir(birim[0], gun, baslangic, birim[1])
+        yerlesenler = {id(birim) for birim, _, _ in en_iyi}
+        for birim in kalanlar:
+            if id(birim) in yerlesenler:
+                continue
+            secenekler = Program.birim_secenekleri(cizelge, birim)
+            if secenekler:
+                gun, baslangic = secenekler[0]
+                cizelge.yerlestir(birim[0], gun, baslangic, birim[1])
+            else:
+                yerlesmeyenler.append(birim)
+
+        return yerlesmeyenler
+
+    # ---PROGRAM DEĞERLENDİRME---
+
+    @staticmethod
+    def programi_degerlendir(programlar, dersler, derslikler=()):
+        """
+        programlar {bolum: program} ve dersler {bolum: {ders_kodu: bilgi}} için ölçüleri hesaplar:
+        yerleştirilemeyen dersler, günlük yük (saat), dersler arasındaki boş saatler, derslik doluluğu
+        ve PUAN_AGIRLIKLARI ile hesaplanan ağırlıklı puan.
+        """
+        yerlesen = set()
+        gunluk_yuk = {}
+        bosluklar = {}
+        derslik_saatleri = defaultdict(set)  # {derslik: {(gun, saat)}} - ortak dersler bir kez sayılır
+
+        for bolum, program in programlar.items():
+            yukler = []
+            bos_saat = 0
+            for gun, saatler in program.items():
+                dolu_saatler = [saat for saat, ders in saatler.items() if ders]
+                for saat in dolu_saatler:
+                    ders = saatler[saat]
+                    yerlesen.add(ders[0])
+                    if len(ders) > 2 and ders[2]:
+                        derslik_saatleri[ders[2]].add((gun, saat))
+                yukler.append(len(dolu_saatler))
+                # İlk ve son ders arasındaki boş saatler (zorunlu "" boşlukları hariç)
+                if dolu_saatler:
+                    bos_saat += sum(1 for saat in range(dolu_saatler[0], dolu_saatler[-1]) if saatler[saat] is None)
+            gunluk_yuk[bolum] = yukler
+            bosluklar[bolum] = bos_saat
+
+        yerlesmeyenler = [(bolum, ders_kodu, ders["Ders Adı"])
+                          for bolum, bolum_dersleri in dersler.items()
+                          for ders_kodu, ders in bolum_dersleri.items() if ders_kodu not in yerlesen]
+        dengesizlik = sum(max(yukler) - min(yukler) for yukler in gunluk_yuk.values() if yukler)
+
+        toplam_slot = len(derslikler) * len(GUNLER) * len(SAATLER)
+        derslik_doluluk = {kod: len(saatler) for kod, saatler in derslik_saatleri.items()}
+
+        puan = -(PUAN_AGIRLIKLARI["yerlesmeyen"] * len(yerlesmeyenler)
+                 + PUAN_AGIRLIKLARI["bosluk"] * sum(bosluklar.values())
+                 + PUAN_AGIRLIKLARI["dengesizlik"] * dengesizlik)
+
+        return {
+            "puan": puan,
+            "yerlesmeyenler": yerlesmeyenler,
+            "bosluklar": bosluklar,
+            "gunluk_yuk": gunluk_yuk,
+            "derslik_doluluk": derslik_doluluk,
+            "derslik_kullanim_orani": sum(derslik_doluluk.values()) / toplam_slot if toplam_slot else 0.0,
+        }
+
+    @staticmethod
+    def kayitli_programlari_degerlendir(donemler):
+        """
+        Veritabanına kayıtlı programları (onarılmış ya da artımlı oluşturmada atlanmış olanlar dahil) yeniden
+        oluşturmadan değerlendirir, raporları yazdırır ve {donem: rapor} döndürür; hata olursa None.
+        """
+        try:
+            kayitli_programlar = Program.kayitli_programlari_oku(donemler)
+            donem_dersleri = Program.donem_derslerini_oku(donemler)
+            derslikler = Program.derslikleri_oku() or []
+        except Exception as e:
+            print(f"Hata oluştu: {e}")
+            return None
+
+        raporlar = {}
+        for donem in donemler:
+            programlar = kayitli_programlar.get(donem)
+            if not programlar:
+                print(f"\n⚠️ {donem}. Dönem için kayıtlı program yok.")
+                continue
+
+            # Kayıtlı programı olmayan bölümler boş programla değerlendirilir (dersleri yerleşmemiş sayılır)
+            bolum_dersleri = donem_dersleri.get(donem, {})
+            for bolum in bolum_dersleri:
+                programlar.setdefault(bolum, Program.bos_program())
+            raporlar[donem] = Program.programi_degerlendir(programlar, bolum_dersleri, derslikler)
+            Program.degerlendirme_raporu_yazdir(raporlar[donem], f"{donem}. Dönem (kayıtlı)")
+
+        return raporlar
+
+    @staticmethod
+    def degerlendirme_raporu_yazdir(rapor, baslik=""):
+        """ programi_degerlendir() sonucunu ekrana yazdırır. """
+        print(f"\n📊 {baslik} Program Değerlendirmesi (puan: {rapor['puan']})")
+        for bolum, yukler in rapor["gunluk_yuk"].items():
+            print(f"  {bolum}: günlük yük (saat) {dict(zip(GUNLER, yukler))}, boş saat: {rapor['bosluklar'][bolum]}")
+        print(f"  Derslik kullanımı: %{rapor['derslik_kullanim_orani'] * 100:.1f} "
+              f"({len(rapor['derslik_doluluk'])} derslik kullanıldı)")
+        if rapor["yerlesmeyenler"]:
+            print("  ⚠️ Yerleştirilemeyen dersler:")
+            for bolum, ders_kodu, ders_adi in rapor["yerlesmeyenler"]:
+                print(f"     {bolum}: {ders_adi} ({ders_kodu})")
+        else:
+            print("  ✅ Tüm dersler yerleştirildi.")
 
     @staticmethod
     def programi_goster(program, bolum_adi):
@@ -984,24 +2594,44 @@ class Program:
 
     # ---EXCELE YAZDIRMA İŞLEMLERİ---
 
-    def excele_yazdir(program, bolum_adi, donem):
-        dosya_adi = "ProgramŞablon.xlsx"  # Excel dosya adı
+    def ogretim_uyesi_haritasi(donem_dersleri):
+        """ donem_derslerini_oku sonucundan {ders_kodu: öğretim üyesi adı} haritası çıkarır (sorgu yapılmaz). """
+        return {ders_kodu: ders["Öğretim Üyesi"]
+                for bolum_dersleri in donem_dersleri.values()
+                for dersler in bolum_dersleri.values()
+                for ders_kodu, ders in dersler.items() if ders.get("Öğretim Üyesi")}
+
+    def ogretim_uyesi_adlari_oku():
+        """ Tüm derslerin {ders_kodu: öğretim üyesi adı} haritasını tek sorguda çeker. """
+        return dict(session.execute(
+            select(Ders.kod, Kullanicilar.ad).join(Kullanicilar, Ders.ogretim_uyesi_id == Kullanicilar.id)
+        ).all())
+
+    @olculen("excele_yazdir")
+    def excele_yazdir(program, bolum_adi, donem, dosya_adi=SABLON_DOSYASI, ogretim_uyesi_adlari=None):
+        import openpyxl
 
         try:
+            if ogretim_uyesi_adlari is None:
+                ogretim_uyesi_adlari = Program.ogretim_uyesi_adlari_oku()
+
             # Excel dosyasını aç
             wb = openpyxl.load_workbook(dosya_adi)
 
             # Eğer sayfa zaten varsa uyarı ver, yoksa oluştur
             if bolum_adi in wb.sheetnames:
                 print(f"⚠️ '{bolum_adi}' adlı sayfa zaten mevcut. Yeni sayfa oluşturulmadı.")
-                Program.program_excele_yaz(wb, program, bolum_adi, donem)
+                Program.program_excele_yaz(wb, program, bolum_adi, donem, ogretim_uyesi_adlari)
                 wb.save(dosya_adi)
+                olcum.say("calisma_kitabi_kaydi")
             else:
                 # Burada program içeriğini yazdırabilirsin, şu an boş sayfa oluşturuluyor
                 Program.yeni_sayfa_olustur(wb, bolum_adi)
                 wb.save(dosya_adi)
-                Program.program_excele_yaz(wb, program, bolum_adi, donem)
+                olcum.say("calisma_kitabi_kaydi")
+                Program.program_excele_yaz(wb, program, bolum_adi, donem, ogretim_uyesi_adlari)
                 wb.save(dosya_adi)
+                olcum.say("calisma_kitabi_kaydi")
                 print(f"✅ '{bolum_adi}' sayfası başarıyla eklendi ve program yazıldı.")
 
             print(f"\n✅ '{bolum_adi}' için Program yazıldı.")
@@ -1009,76 +2639,134 @@ class Program:
         except Exception as e:
             print(f"Hata oluştu: {e}")
 
-    def yeni_sayfa_olustur(wb, bolum_adi):
+    @olculen("donemi_excele_yazdir")
+    def donemi_excele_yazdir(donem_programlari, dosya_adi=SABLON_DOSYASI, ogretim_uyesi_adlari=None):
+        """
+        Bir dönemin tüm programlarını ({donem: {bolum: program}}) şablonu bir kez açıp tüm bölüm ve
+        yarıyıl sütunlarını yazarak tek kayıtta Excel'e yazar. Başarılıysa True döndürür.
+        ogretim_uyesi_adlari ({ders_kodu: ad}) verilmezse tek sorguda çekilir.
+        """
+        import openpyxl
 
+        try:
+            if ogretim_uyesi_adlari is None:
+                ogretim_uyesi_adlari = Program.ogretim_uyesi_adlari_oku()
+
+            # Excel dosyasını aç
+            wb = openpyxl.load_workbook(dosya_adi)
+
+            for donem, programlar in donem_programlari.items():
+                for bolum_adi, program in programlar.items():
+                    # Eğer sayfa yoksa oluştur
+                    if bolum_adi not in wb.sheetnames:
+                        Program.yeni_sayfa_olustur(wb, bolum_adi)
+                        print(f"✅ '{bolum_adi}' sayfası başarıyla eklendi.")
+                    Program.program_excele_yaz(wb, program, bolum_adi, donem, ogretim_uyesi_adlari)
+
+            wb.save(dosya_adi)
+            olcum.say("calisma_kitabi_kaydi")
+            print(f"\n✅ Programlar '{dosya_adi}' dosyasına yazıldı.")
+            return True
+
+        except Exception as e:
+            print(f"Hata oluştu: {e}")
+            return False
+
+    @olculen("bolumleri_paralel_yazdir")
+    def bolumleri_paralel_yazdir(donem_programlari, klasor, dosya_oneki="ders_programi", ogretim_uyesi_adlari=None,
+                                 isci_sayisi=None, birlesik_dosya=None, sablon=SABLON_DOSYASI):
+        """
+        Her bölümün programını şablondan kendi Excel dosyasına (klasor/dosya_oneki_BOLUM.xlsx) işçi süreçlerde
+        paralel yazar. İşçilere yalnızca sözlükler gönderilir. birlesik_dosya verilirse bölüm dosyaları sonunda
+        tek dosyada birleştirilir. Tüm dosyalar yazıldıysa True döndürür.
+        """
+        try:
+            if ogretim_uyesi_adlari is None:
+                ogretim_uyesi_adlari = Program.ogretim_uyesi_adlari_oku()
+        except Exception as e:
+            print(f"Hata oluştu: {e}")
+            return False
+
+        # {bolum: {donem: program}} - her bölüm tek bir işçide yazılır
+        bolum_programlari = defaultdict(dict)
+        for donem, programlar in donem_programlari.items():
+            for bolum_adi, program in programlar.items():
+                bolum_programlari[bolum_adi][donem] = program
+        if not bolum_programlari:
+            return True
+
+        isler = []
+        for bolum_adi, programlar in bolum_programlari.items():
+            kodlar = {ders[0] for program in programlar.values()
+                      for saatler in program.values() for ders in saatler.values() if ders}
+            adlar = {kod: ogretim_uyesi_adlari[kod] for kod in kodlar if kod in ogretim_uyesi_adlari}
+            isler.append((bolum_adi, programlar, adlar, sablon,
+                          os.path.join(klasor, f"{dosya_oneki}_{bolum_adi}.xlsx")))
+
+        isci_sayisi = min(isci_sayisi or os.cpu_count() or 1, len(isler))
+        with ProcessPoolExecutor(max_workers=isci_sayisi) as havuz:
+            sonuclar = list(havuz.map(bolum_calisma_kitabi_yaz, isler))
+
+        basarili = all(yazildi for _, _, yazildi in sonuclar)
+        yazilan = sum(yazildi for _, _, yazildi in sonuclar)
+        olcum.say("calisma_kitabi_kaydi", yazilan)  # İşçilerdeki kayıtlar burada sayılır
+        print(f"\n✅ {yazilan}/{len(sonuclar)} bölüm dosyası yazıldı.")
+
+        if birlesik_dosya and basarili:
+            basarili = Program.bolum_dosyalarini_birlestir(
+                {bolum_adi: dosya_adi for bolum_adi, dosya_adi, _ in sonuclar}, birlesik_dosya, sablon)
+        return basarili
+
+    def bolum_dosyalarini_birlestir(bolum_dosyalari, birlesik_dosya, sablon=SABLON_DOSYASI):
+        """
+        {bolum: dosya} bölüm dosyalarını şablon kopyası sayfalara değerleri aktararak tek dosyada birleştirir.
+        Başarılıysa True döndürür.
+        """
+        import openpyxl
+
+        try:
+            wb = openpyxl.load_workbook(sablon)
+            for bolum_adi, dosya_adi in bolum_dosyalari.items():
+                kaynak = openpyxl.load_workbook(dosya_adi, read_only=True)
+                try:
+                    hedef = wb[bolum_adi] if bolum_adi in wb.sheetnames else Program.yeni_sayfa_olustur(wb, bolum_adi)
+                    for satir, degerler in enumerate(kaynak[bolum_adi].iter_rows(values_only=True), start=1):
+                        for sutun, deger in enumerate(degerler, start=1):
+                            if deger is not None:
+                                hedef.cell(row=satir, column=sutun, value=deger)
+                finally:
+                    kaynak.close()
+
+            wb.save(birlesik_dosya)
+            olcum.say("calisma_kitabi_kaydi")
+            print(f"\n✅ Bölüm dosyaları '{birlesik_dosya}' dosyasında birleştirildi.")
+            return True
+
+        except Exception as e:
+            print(f"Hata oluştu: {e}")
+            return False
+
+    def yeni_sayfa_olustur(wb, bolum_adi):
+        """
+        Şablon (ilk) sayfayı bölüm adıyla kopyalar. Hücreler şablonun stil kayıtlarını paylaşır, böylece
+        dosyanın stil tablosu büyümez; sütun genişlikleri, satır yükseklikleri ve birleşik hücreler korunur.
+        """
         try:
             # İlk sayfayı al
             ilk_sayfa = wb.worksheets[0]
 
-            # Yeni bir sayfa oluştur ve ilk sayfanın içeriğini kopyala
-            yeni_sayfa = wb.create_sheet(title=bolum_adi)  # Yeni sheet adı bölüm adı olacak
-
-            # Hücre genişliklerini kopyala
-            for col in range(1, ilk_sayfa.max_column + 1):
-                col_letter = get_column_letter(col)
-                yeni_sayfa.column_dimensions[col_letter].width = ilk_sayfa.column_dimensions[col_letter].width
-
-            # Hücre verileri ve formatları kopyala
-            for row in ilk_sayfa.iter_rows():
-                for cell in row:
-                    # Yeni sayfada aynı hücreyi oluştur
-                    yeni_hucre = yeni_sayfa[cell.coordinate]
-                    yeni_hucre.value = cell.value  # Değeri kopyala
-
-                    # Hücre stilini kopyala (font, renk, kenarlık, hizalama)
-                    if cell.font:
-                        yeni_hucre.font = openpyxl.styles.Font(
-                            name=cell.font.name,
-                            size=cell.font.size,
-                            bold=cell.font.bold,
-                            italic=cell.font.italic,
-                            vertAlign=cell.font.vertAlign,
-                            underline=cell.font.underline,
-                            strike=cell.font.strike,
-                            color=cell.font.color
-                        )
-                    if cell.fill:
-                        yeni_hucre.fill = openpyxl.styles.PatternFill(
-                            fill_type=cell.fill.fill_type,
-                            fgColor=cell.fill.fgColor,
-                            bgColor=cell.fill.bgColor
-                        )
-                    if cell.border:
-                        yeni_hucre.border = openpyxl.styles.Border(
-                            left=cell.border.left,
-                            right=cell.border.right,
-                            top=cell.border.top,
-                            bottom=cell.border.bottom,
-                            diagonal=cell.border.diagonal,
-                            diagonal_direction=cell.border.diagonal_direction,
-                            outline=cell.border.outline,
-                            vertical=cell.border.vertical,
-                            horizontal=cell.border.horizontal
-                        )
-                    if cell.alignment:
-                        yeni_hucre.alignment = openpyxl.styles.Alignment(
-                            horizontal=cell.alignment.horizontal,
-                            vertical=cell.alignment.vertical,
-                            text_rotation=cell.alignment.text_rotation,
-                            wrap_text=cell.alignment.wrap_text,
-                            shrink_to_fit=cell.alignment.shrink_to_fit,
-                            indent=cell.alignment.indent
-                        )
-                    if cell.number_format:
-                        yeni_hucre.number_format = cell.number_format
+            # İlk sayfanın kopyası yeni sayfa olur (yeni sheet adı bölüm adı olacak)
+            yeni_sayfa = wb.copy_worksheet(ilk_sayfa)
+            yeni_sayfa.title = bolum_adi
 
             yeni_sayfa["C1"] = bolum_adi
-
+            return yeni_sayfa
 
         except Exception as e:
             print(f" Hata oluştu: {e}")
 
-    def program_excele_yaz(wb, program, bolum_adi, donem):
+    def program_excele_yaz(wb, program, bolum_adi, donem, ogretim_uyesi_adlari):
+        """ Programı bölüm sayfasında dönemin sütununa yazar; öğretim üyesi adları haritadan okunur. """
         try:
             satir = 4  # Başlangıç satırı
             sayfa = wb[bolum_adi]
@@ -1096,12 +2784,12 @@ class Program:
                     hucre = f"{sutun}{satir}"
                     
                     if ders_bilgisi and ders_bilgisi != "":
-                        ders_kodu, ders_adi, sinif = ders_bilgisi
-                        kod = ders_kodu[3:]
+                        ders_kodu, ders_adi = ders_bilgisi[:2]
+                        sinif = ders_bilgisi[2] if len(ders_bilgisi) > 2 else "Derslik yok"
+                        kod = ders_kodu.split("_", 1)[-1]  # Bölüm öneki (BM_, YM_, ...) atılır
                         
                         # Öğretim üyesini bul
-                        ders = session.query(Ders).filter_by(kod=ders_kodu).first()
-                        ogretim_uyesi_adi = ders.ogretim_uyesi.ad if ders and ders.ogretim_uyesi else "Belirtilmemiş"
+                        ogretim_uyesi_adi = ogretim_uyesi_adlari.get(ders_kodu) or "Belirtilmemiş"
                         
                         sayfa[hucre] = f"{kod} - {ders_adi}\n{ogretim_uyesi_adi} ({sinif})\n"
                     else:
@@ -1117,5 +2805,318 @@ class Program:
         except Exception as e:
             print(f"Programı yazarken hata oluştu: {e}")
 
-# Menü çalıştırılıyor
-Sistem.menu()
\ No newline at end of file
+    # ---DIŞA AKTARMA (AKIŞLI)---
+
+    def program_satirlari(donem_programlari, ogretim_uyesi_adlari):
+        """
+        {donem: {bolum: program}} yapısındaki dolu saatleri tek tek satır (sözlük) olarak üretir.
+        Satırlar bellekte biriktirilmez; dışa aktarıcılar her satırı okundukça yazar.
+        """
+        for donem, programlar in donem_programlari.items():
+            for bolum, program in programlar.items():
+                for gun, saatler in program.items():
+                    for saat, ders_bilgisi in saatler.items():
+                        if not ders_bilgisi:
+                            continue
+                        ders_kodu, ders_adi = ders_bilgisi[:2]
+                        yield {
+                            "donem": donem,
+                            "bolum": bolum,
+                            "gun": gun,
+                            "saat": saat,
+                            "ders_kodu": ders_kodu,
+                            "ders_adi": ders_adi,
+                            "ogretim_uyesi": ogretim_uyesi_adlari.get(ders_kodu) or "",
+                            "derslik": ders_bilgisi[2] if len(ders_bilgisi) > 2 else "",
+                        }
+
+    def ders_bloklari(satirlar):
+        """ Aynı gün art arda gelen aynı ders saatlerini tek blokta birleştirir: (ilk satır, saat sayısı). """
+        blok, saat_sayisi = None, 0
+        for satir in satirlar:
+            if blok and all(satir[alan] == blok[alan] for alan in ("donem", "bolum", "gun", "ders_kodu")) \
+                    and satir["saat"] == blok["saat"] + saat_sayisi:
+                saat_sayisi += 1
+                continue
+            if blok:
+                yield blok, saat_sayisi
+            blok, saat_sayisi = satir, 1
+        if blok:
+            yield blok, saat_sayisi
+
+    def csv_yaz(satirlar, dosya_adi):
+        with open(dosya_adi, "w", newline="", encoding="utf-8") as f:
+            yazici = csv.DictWriter(f, fieldnames=DISA_AKTARIM_ALANLARI)
+            yazici.writeheader()
+            for satir in satirlar:
+                yazici.writerow(satir)
+
+    def jsonl_yaz(satirlar, dosya_adi):
+        with open(dosya_adi, "w", encoding="utf-8") as f:
+            for satir in satirlar:
+                f.write(json.dumps(satir, ensure_ascii=False))
+                f.write("\n")
+
+    def xlsx_akisli_yaz(satirlar, dosya_adi):
+        """ Şablon kullanmadan openpyxl write_only kipiyle yazar; satırlar diske aktıkça bellekten çıkar. """
+        import openpyxl
+
+        wb = openpyxl.Workbook(write_only=True)
+        sayfa = wb.create_sheet("Program")
+        sayfa.append(DISA_AKTARIM_ALANLARI)
+        for satir in satirlar:
+            sayfa.append([satir[alan] for alan in DISA_AKTARIM_ALANLARI])
+        wb.save(dosya_adi)
+        olcum.say("calisma_kitabi_kaydi")
+
+    def ics_metni(metin):
+        """ iCalendar TEXT değerindeki özel karakterleri kaçışlar. """
+        return str(metin).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+    def ics_satiri(satir):
+        """ 75 baytı aşan iCalendar satırlarını RFC 5545'e göre katlar. """
+        veri = satir.encode("utf-8")
+        parcalar = []
+        while len(veri) > 75:
+            kesim = 75 if not parcalar else 74
+            while kesim and (veri[kesim] & 0xC0) == 0x80:  # UTF-8 karakteri ortadan bölünmez
+                kesim -= 1
+            parcalar.append(veri[:kesim])
+            veri = veri[kesim:]
+        parcalar.append(veri)
+        return "\r\n ".join(parca.decode("utf-8") for parca in parcalar) + "\r\n"
+
+    def ics_yaz(satirlar, dosya_adi, donem_baslangici=None, hafta_sayisi=DONEM_HAFTA_SAYISI):
+        """
+        Her ders bloğunu donem_baslangici (bir Pazartesi; verilmezse bu haftanın Pazartesi'si) tarihinden
+        başlayıp hafta_sayisi kez tekrarlanan bir VEVENT olarak yazar.
+        """
+        if donem_baslangici is None:
+            bugun = date.today()
+            donem_baslangici = bugun - timedelta(days=bugun.weekday())
+        damga = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+        with open(dosya_adi, "w", newline="", encoding="utf-8") as f:
+            f.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Ders Programi//TR\r\n")
+            for blok, saat_sayisi in Program.ders_bloklari(satirlar):
+                gun = donem_baslangici + timedelta(days=GUN_INDEKSI[blok["gun"]])
+                baslangic = datetime(gun.year, gun.month, gun.day, blok["saat"])
+                bitis = baslangic + timedelta(hours=saat_sayisi)
+                ozet = f"{blok['ders_kodu']} - {blok['ders_adi']}"
+                aciklama = f"{blok['bolum']} {blok['donem']}. dönem"
+                if blok["ogretim_uyesi"]:
+                    aciklama += f"\n{blok['ogretim_uyesi']}"
+                for satir in (
+                    "BEGIN:VEVENT",
+                    f"UID:{blok['donem']}-{blok['bolum']}-{blok['ders_kodu']}-"
+                    f"{GUN_INDEKSI[blok['gun']]}-{blok['saat']}@ders-programi",
+                    f"DTSTAMP:{damga}",
+                    f"DTSTART:{baslangic:%Y%m%dT%H%M%S}",
+                    f"DTEND:{bitis:%Y%m%dT%H%M%S}",
+                    f"RRULE:FREQ=WEEKLY;COUNT={hafta_sayisi}",
+                    f"SUMMARY:{Program.ics_metni(ozet)}",
+                    f"LOCATION:{Program.ics_metni(blok['derslik'])}",
+                    f"DESCRIPTION:{Program.ics_metni(aciklama)}",
+                    "END:VEVENT",
+                ):
+                    f.write(Program.ics_satiri(satir))
+            f.write("END:VCALENDAR\r\n")
+
+    @olculen("disa_aktar")
+    def disa_aktar(donem_programlari, dosya_adi, bicim, ogretim_uyesi_adlari=None, donem_baslangici=None):
+        """
+        Programları şablonsuz bir biçimde (csv, jsonl, ics, xlsx) dosyaya akışlı yazar; başarılıysa True döndürür.
+        ogretim_uyesi_adlari ({ders_kodu: ad}) verilmezse tek sorguda çekilir.
+        """
+        yazicilar = {
+            "csv": Program.csv_yaz,
+            "jsonl": Program.jsonl_yaz,
+            "xlsx": Program.xlsx_akisli_yaz,
+            "ics": lambda satirlar, dosya: Program.ics_yaz(satirlar, dosya, donem_baslangici),
+        }
+        if bicim not in yazicilar:
+            print(f"⚠️ Geçersiz çıktı biçimi: {bicim}")
+            return False
+
+        try:
+            if ogretim_uyesi_adlari is None:
+                ogretim_uyesi_adlari = Program.ogretim_uyesi_adlari_oku()
+
+            yazicilar[bicim](Program.program_satirlari(donem_programlari, ogretim_uyesi_adlari), dosya_adi)
+            print(f"\n✅ Programlar '{dosya_adi}' dosyasına yazıldı.")
+            return True
+
+        except Exception as e:
+            print(f"Hata oluştu: {e}")
+            return False
+
+def coklu_baslangic_denemesi(deneme):
+    """ İşçi süreçte tek bir tohumla program oluşturur: (puan, tohum, {bolum: program}). """
+    tohum, bolum_dersleri, derslikler, motor, doluluk, ogretim_uyeleri = deneme
+    random.seed(tohum)
+    programlar = Program.ders_programi_olustur(bolum_dersleri, derslikler, motor, doluluk, ogretim_uyeleri)
+    return Program.program_puani(programlar, bolum_dersleri), tohum, programlar
+
+
+def bolum_calisma_kitabi_yaz(is_):
+    """ İşçi süreçte bir bölümün tüm dönemlerini şablondan kendi dosyasına yazar: (bolum, dosya, başarılı). """
+    import openpyxl
+
+    bolum_adi, programlar, ogretim_uyesi_adlari, sablon, dosya_adi = is_
+    try:
+        wb = openpyxl.load_workbook(sablon)
+        if bolum_adi not in wb.sheetnames:
+            Program.yeni_sayfa_olustur(wb, bolum_adi)
+        # Bölüm dosyasında yalnızca bölümün sayfası kalır (şablonun sayfa sırasından bağımsız, ada göre)
+        for sayfa in [sayfa for sayfa in wb.worksheets if sayfa.title != bolum_adi]:
+            wb.remove(sayfa)
+        for donem, program in programlar.items():
+            Program.program_excele_yaz(wb, program, bolum_adi, donem, ogretim_uyesi_adlari)
+        wb.save(dosya_adi)
+        return bolum_adi, dosya_adi, True
+    except Exception as e:
+        print(f"Hata oluştu ({bolum_adi}): {e}")
+        return bolum_adi, dosya_adi, False
+
+
+# ---KOMUT SATIRI---
+
+def komut_satiri(argv=None):
+    """
+    Menüsüz (betik/cron) kullanım için komut satırı. Örnek:
+        python ders_programi_olusturma.py generate --term G --seed 42 --out cikti/
+    Başarıda 0, hata olduğunda 1 döndürür.
+    """
+    parser = argparse.ArgumentParser(description="Haftalık ders programı oluşturma")
+    parser.add_argument("--db", help="Veritabanı URL'i (varsayılan: DERS_PROGRAMI_DB_URL ya da MSSQL)")
+    parser.add_argument("--metrics", default=OLCUM_ONEKI,
+                        help="Aşama sürelerini ve sayaçları ölç, sonunda <önek>.json ve <önek>.prom dosyalarına yaz "
+                             "(varsayılan: DERS_PROGRAMI_OLCUM)")
+    parser.add_argument("--sql-profile", action="store_true",
+                        help="SQL sorgularını çağrı yerine göre say, sonunda raporla ve olası N+1 kalıplarını işaretle")
+    parser.add_argument("--sql-budget", type=int,
+                        help="Komutun gönderebileceği en fazla SQL sorgusu; aşılırsa hata döndürülür (--sql-profile ile)")
+    alt = parser.add_subparsers(dest="komut", required=True)
+
+    ice_aktar = argparse.ArgumentParser(add_help=False)
+    ice_aktar.add_argument("--kullanicilar", help="kullanicilar.txt dosyası")
+    ice_aktar.add_argument("--ogretim-uyesi-bolum", help="ogretim_uyesi_bolum.txt dosyası")
+    ice_aktar.add_argument("--derslikler", help="derslik.txt dosyası")
+    ice_aktar.add_argument("--dersler", help="dersler.txt dosyası")
+    ice_aktar.add_argument("--musait-olmayan", help="Öğretim üyelerinin müsait olmadığı saatler (musait_olmayan.txt)")
+    ice_aktar.add_argument("--stream", action="store_true", help="Dosyaları akışlı ve parça parça içe aktar")
+    ice_aktar.add_argument("--chunk-size", type=int, default=PARCA_BOYUTU, help="Akışlı modda parça boyutu")
+
+    alt.add_parser("import", parents=[ice_aktar], help="Txt dosyalarını veritabanına aktar")
+
+    onar = alt.add_parser("repair", parents=[ice_aktar],
+                          help="Kayıtlı programları ders ve derslik değişikliklerine göre onar")
+    onar.add_argument("--term", choices=["G", "B"], help="Yalnızca bu dönemi onar (varsayılan: ikisi de)")
+
+    rapor = alt.add_parser("report", parents=[ice_aktar], help="Kayıtlı programları yeniden oluşturmadan değerlendir")
+    rapor.add_argument("--term", choices=["G", "B"], help="Yalnızca bu dönemi değerlendir (varsayılan: ikisi de)")
+
+    olustur = alt.add_parser("generate", parents=[ice_aktar], help="Bir dönemin ders programlarını oluştur")
+    olustur.add_argument("--term", required=True, choices=["G", "B"], help="Güz (G) ya da Bahar (B)")
+    olustur.add_argument("--seed", type=int, help="Rastgelelik tohumu (tekrarlanabilir sonuç için)")
+    olustur.add_argument("--out", help="Çıktının yazılacağı klasör (verilmezse dosyaya yazılmaz)")
+    olustur.add_argument("--format", choices=CIKTI_BICIMLERI, default="sablon",
+                         help="Çıktı biçimi (sablon: ProgramŞablon.xlsx kopyası; diğerleri şablonsuz ve akışlı)")
+    olustur.add_argument("--term-start", type=date.fromisoformat,
+                         help="ics çıktısı için dönemin ilk Pazartesi'si (YYYY-AA-GG; varsayılan: bu hafta)")
+    olustur.add_argument("--per-department", action="store_true",
+                         help="Her bölümü kendi Excel dosyasına paralel yaz (yalnızca sablon biçiminde)")
+    olustur.add_argument("--merge", action="store_true",
+                         help="--per-department ile yazılan bölüm dosyalarını tek dosyada birleştir")
+    olustur.add_argument("--incremental", action="store_true",
+                         help="Yalnızca dersleri ya da öğretim üyeleri değişen (ya da silinmiş derslik kullanan) yarıyılları "
+                              "yeniden oluştur")
+    olustur.add_argument("--assign", action="store_true",
+                         help="Öğretim üyesi olmayan dersleri bölümlerinin öğretim üyelerine yük dengeli ata")
+    olustur.add_argument("--matching", action="store_true",
+                         help="--assign ile atanamayan dersler için iki parçalı eşleştirme (artıran yol) kullan")
+    olustur.add_argument("--engine", choices=["rastgele", "geri_izleme"], default="rastgele",
+                         help="Yerleştirme motoru")
+    olustur.add_argument("--runs", type=int, default=1, help="Her dönem için paralel deneme sayısı (en iyisi seçilir)")
+    olustur.add_argument("--workers", type=int, help="Paralel denemelerde işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+
+    args = parser.parse_args(argv)
+
+    if args.db:
+        veritabani_ayarla(args.db)
+
+    if args.metrics:
+        olcum.etkin = True
+        olcum.sifirla()
+    if args.sql_profile or args.sql_budget is not None:
+        sorgu_profili.ac()
+        sorgu_profili.sifirla()
+    try:
+        sonuc = komutu_calistir(args)
+    finally:
+        if args.metrics:
+            olcum.yaz(args.metrics)
+
+    if sorgu_profili.etkin:
+        sorgu_sayisi = sorgu_profili.toplam()
+        sorgu_profili.rapor(args.komut)
+        if args.sql_budget is not None and sorgu_sayisi > args.sql_budget:
+            print(f"❌ SQL bütçesi aşıldı: {sorgu_sayisi} sorgu (sınır {args.sql_budget}).")
+            return 1
+    return sonuc
+
+
+def komutu_calistir(args):
+    """ komut_satiri'nın ayrıştırdığı komutu çalıştırır; başarıda 0, hata olduğunda 1 döndürür. """
+    basarili = True
+
+    # Dosya verilen tablolar içe aktarılır (yükleyiciler hata durumunda None döndürür)
+    for dosya, yukleyici in [(args.kullanicilar, load_kullanicilar_from_file),
+                             (args.ogretim_uyesi_bolum, load_ogretim_uyesi_bolum_from_file),
+                             (args.derslikler, load_derslikler_from_file),
+                             (args.dersler, load_dersler_from_file),
+                             (args.musait_olmayan, load_musait_olmayan_saatler_from_file)]:
+        if dosya and yukleyici(dosya, akis=args.stream, parca_boyutu=args.chunk_size) is None:
+            basarili = False
+
+    if args.komut == "repair" and basarili:
+        for donem_tipi in [args.term] if args.term else DONEM_TIPLERI:
+            basarili = Program.programlari_onar(DONEM_TIPLERI[donem_tipi]) and basarili
+
+    if args.komut == "report" and basarili:
+        for donem_tipi in [args.term] if args.term else DONEM_TIPLERI:
+            basarili = Sistem.programlari_degerlendir(donem_tipi) and basarili
+
+    if args.komut == "generate" and basarili:
+        if args.seed is not None:
+            random.seed(args.seed)
+
+        # Atama başarısızsa (None) eski atamalarla program oluşturulmaz
+        if args.assign and assign_random_courses(args.matching) is None:
+            return 1
+
+        excel_dosyasi = None
+        if args.out:
+            os.makedirs(args.out, exist_ok=True)
+            uzanti = "xlsx" if args.format == "sablon" else args.format
+            excel_dosyasi = os.path.join(args.out, f"ders_programi_{args.term}.{uzanti}")
+            if args.format == "sablon" and not args.per_department:
+                try:
+                    shutil.copyfile(SABLON_DOSYASI, excel_dosyasi)
+                except OSError as e:
+                    print(f"❌ Hata: {SABLON_DOSYASI} şablonu kopyalanamadı: {e}")
+                    return 1
+
+        basarili = Sistem.ders_programi_olustur(args.term, excel_dosyasi, args.engine, args.runs, args.workers,
+                                                args.format, args.term_start, args.per_department, args.merge,
+                                                args.incremental)
+
+    return 0 if basarili else 1
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(komut_satiri())
+
+    # Menü çalıştırılıyor
+    Sistem.menu()
\ No newline at end of file
@@ -0,0 +1,266 @@
+"""
+Ders programı oluşturma hattı için sentetik veri üreticisi ve performans ölçümü.
+
+Sentetik katalog mevcut txt biçimlerinde (kullanicilar, ogretim_uyesi_bolum, derslik, dersler) üretilir;
+ölçüm kullanıcıların çalıştırdığı giriş noktalarını geçici bir SQLite veritabanında çalıştırır ve modülün
+olcum nesnesinin aşama sürelerini ve sayaçlarını JSON olarak kaydeder:
+
+    python performans_olcumu.py uret --bolum 6 --klasor veri/
+    python performans_olcumu.py olc --bolum 2 4 8 --tekrar 3 --cikti sonuc.json
+    python performans_olcumu.py karsilastir eski.json yeni.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import ders_programi_olusturma as dp
+
+BOLUM_KODLARI = ["BM", "YM", "EE", "ME", "IE", "CE", "KM", "MM", "IM", "FZ", "MT", "GM"]
+DERSLIK_KAPASITELERI = [40, 60, 75, 90, 100, 120]
+
+
+# ---SENTETİK VERİ---
+
+def bolum_kodlari_uret(bolum_sayisi):
+    """ İlk bölümler bilinen kodlarla, fazlası B13, B14, ... olarak adlandırılır. """
+    return BOLUM_KODLARI[:bolum_sayisi] + [f"B{i + 1}" for i in range(len(BOLUM_KODLARI), bolum_sayisi)]
+
+
+def sentetik_veri_uret(klasor, bolum_sayisi=4, ders_sayisi=6, donem_sayisi=8, ortak_oran=0.3, lab_oran=0.15,
+                       secmeli_oran=0.2, derslik_sayisi=None, ogretim_uyesi_sayisi=None, tohum=0):
+    """
+    klasor'e bölüm başına ve yarıyıl başına ders_sayisi dersten oluşan bir katalog yazar; dosya yollarını ve
+    bölüm kodlarını sözlük olarak döndürür. Derslerin ortak_oran'ı birden fazla bölümde aynı adla okutulur,
+    lab_oran'ı laboratuvar, secmeli_oran'ı seçmelidir. Derslik ve öğretim üyesi sayıları verilmezse ders
+    yüküne göre hesaplanır (öğretim üyesi başına OGRETIM_UYESI_DERS_SINIRI ders).
+    """
+    rastgele = random.Random(tohum)
+    os.makedirs(klasor, exist_ok=True)
+    bolumler = bolum_kodlari_uret(bolum_sayisi)
+
+    ortak_sayisi = round(ders_sayisi * ortak_oran) if bolum_sayisi > 1 else 0
+    satirlar = []
+    for donem in range(1, donem_sayisi + 1):
+        # Her ortak ders rastgele en az iki bölümde okutulur
+        ortak_dersler = [(f"ORT{donem}{i}", f"Ortak_{donem}_{i}", rastgele.choice([2, 3]),
+                          rastgele.sample(bolumler, rastgele.randint(2, bolum_sayisi)))
+                         for i in range(ortak_sayisi)]
+        for bolum in bolumler:
+            ortaklar = [ders for ders in ortak_dersler if bolum in ders[3]]
+            for kod, ad, saat, _ in ortaklar:
+                satirlar.append(f"{bolum} {donem} {kod} {ad} zorunlu {saat} 0")
+            for i in range(ders_sayisi - len(ortaklar)):
+                lab = rastgele.random() < lab_oran
+                ad = f"{bolum}_Lab_{donem}_{i}" if lab else f"{bolum}_Ders_{donem}_{i}"
+                tip = "secmeli" if rastgele.random() < secmeli_oran else "zorunlu"
+                satirlar.append(f"{bolum} {donem} {bolum}{donem}{i:02d} {ad} {tip} "
+                                f"{rastgele.choice([2, 3])} {rastgele.choice([0, 1])}")
+
+    if derslik_sayisi is None:
+        derslik_sayisi = max(8, bolum_sayisi * 8)
+    lab_sayisi = max(1, derslik_sayisi // 5)
+    derslikler = [f"D{i} {rastgele.choice(DERSLIK_KAPASITELERI)} NORMAL" for i in range(derslik_sayisi - lab_sayisi)]
+    derslikler += [f"LAB{i} 40 LAB" for i in range(lab_sayisi)]
+
+    if ogretim_uyesi_sayisi is None:
+        ogretim_uyesi_sayisi = math.ceil(len(satirlar) / dp.OGRETIM_UYESI_DERS_SINIRI * 1.1)
+    kullanicilar = [f"{i} ogretim_uyesi Hoca {i}" for i in range(1, ogretim_uyesi_sayisi + 1)]
+    # Her öğretim üyesi bir bölüme, onda biri ikinci bir bölüme de bağlıdır
+    iliskiler = [f"{i} {bolumler[i % bolum_sayisi]}" for i in range(1, ogretim_uyesi_sayisi + 1)]
+    iliskiler += [f"{i} {bolumler[(i + 1) % bolum_sayisi]}" for i in range(1, ogretim_uyesi_sayisi + 1)
+                  if bolum_sayisi > 1 and rastgele.random() < 0.1]
+
+    dosyalar = {
+        "kullanicilar": os.path.join(klasor, "kullanicilar.txt"),
+        "ogretim_uyesi_bolum": os.path.join(klasor, "ogretim_uyesi_bolum.txt"),
+        "derslikler": os.path.join(klasor, "derslik.txt"),
+        "dersler": os.path.join(klasor, "dersler.txt"),
+    }
+    for anahtar, icerik in [("kullanicilar", kullanicilar), ("ogretim_uyesi_bolum", iliskiler),
+                            ("derslikler", derslikler), ("dersler", satirlar)]:
+        with open(dosyalar[anahtar], "w", encoding="utf-8") as f:
+            f.write("\n".join(icerik) + "\n")
+
+    return {"dosyalar": dosyalar, "bolumler": bolumler, "ders_sayisi": len(satirlar),
+            "derslik_sayisi": derslik_sayisi, "ogretim_uyesi_sayisi": ogretim_uyesi_sayisi}
+
+
+def sablon_olustur(dosya_adi):
+    """ Excel aşaması için, gerçek şablonun yerleşimine uyan (C1 başlık, C-F sütunları) boş bir şablon yazar. """
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    sayfa = wb.active
+    sayfa.title = "Şablon"
+    for satir, (gun, saat) in enumerate(((gun, saat) for gun in dp.GUNLER for saat in dp.SAATLER), start=4):
+        sayfa[f"A{satir}"] = gun
+        sayfa[f"B{satir}"] = f"{saat}:00"
+    wb.save(dosya_adi)
+
+
+# ---ÖLÇÜM---
+
+def bir_kez_olc(klasor, bolum_sayisi, ders_sayisi, motor, tohum):
+    """
+    Boş bir SQLite veritabanında kullanıcıların çalıştırdığı giriş noktalarını (yükleyiciler, assign_random_courses,
+    Sistem.ders_programi_olustur, Program.disa_aktar) bir kez çalıştırır. Aşama süreleri ve sayaçlar
+    ders_programi_olusturma.olcum'dan okunur; (süreler ms, sayılar) döndürür. Aşamalar iç içedir
+    (ör. derslikleri_atama, ders_programi_olustur'un içindedir), "toplam" tüm çalışmanın süresidir.
+    """
+    veri = sentetik_veri_uret(klasor, bolum_sayisi, ders_sayisi, tohum=tohum)
+    dosyalar = veri["dosyalar"]
+    veritabani = os.path.join(klasor, "olcum.db")
+    if os.path.exists(veritabani):
+        os.remove(veritabani)
+    random.seed(tohum)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        dp.veritabani_ayarla(f"sqlite:///{veritabani}")
+        dp.session.add_all([dp.Bolum(kod=kod, ad=kod) for kod in veri["bolumler"]])
+        dp.session.commit()
+
+    try:
+        sablon = os.path.join(klasor, "sablon.xlsx")
+        sablon_olustur(sablon)
+        excel_dosyasi = os.path.join(klasor, "ders_programi.xlsx")
+    except ImportError:
+        print("⚠️ openpyxl kurulu değil, Excel aşaması atlandı.")
+        sablon = excel_dosyasi = None
+
+    dp.olcum.etkin = True
+    dp.olcum.sifirla()
+    baslangic = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            dp.load_kullanicilar_from_file(dosyalar["kullanicilar"])
+            dp.load_ogretim_uyesi_bolum_from_file(dosyalar["ogretim_uyesi_bolum"])
+            dp.load_derslikler_from_file(dosyalar["derslikler"])
+            dp.load_dersler_from_file(dosyalar["dersler"])
+            dp.assign_random_courses()
+
+            if sablon:
+                shutil.copyfile(sablon, excel_dosyasi)
+            dp.Sistem.ders_programi_olustur("G", excel_dosyasi, motor)
+
+            donem_programlari = dp.Program.kayitli_programlari_oku(dp.DONEM_TIPLERI["G"])
+            dp.Program.disa_aktar(donem_programlari, os.path.join(klasor, "program.csv"), "csv")
+        toplam = time.perf_counter() - baslangic
+        ozet = dp.olcum.ozet()
+    finally:
+        dp.olcum.etkin = False
+
+    sureler = {asama: kayit["toplam_ms"] for asama, kayit in ozet["asamalar"].items()}
+    sureler["toplam"] = toplam * 1000
+    yerlesen = sum(1 for programlar in donem_programlari.values() for program in programlar.values()
+                   for saatler in program.values() for ders in saatler.values() if ders)
+    sayilar = {"ders": veri["ders_sayisi"], "derslik": veri["derslik_sayisi"],
+               "ogretim_uyesi": veri["ogretim_uyesi_sayisi"], "yerlesen_saat": yerlesen, **ozet["sayaclar"]}
+    return sureler, sayilar
+
+
+def olc(bolum_sayilari, ders_sayisi=6, tekrar=3, motor="rastgele", tohum=0):
+    """ Her ölçek için hattı tekrar kez ölçer; aşama başına en kısa ve ortanca süreleri (ms) döndürür. """
+    sonuclar = []
+    for bolum_sayisi in bolum_sayilari:
+        tum_sureler = {}
+        with tempfile.TemporaryDirectory() as klasor:
+            for i in range(tekrar):
+                sureler, sayilar = bir_kez_olc(klasor, bolum_sayisi, ders_sayisi, motor, tohum + i)
+                for asama, sure in sureler.items():
+                    tum_sureler.setdefault(asama, []).append(sure)
+            dp.veritabani_ayarla("sqlite://")  # Geçici veritabanı dosyası serbest bırakılır
+
+        asamalar = {asama: {"en_kisa_ms": round(min(sureler), 3), "ortanca_ms": round(statistics.median(sureler), 3)}
+                    for asama, sureler in tum_sureler.items()}
+        sonuclar.append({"bolum_sayisi": bolum_sayisi, "ders_sayisi": ders_sayisi, "motor": motor,
+                         "sayilar": sayilar, "asamalar": asamalar})
+        print(f"✅ {bolum_sayisi} bölüm ({sayilar['ders']} ders): toplam {asamalar['toplam']['ortanca_ms']:.1f} ms")
+        for asama, sure in sorted(asamalar.items()):
+            if asama != "toplam":
+                print(f"   {asama:<28} {sure['ortanca_ms']:>10.1f} ms")
+
+    return {"zaman": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+            "tekrar": tekrar, "tohum": tohum, "olcekler": sonuclar}
+
+
+def karsilastir(eski, yeni):
+    """ İki ölçüm dosyasındaki ortak ölçek ve aşamaların ortanca sürelerini oranlarıyla yazdırır. """
+    eski_olcekler = {(olcek["bolum_sayisi"], olcek["ders_sayisi"], olcek["motor"]): olcek for olcek in eski["olcekler"]}
+    for olcek in yeni["olcekler"]:
+        anahtar = (olcek["bolum_sayisi"], olcek["ders_sayisi"], olcek["motor"])
+        if anahtar not in eski_olcekler:
+            continue
+        print(f"\n{olcek['bolum_sayisi']} bölüm, {olcek['ders_sayisi']} ders/yarıyıl ({olcek['motor']}):")
+        for asama, sure in olcek["asamalar"].items():
+            onceki = eski_olcekler[anahtar]["asamalar"].get(asama)
+            if not onceki:
+                continue
+            oran = sure["ortanca_ms"] / onceki["ortanca_ms"] if onceki["ortanca_ms"] else float("inf")
+            isaret = "⚠️" if oran > 1.1 else "  "
+            print(f" {isaret} {asama:<28} {onceki['ortanca_ms']:>10.1f} -> {sure['ortanca_ms']:>10.1f} ms  (x{oran:.2f})")
+
+
+def komut_satiri(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik veri üretimi ve performans ölçümü")
+    alt = parser.add_subparsers(dest="komut", required=True)
+
+    uret = alt.add_parser("uret", help="Sentetik katalog dosyalarını üret")
+    uret.add_argument("--klasor", required=True, help="Dosyaların yazılacağı klasör")
+    uret.add_argument("--bolum", type=int, default=4, help="Bölüm sayısı")
+    uret.add_argument("--ders", type=int, default=6, help="Bölüm ve yarıyıl başına ders sayısı")
+    uret.add_argument("--ortak-oran", type=float, default=0.3, help="Birden fazla bölümde okutulan ders oranı")
+    uret.add_argument("--lab-oran", type=float, default=0.15, help="Laboratuvar dersi oranı")
+    uret.add_argument("--secmeli-oran", type=float, default=0.2, help="Seçmeli ders oranı")
+    uret.add_argument("--derslik", type=int, help="Derslik sayısı (varsayılan: bölüm başına 8)")
+    uret.add_argument("--ogretim-uyesi", type=int, help="Öğretim üyesi sayısı (varsayılan: ders yüküne göre)")
+    uret.add_argument("--tohum", type=int, default=0, help="Rastgelelik tohumu")
+
+    olcum = alt.add_parser("olc", help="Hattın aşamalarını SQLite üzerinde ölç")
+    olcum.add_argument("--bolum", type=int, nargs="+", default=[2, 4, 8], help="Ölçülecek bölüm sayıları")
+    olcum.add_argument("--ders", type=int, default=6, help="Bölüm ve yarıyıl başına ders sayısı")
+    olcum.add_argument("--tekrar", type=int, default=3, help="Her ölçek için tekrar sayısı")
+    olcum.add_argument("--engine", choices=["rastgele", "geri_izleme"], default="rastgele", help="Yerleştirme motoru")
+    olcum.add_argument("--tohum", type=int, default=0, help="Rastgelelik tohumu")
+    olcum.add_argument("--cikti", help="Sonuçların yazılacağı JSON dosyası")
+
+    kars = alt.add_parser("karsilastir", help="İki ölçüm dosyasını karşılaştır")
+    kars.add_argument("eski", help="Önceki ölçüm (JSON)")
+    kars.add_argument("yeni", help="Yeni ölçüm (JSON)")
+
+    args = parser.parse_args(argv)
+
+    if args.komut == "uret":
+        veri = sentetik_veri_uret(args.klasor, args.bolum, args.ders, ortak_oran=args.ortak_oran,
+                                  lab_oran=args.lab_oran, secmeli_oran=args.secmeli_oran,
+                                  derslik_sayisi=args.derslik, ogretim_uyesi_sayisi=args.ogretim_uyesi,
+                                  tohum=args.tohum)
+        print(f"✅ {veri['ders_sayisi']} ders, {veri['derslik_sayisi']} derslik, {veri['ogretim_uyesi_sayisi']} "
+              f"öğretim üyesi '{args.klasor}' klasörüne yazıldı. Bölümler: {' '.join(veri['bolumler'])}")
+    elif args.komut == "olc":
+        sonuc = olc(args.bolum, args.ders, args.tekrar, args.engine, args.tohum)
+        if args.cikti:
+            with open(args.cikti, "w", encoding="utf-8") as f:
+                json.dump(sonuc, f, ensure_ascii=False, indent=2)
+            print(f"\n✅ Sonuçlar '{args.cikti}' dosyasına yazıldı.")
+    else:
+        with open(args.eski, encoding="utf-8") as f:
+            eski = json.load(f)
+        with open(args.yeni, encoding="utf-8") as f:
+            yeni = json.load(f)
+        karsilastir(eski, yeni)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(komut_satiri())
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ders_programi_olusturma as dp  # noqa: E402
+
+
+@pytest.fixture
+def veritabani():
+    """ Her test için boş, bellek içi bir SQLite veritabanı. """
+    dp.veritabani_ayarla("sqlite://")
+    yield dp.session
+    dp.veritabani_ayarla("sqlite://")
+
+
+def ders_bilgisi(ad, teorik, pratik=0, tip="zorunlu"):
+    """ donem_derslerini_oku'nun döndürdüğü biçimde ders bilgisi. """
+    return {"Ders Adı": ad, "Ders Tipi": tip, "Teorik": teorik, "Pratik": pratik, "Lab": False, "Ortak": None}
@@ -0,0 +1,79 @@
+import random
+from collections import defaultdict
+
+import pytest
+from sqlalchemy import insert
+
+import ders_programi_olusturma as dp
+
+
+def katalog_olustur(session, hocalar, dersler):
+    """
+    hocalar {id: [bölüm kodları]}, dersler [(bölüm, dönem, kod, ad, saat, öğretim üyesi id ya da None)].
+    """
+    bolumler = sorted({bolum for bolum_kodlari in hocalar.values() for bolum in bolum_kodlari}
+                      | {ders[0] for ders in dersler})
+    session.add_all([dp.Bolum(kod=bolum, ad=bolum) for bolum in bolumler])
+    session.add_all([dp.Kullanicilar(id=h, mevki="ogretim_uyesi", ad=f"Hoca {h}") for h in hocalar])
+    session.commit()
+    session.execute(insert(dp.ogretim_uyesi_bolum), [{"ogretim_uyesi_id": h, "bolum_kod": bolum}
+                                                     for h, bolum_kodlari in hocalar.items() for bolum in bolum_kodlari])
+    session.add_all([dp.Ders(bolum_kod=bolum, donem=donem, kod=kod, ad=ad, ders_tipi="zorunlu", teorik_saat=saat,
+                             uyg_saat=0, ogretim_uyesi_id=hoca) for bolum, donem, kod, ad, saat, hoca in dersler])
+    session.commit()
+
+
+def hoca_gruplari(session):
+    """ {öğretim üyesi: {(dönem, ad)}} - aynı dönemde aynı adlı dersler bir grup sayılır. """
+    gruplar = defaultdict(set)
+    for ders in session.query(dp.Ders).filter(dp.Ders.ogretim_uyesi_id.isnot(None)):
+        gruplar[ders.ogretim_uyesi_id].add((ders.donem, ders.ad))
+    return gruplar
+
+
+@pytest.fixture(autouse=True)
+def tohum():
+    random.seed(0)
+
+
+def test_atama_yuku_dengeler_ve_siniri_asmaz(veritabani):
+    dersler = [("BM", 1, f"BM10{i}", f"Ders {i}", 2 + i % 2, None) for i in range(7)]
+    katalog_olustur(veritabani, {1: ["BM"], 2: ["BM"]}, dersler)
+
+    # İki öğretim üyesi en fazla 2 * OGRETIM_UYESI_DERS_SINIRI ders alabilir, biri atanamaz
+    assert dp.assign_random_courses() == 2 * dp.OGRETIM_UYESI_DERS_SINIRI
+
+    gruplar = hoca_gruplari(veritabani)
+    assert all(len(atanan) == dp.OGRETIM_UYESI_DERS_SINIRI for atanan in gruplar.values())
+
+
+def test_ortak_ders_tek_ogretim_uyesine_bir_ders_olarak_verilir(veritabani):
+    dersler = [("BM", 1, "MAT1", "Matematik", 3, None), ("EE", 1, "MAT1E", "Matematik", 3, None),
+               ("BM", 1, "BM101", "Programlama", 2, None)]
+    katalog_olustur(veritabani, {1: ["BM", "EE"]}, dersler)
+
+    assert dp.assign_random_courses() == 2
+    matematik = {ders.ogretim_uyesi_id for ders in veritabani.query(dp.Ders).filter_by(ad="Matematik")}
+    assert matematik == {1}
+    assert len(hoca_gruplari(veritabani)[1]) == 2
+
+
+def test_eslestirme_acgozlu_atamanin_kacirdigi_dersleri_atar(veritabani):
+    # 1 hem BM hem EE'de, 2 yalnızca BM'de ve zaten yüklü. Açgözlü atama uzun BM derslerini en az yüklü 1'e verir,
+    # 1'in sınırı dolunca EE dersleri açıkta kalır; artıran yollar BM derslerini 2'ye kaydırır.
+    hocalar = {1: ["BM", "EE"], 2: ["BM"]}
+    dersler = [("BM", 2, "BM200", "Eski", 10, 2)]
+    dersler += [("BM", 1, f"BM10{i}", f"Bilgisayar {i}", 4, None) for i in range(2)]
+    dersler += [("EE", 1, f"EE10{i}", f"Elektrik {i}", 2, None) for i in range(3)]
+
+    katalog_olustur(veritabani, hocalar, dersler)
+    assert dp.assign_random_courses() == 3
+
+    dp.veritabani_ayarla("sqlite://")
+    katalog_olustur(dp.session, hocalar, dersler)
+    assert dp.assign_random_courses(eslestirme=True) == 5
+
+    gruplar = hoca_gruplari(dp.session)
+    assert gruplar[1] == {(1, f"Elektrik {i}") for i in range(3)}
+    assert gruplar[2] == {(2, "Eski"), (1, "Bilgisayar 0"), (1, "Bilgisayar 1")}
+    assert all(len(atanan) <= dp.OGRETIM_UYESI_DERS_SINIRI for atanan in gruplar.values())
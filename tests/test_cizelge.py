@@ -0,0 +1,72 @@
+import random
+
+import ders_programi_olusturma as dp
+from conftest import ders_bilgisi
+
+
+def test_baslangic_tablosu_bosluk_icin_yer_birakir():
+    # Boş günde 2 saatlik ders, bitişinden sonraki boşluk da gün içinde kalacak şekilde başlayabilir
+    assert dp.BASLANGIC_TABLOSU[2][0] == 0b111111
+    # 2. saat (indeks) doluysa 0. ve 1. saatte başlayan ders ya çakışır ya da boşluk bırakamaz
+    assert dp.BASLANGIC_TABLOSU[2][0b100] & 0b11 == 0
+    assert dp.BASLANGIC_TABLOSU[len(dp.SAATLER)][0] == 0
+
+
+def test_yerlestir_dersten_sonra_bosluk_birakir():
+    cizelge = dp.Cizelge(["BM"])
+    cizelge.yerlestir({"BM": ("BM101", "Programlama")}, 0, 0, 2)
+
+    assert cizelge.maske["BM"][0] == 0b111
+    program = cizelge.sozluge_cevir("BM")["Pazartesi"]
+    assert program[9] == program[10] == ("BM101", "Programlama")
+    assert program[11] == ""
+    # Sıradaki ders boşluktan sonra başlar
+    assert cizelge.bos_blok_bul(("BM",), 0, 2) == 3
+
+
+def test_uygun_baslangiclar_dolu_saatleri_ve_boslugu_eler():
+    cizelge = dp.Cizelge(["BM"])
+    cizelge.yerlestir({"BM": ("BM101", "Programlama")}, 0, 3, 2)  # 3-4 ders, 5 boşluk
+
+    # 2 saatlik ders yalnızca 0'da başlayabilir (1'de başlarsa boşluğu 3'e, yani derse denk gelir)
+    assert cizelge.uygun_baslangiclar(("BM",), 0, 2) == 0b1
+    assert cizelge.uygun_baslangiclar(("BM",), 1, 2) == 0b111111
+
+
+def test_ortak_ders_tum_bolumlerde_bos_saate_konur():
+    cizelge = dp.Cizelge(["BM", "EE"])
+    cizelge.yerlestir({"BM": ("BM101", "Programlama")}, 0, 0, 2)
+
+    baslangic = cizelge.bos_blok_bul(("BM", "EE"), 0, 2)
+    assert baslangic == 3
+    cizelge.yerlestir({"BM": ("MAT1", "Matematik"), "EE": ("MAT1", "Matematik")}, 0, baslangic, 2)
+    assert cizelge.maske["BM"][0] & cizelge.maske["EE"][0] == 0b111 << 3
+
+
+def test_dersi_yerlestir_gunluk_siniri_asmaz():
+    random.seed(0)
+    dersler = {f"BM10{i}": ders_bilgisi(f"Ders {i}", 1) for i in range(8)}
+    cizelge = dp.Cizelge(["BM"])
+
+    dp.Program.dersi_yerlestir(dersler, cizelge, "BM")
+
+    program = cizelge.sozluge_cevir("BM")
+    yerlesen = set()
+    for saatler in program.values():
+        gunun_dersleri = {ders[0] for ders in saatler.values() if ders}
+        assert len(gunun_dersleri) <= dp.GUNLUK_DERS_SINIRI
+        yerlesen |= gunun_dersleri
+    assert yerlesen == set(dersler)
+    assert all(cizelge.gun_dolu_mu("BM", gun) for gun in range(3))
+
+
+def test_gunluk_sinir_dolunca_ders_yerlesmez():
+    random.seed(0)
+    sinir = dp.GUNLUK_DERS_SINIRI * len(dp.GUNLER)
+    dersler = {f"BM1{i:02d}": ders_bilgisi(f"Ders {i}", 1) for i in range(sinir + 1)}
+    cizelge = dp.Cizelge(["BM"])
+
+    dp.Program.dersi_yerlestir(dersler, cizelge, "BM")
+
+    yerlesen = {ders[0] for saatler in cizelge.sozluge_cevir("BM").values() for ders in saatler.values() if ders}
+    assert len(yerlesen) == sinir
@@ -0,0 +1,77 @@
+import copy
+import random
+
+import ders_programi_olusturma as dp
+from conftest import ders_bilgisi
+
+
+def cizelge_durumu(cizelge, ogretim_uyesi_idleri=(7, 8)):
+    """ Bölüm maskeleri, ders sayıları, slotlar ve öğretim üyelerinin günlük meşgul saatleri. """
+    mesgul = {(h, gun): cizelge.ogretim_uyeleri.mesgul_saatler(h, gun)
+              for h in ogretim_uyesi_idleri for gun in range(len(dp.GUNLER))}
+    return copy.deepcopy((cizelge.maske, cizelge.ders_sayisi, cizelge.slotlar)), mesgul
+
+
+def test_kaldir_yerlestirmeyi_tamamen_geri_alir():
+    ogretim_uyeleri = dp.OgretimUyesiDolulugu()
+    cizelge = dp.Cizelge(["BM", "EE"], ogretim_uyeleri, {"MAT1": 7, "BM101": 8})
+    cizelge.yerlestir({"BM": ("BM101", "Programlama")}, 1, 0, 2)
+    once = cizelge_durumu(cizelge)
+
+    dersler = {"BM": ("MAT1", "Matematik"), "EE": ("MAT1", "Matematik")}
+    cizelge.yerlestir(dersler, 1, 3, 3)
+    assert ogretim_uyeleri.mesgul_saatler(7, 1) == 0b111 << 3
+
+    cizelge.kaldir(dersler, 1, 3, 3)
+    assert cizelge_durumu(cizelge) == once
+    assert ogretim_uyeleri.mesgul_saatler(7, 1) == 0
+
+
+def test_gunun_son_dersini_kaldirmak_onceki_dersi_bozmaz():
+    cizelge = dp.Cizelge(["BM"], dp.OgretimUyesiDolulugu())
+    cizelge.yerlestir({"BM": ("BM101", "Programlama")}, 0, 0, 2)
+    once = cizelge_durumu(cizelge)
+
+    cizelge.yerlestir({"BM": ("BM102", "Veri Yapıları")}, 0, 5, 2)
+    cizelge.kaldir(("BM",), 0, 5, 2)
+    assert cizelge_durumu(cizelge) == once
+
+
+def test_geri_izleme_tum_birimleri_cakismasiz_yerlestirir():
+    random.seed(1)
+    ortak = {"BM": {"MAT1": ders_bilgisi("Matematik", 3)}, "EE": {"MAT1": ders_bilgisi("Matematik", 3)}}
+    ozel = {bolum: {f"{bolum}10{i}": ders_bilgisi(f"{bolum} Ders {i}", 2 + i % 2) for i in range(6)}
+            for bolum in ("BM", "EE")}
+    bolum_dersleri = {bolum: {**ortak[bolum], **ozel[bolum]} for bolum in ("BM", "EE")}
+    dp.Program.ders_indeksi_olustur(bolum_dersleri)
+    ortak_dersler, ozel_dersler = dp.Program.dersleri_ayir(bolum_dersleri)
+
+    cizelge = dp.Cizelge(["BM", "EE"])
+    birimler = dp.Program.yerlesim_birimleri(ortak_dersler, ozel_dersler)
+    assert dp.Program.geri_izleme_ile_yerlestir(birimler, cizelge) == []
+
+    programlar = {bolum: cizelge.sozluge_cevir(bolum) for bolum in bolum_dersleri}
+    for bolum, program in programlar.items():
+        yerlesen = {ders[0] for saatler in program.values() for ders in saatler.values() if ders}
+        assert yerlesen == set(bolum_dersleri[bolum])
+    # Ortak ders iki bölümde de aynı saatlerde
+    ortak_saatler = [{(gun, saat) for gun, saatler in program.items() for saat, ders in saatler.items()
+                      if ders and ders[0] == "MAT1"} for program in programlar.values()]
+    assert ortak_saatler[0] == ortak_saatler[1] and len(ortak_saatler[0]) == 3
+
+
+def test_sigmayacagi_belli_katalogda_arama_yeniden_baslamaz(monkeypatch, capsys):
+    random.seed(1)
+    monkeypatch.setattr(dp.olcum, "etkin", True)
+    dp.olcum.sifirla()
+    fazla = dp.GUNLUK_DERS_SINIRI * len(dp.GUNLER) + 2
+    birimler = [({"BM": (f"BM1{i:02d}", f"Ders {i}")}, 2, True) for i in range(fazla)]
+    cizelge = dp.Cizelge(["BM"])
+    assert dp.Program.yerlesim_imkansiz_mi(birimler, cizelge)
+
+    yerlesmeyenler = dp.Program.geri_izleme_ile_yerlestir(birimler, cizelge, sure_siniri=5.0)
+    assert len(yerlesmeyenler) == 2
+    # İlk düğüm sınırı dolunca arama biter: yeniden başlama yok, süre sınırına da ulaşılmaz
+    assert dp.olcum.sayaclar["geri_izleme_yeniden_baslama"] == 0
+    assert dp.olcum.sayaclar["geri_izleme_dugumu"] <= dp.GERI_IZLEME_ILK_DUGUM_SINIRI + 1
+    assert "süre sınırına" not in capsys.readouterr().out
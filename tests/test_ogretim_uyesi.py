@@ -0,0 +1,56 @@
+import random
+
+import ders_programi_olusturma as dp
+
+
+def dolu_saatler(programlar, ders_kodlari):
+    """ Verilen derslerin programlardaki {(gun, saat)} saatleri. """
+    return {(gun, saat) for program in programlar.values() for gun, saatler in program.items()
+            for saat, ders in saatler.items() if ders and ders[0] in ders_kodlari}
+
+
+def test_kapali_saatlerde_baslangic_yok():
+    kapali = {7: [0b1111] + [0] * (len(dp.GUNLER) - 1)}  # Pazartesi 9-13 müsait değil
+    cizelge = dp.Cizelge(["BM"], dp.OgretimUyesiDolulugu(kapali), {"BM101": 7, "BM102": 8})
+
+    assert cizelge.uygun_baslangiclar(("BM",), 0, 2, ["BM101"]) & 0b1111 == 0
+    assert cizelge.uygun_baslangiclar(("BM",), 0, 2, ["BM101"]) >> 4 & 1
+    # Kapalı saat yalnızca o öğretim üyesinin derslerini etkiler
+    assert cizelge.uygun_baslangiclar(("BM",), 0, 2, ["BM102"]) & 0b1111 == 0b1111
+
+
+def test_ogretim_uyesi_baska_yariyildaki_dersinin_saatine_konmaz():
+    ogretim_uyeleri = dp.OgretimUyesiDolulugu()
+    birinci = dp.Cizelge(["BM"], ogretim_uyeleri, {"BM101": 7})
+    ucuncu = dp.Cizelge(["BM"], ogretim_uyeleri, {"BM301": 7, "BM302": 8})
+    birinci.yerlestir({"BM": ("BM101", "Programlama")}, 0, 2, 3)
+
+    assert ucuncu.uygun_baslangiclar(("BM",), 0, 2, ["BM301"]) & (0b1111 << 1) == 0
+    assert ucuncu.uygun_baslangiclar(("BM",), 0, 2, ["BM302"]) & (0b1111 << 1) == 0b1111 << 1
+
+
+def test_donem_programi_kapali_saatlere_ve_cakismalara_uyar(veritabani, tmp_path):
+    random.seed(5)
+    veritabani.add(dp.Bolum(kod="BM", ad="Bilgisayar"))
+    veritabani.add_all([dp.Kullanicilar(id=i, mevki="ogretim_uyesi", ad=f"Hoca {i}") for i in (1, 2)])
+    veritabani.add_all([dp.Derslik(kod=kod, kapasite=60, statu="NORMAL") for kod in ("D1", "D2")])
+    veritabani.add_all([dp.Ders(bolum_kod="BM", donem=donem, kod=kod, ad=kod, ders_tipi="zorunlu",
+                                teorik_saat=saat, uyg_saat=0, ogretim_uyesi_id=hoca)
+                        for donem, kod, saat, hoca in [(1, "BM101", 2, 1), (1, "BM102", 3, 2),
+                                                       (3, "BM301", 3, 2), (3, "BM302", 2, 1)]])
+    veritabani.commit()
+    # 1 yalnızca cuma, 2 yalnızca salı müsait: iki yarıyıldaki dersleri aynı güne düşer
+    musait_olmayan = tmp_path / "musait_olmayan.txt"
+    musait_olmayan.write_text("".join(f"{hoca} {gun} 9 17\n" for hoca, musait in [(1, "Cuma"), (2, "Salı")]
+                                      for gun in dp.GUNLER if gun != musait), encoding="utf-8")
+    assert dp.load_musait_olmayan_saatler_from_file(str(musait_olmayan)) == 8
+
+    assert dp.Sistem.ders_programi_olustur("G", None)
+
+    kayitli = dp.Program.kayitli_programlari_oku([1, 3])
+    birinci_hoca = dolu_saatler(kayitli[1], {"BM101"}), dolu_saatler(kayitli[3], {"BM302"})
+    ikinci_hoca = dolu_saatler(kayitli[1], {"BM102"}), dolu_saatler(kayitli[3], {"BM301"})
+    for saatler, gun, saat_sayisi in [(birinci_hoca, "Cuma", 2), (ikinci_hoca, "Salı", 3)]:
+        assert [len(s) for s in saatler] == [saat_sayisi, saat_sayisi]
+        assert {g for s in saatler for g, _ in s} == {gun}
+        assert not saatler[0] & saatler[1]
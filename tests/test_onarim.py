@@ -0,0 +1,128 @@
+import random
+
+import pytest
+
+import ders_programi_olusturma as dp
+
+
+@pytest.fixture
+def kayitli_program(veritabani):
+    """ İki bölümlü (bir ortak dersli) 1. yarıyıl kataloğu; güz dönemi programı oluşturulup kaydedilmiştir. """
+    random.seed(3)
+    veritabani.add_all([dp.Bolum(kod="BM", ad="Bilgisayar"), dp.Bolum(kod="EE", ad="Elektrik")])
+    veritabani.add_all([dp.Kullanicilar(id=i, mevki="ogretim_uyesi", ad=f"Hoca {i}") for i in range(1, 9)])
+    veritabani.add_all([dp.Derslik(kod=kod, kapasite=kapasite, statu="NORMAL")
+                        for kod, kapasite in [("D1", 50), ("D2", 60), ("D3", 100), ("D4", 120)]])
+    dersler = [("BM", "MAT1", "Matematik", 3, 1), ("EE", "MAT1", "Matematik", 3, 1)]
+    dersler += [("BM", f"BM10{i}", f"Bilgisayar {i}", 2, i + 2) for i in range(3)]
+    dersler += [("EE", f"EE10{i}", f"Elektrik {i}", 3, i + 5) for i in range(3)]
+    veritabani.add_all([dp.Ders(bolum_kod=bolum, donem=1, kod=kod, ad=ad, ders_tipi="zorunlu", teorik_saat=saat,
+                                uyg_saat=0, ogretim_uyesi_id=hoca) for bolum, kod, ad, saat, hoca in dersler])
+    veritabani.commit()
+
+    assert dp.Sistem.ders_programi_olustur("G", None)
+    return dp.Program.kayitli_programlari_oku([1])[1]
+
+
+def hucreler(programlar):
+    """ {(bolum, gun, saat): (ders_kodu, ders_adi, derslik)} - yalnızca ders olan saatler. """
+    return {(bolum, gun, saat): ders for bolum, program in programlar.items()
+            for gun, saatler in program.items() for saat, ders in saatler.items() if ders}
+
+
+def test_silinen_ders_disindaki_dersler_yerinde_kalir(veritabani, kayitli_program):
+    once = hucreler(kayitli_program)
+    assert any(ders[0] == "BM101" for ders in once.values())
+
+    veritabani.delete(veritabani.query(dp.Ders).filter_by(kod="BM101").one())
+    veritabani.commit()
+    assert dp.Program.programlari_onar(dp.DONEM_TIPLERI["G"])
+
+    sonra = hucreler(dp.Program.kayitli_programlari_oku([1])[1])
+    assert not any(ders[0] == "BM101" for ders in sonra.values())
+    assert sonra == {hucre: ders for hucre, ders in once.items() if ders[0] != "BM101"}
+
+
+def test_silinen_derslik_yalnizca_onu_kullanan_derslere_yeni_derslik_verir(veritabani, kayitli_program):
+    once = hucreler(kayitli_program)
+    silinen = next(ders[2] for ders in once.values() if ders[2])
+    etkilenen = {hucre for hucre, ders in once.items() if ders[2] == silinen}
+
+    veritabani.delete(veritabani.query(dp.Derslik).filter_by(kod=silinen).one())
+    veritabani.commit()
+    assert dp.Program.programlari_onar(dp.DONEM_TIPLERI["G"])
+
+    sonra = hucreler(dp.Program.kayitli_programlari_oku([1])[1])
+    assert set(sonra) == set(once)  # Hiçbir ders yer değiştirmedi
+    for hucre, ders in once.items():
+        if hucre in etkilenen:
+            assert sonra[hucre][:2] == ders[:2] and sonra[hucre][2] not in (None, silinen)
+        else:
+            assert sonra[hucre] == ders
+
+
+def test_degismeyen_donem_onarilmaz(kayitli_program):
+    assert dp.Program.programlari_onar(dp.DONEM_TIPLERI["G"])
+    assert dp.Program.kayitli_programlari_oku([1])[1] == kayitli_program
+
+
+def test_degisen_donem_degismeyen_sonraki_donemin_ogretim_uyesiyle_cakismaz(veritabani):
+    random.seed(3)
+    veritabani.add(dp.Bolum(kod="BM", ad="Bilgisayar"))
+    veritabani.add(dp.Kullanicilar(id=1, mevki="ogretim_uyesi", ad="Hoca 1"))
+    veritabani.add_all([dp.Ders(bolum_kod="BM", donem=donem, kod=kod, ad=kod, ders_tipi="zorunlu", teorik_saat=1,
+                                uyg_saat=0, ogretim_uyesi_id=hoca)
+                        for donem, kod, hoca in [(1, "BM_Y", None), (3, "BM_X", 1)]])
+    veritabani.commit()
+    # İki ders de pazartesi 9-10'da; BM_Y'nin öğretim üyesi yokken çakışma yok
+    donem_dersleri = dp.Program.donem_derslerini_oku([1, 3])
+    for donem, kod in [(1, "BM_Y"), (3, "BM_X")]:
+        program = dp.Program.bos_program()
+        program[dp.GUNLER[0]][9], program[dp.GUNLER[0]][10] = (kod, kod), ""
+        parmak_izi = dp.Program.donem_parmak_izi(donem_dersleri[donem])
+        assert dp.Program.programlari_kaydet("G", donem, {"BM": program}, parmak_izi)
+
+    veritabani.query(dp.Ders).filter_by(kod="BM_Y").one().ogretim_uyesi_id = 1
+    veritabani.commit()
+    assert dp.Program.programlari_onar(dp.DONEM_TIPLERI["G"])
+
+    kayitli = dp.Program.kayitli_programlari_oku([1, 3])
+    assert hucreler(kayitli[3]) == {("BM", dp.GUNLER[0], 9): ("BM_X", "BM_X")}
+    yeni_yer = [hucre for hucre, ders in hucreler(kayitli[1]).items() if ders[0] == "BM_Y"]
+    assert len(yeni_yer) == 1 and yeni_yer[0] != ("BM", dp.GUNLER[0], 9)
+
+
+def test_kapasitesi_degisen_derslik_onarimda_yeniden_atanir(veritabani, kayitli_program, capsys):
+    once = hucreler(kayitli_program)
+    degisen = next(ders[2] for ders in once.values() if ders[2])
+    etkilenen = {hucre for hucre, ders in once.items() if ders[2] == degisen}
+
+    veritabani.query(dp.Derslik).filter_by(kod=degisen).one().kapasite = 200
+    veritabani.commit()
+    capsys.readouterr()
+    assert dp.Program.programlari_onar(dp.DONEM_TIPLERI["G"])
+    assert "1. Dönem programı onarıldı" in capsys.readouterr().out
+
+    sonra = hucreler(dp.Program.kayitli_programlari_oku([1])[1])
+    assert set(sonra) == set(once)  # Hiçbir ders yer değiştirmedi
+    assert all(sonra[hucre] == ders for hucre, ders in once.items() if hucre not in etkilenen)
+    # Yeni kapasite kaydedildi; ikinci onarım bir şey değiştirmez
+    kayitli_derslik = dp.Program.kayitli_derslikleri_oku([1])[1].get(degisen)
+    assert kayitli_derslik is None or kayitli_derslik.kapasite == 200
+    assert dp.Program.programlari_onar(dp.DONEM_TIPLERI["G"])
+    assert "onarıldı" not in capsys.readouterr().out
+
+
+def test_artimli_modda_statusu_degisen_derslik_donemi_yeniden_olusturur(veritabani, kayitli_program, capsys):
+    degisen = next(ders[2] for ders in hucreler(kayitli_program).values() if ders[2])
+    veritabani.add(dp.Derslik(kod="D5", kapasite=70, statu="NORMAL"))
+    veritabani.commit()
+    capsys.readouterr()
+    # Yalnızca derslik eklemek kayıtlı programı bozmaz
+    assert dp.Sistem.ders_programi_olustur("G", None, artimli=True)
+    assert "1. Dönemin girdileri değişmedi" in capsys.readouterr().out
+
+    veritabani.query(dp.Derslik).filter_by(kod=degisen).one().statu = "LAB"
+    veritabani.commit()
+    assert dp.Sistem.ders_programi_olustur("G", None, artimli=True)
+    assert "1. Dönemin girdileri değişmedi" not in capsys.readouterr().out
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+import ders_programi_olusturma as dp
+
+
+@pytest.fixture
+def yarida_kalan_ice_aktarma(veritabani, tmp_path, monkeypatch):
+    """ 10 kullanıcılı dosyanın 3'erlik parçalarla akışlı içe aktarımı üçüncü parçada kesilmiştir. """
+    dosya = tmp_path / "kullanicilar.txt"
+    dosya.write_text("".join(f"{i} ogretim_uyesi Hoca {i}\n" for i in range(1, 11)), encoding="utf-8")
+    toplu_ekle = dp.toplu_ekle
+    cagrilar = []
+
+    def kesilen_toplu_ekle(tablo, satirlar):
+        cagrilar.append(len(satirlar))
+        if len(cagrilar) == 3:
+            raise RuntimeError("bağlantı koptu")
+        return toplu_ekle(tablo, satirlar)
+
+    monkeypatch.setattr(dp, "toplu_ekle", kesilen_toplu_ekle)
+    assert dp.load_kullanicilar_from_file(str(dosya), akis=True, parca_boyutu=3) is None
+    monkeypatch.setattr(dp, "toplu_ekle", toplu_ekle)
+    assert veritabani.query(dp.Kullanicilar).count() == 6
+    assert os.path.exists(f"{dosya}.konum")
+    return dosya
+
+
+def test_yarida_kalan_ice_aktarma_kaldigi_yerden_devam_eder(veritabani, yarida_kalan_ice_aktarma, monkeypatch):
+    dosya = yarida_kalan_ice_aktarma
+    okunan_satirlar = []
+    dosya_satirlari = dp.dosya_satirlari
+
+    def sayan_dosya_satirlari(filename, baslangic=0):
+        for konum, satir in dosya_satirlari(filename, baslangic):
+            okunan_satirlar.append(satir)
+            yield konum, satir
+
+    monkeypatch.setattr(dp, "dosya_satirlari", sayan_dosya_satirlari)
+    assert dp.load_kullanicilar_from_file(str(dosya), akis=True, parca_boyutu=3) == 4
+    assert len(okunan_satirlar) == 4  # Commit edilen ilk iki parça yeniden okunmadı
+    assert veritabani.query(dp.Kullanicilar).count() == 10
+    assert not os.path.exists(f"{dosya}.konum")
+
+
+def test_degisen_dosyada_kontrol_noktasi_yok_sayilir(veritabani, yarida_kalan_ice_aktarma, capsys):
+    dosya = yarida_kalan_ice_aktarma
+    with open(dosya, "a", encoding="utf-8") as file:
+        file.write("11 ogretim_uyesi Hoca 11\n")
+
+    assert dp.load_kullanicilar_from_file(str(dosya), akis=True, parca_boyutu=3) == 5
+    assert "baştan" in capsys.readouterr().out
+    assert veritabani.query(dp.Kullanicilar).count() == 11
+    assert not os.path.exists(f"{dosya}.konum")